@@ -1,12 +1,29 @@
+import asyncio
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.utils.data_loader import load_articles
+from backend.utils.snapshot import SnapshotManager
+from backend.utils.archive import SnapshotArchive
+from backend.utils.pdf_cache import PdfCache
+from backend.utils.report_jobs import ReportJobQueue
+from backend.utils.etag import ConditionalGetMiddleware
+from backend.utils.compression import CompressedCache, CompressionMiddleware
+from backend.utils.metrics import MetricsMiddleware, MetricsRegistry
 from backend.routers import themes
 from backend.routers import clusters
 from backend.routers import map_data
 from backend.routers import report_data
 from backend.routers import report_pdf
+from backend.routers import admin
+from backend.routers import articles
+from backend.routers import metrics
+from backend.routers import trends
+from backend.routers import search
+from backend.routers import archive
+from backend.routers import dashboard
+from backend.routers import reports
 
 app = FastAPI(
     title="Community Flow Backend",
@@ -14,6 +31,21 @@ app = FastAPI(
     version="0.1.0",
 )
 
+# ETag / If-None-Match / Cache-Control for the snapshot-backed endpoints.
+# Added before CORS so CORS wraps it and also decorates 304s.
+app.add_middleware(
+    ConditionalGetMiddleware,
+    max_age=int(os.environ.get("COMMUNITY_FLOW_CACHE_MAX_AGE", "300")),
+)
+
+# gzip/brotli: snapshot-stable bodies are compressed once per snapshot and
+# served from cache, everything else is compressed on the fly. Sits outside
+# ConditionalGet so cache hits skip it and the route entirely.
+app.state.compressed_cache = CompressedCache(
+    max_bytes=int(os.environ.get("COMMUNITY_FLOW_COMPRESSED_CACHE_MB", "64")) * 1024 * 1024,
+)
+app.add_middleware(CompressionMiddleware, cache=app.state.compressed_cache)
+
 # Allow frontend to call backend (React)
 app.add_middleware(
     CORSMiddleware,
@@ -23,13 +55,69 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency/size/error metrics, served on /metrics. Added last so it
+# is the outermost middleware and times everything the client waits for.
+app.state.metrics = MetricsRegistry()
+app.add_middleware(MetricsMiddleware, registry=app.state.metrics)
+
+
+# Seconds between snapshot file polls; 0 disables the watcher.
+WATCH_INTERVAL_ENV = "COMMUNITY_FLOW_WATCH_SNAPSHOT"
+# Rendered-PDF cache bound (MB) and number of render worker processes.
+PDF_CACHE_MB_ENV = "COMMUNITY_FLOW_PDF_CACHE_MB"
+PDF_WORKERS_ENV = "COMMUNITY_FLOW_PDF_WORKERS"
+# Memory bound (MB) for archived partitions mapped on demand.
+ARCHIVE_CACHE_MB_ENV = "COMMUNITY_FLOW_ARCHIVE_CACHE_MB"
+# Report jobs: hours a finished PDF is kept, and render worker processes.
+REPORT_TTL_HOURS_ENV = "COMMUNITY_FLOW_REPORT_TTL_HOURS"
+REPORT_WORKERS_ENV = "COMMUNITY_FLOW_REPORT_WORKERS"
+
 
 @app.on_event("startup")
 async def startup_event():
     """
-    Load google_topics.json once at startup.
+    Load google_topics.json and build the aggregate index, then arm the
+    reload triggers (SIGHUP, optional file watcher, POST /admin/reload).
     """
-    app.state.articles = load_articles()
+    manager = SnapshotManager(app.state)
+    manager.reload()
+    app.state.snapshot_manager = manager
+
+    manager.install_signal_handler(asyncio.get_running_loop())
+
+    interval = float(os.environ.get(WATCH_INTERVAL_ENV, "0") or 0)
+    if interval > 0:
+        manager.start_watcher(interval)
+
+    app.state.pdf_cache = PdfCache(
+        max_bytes=int(os.environ.get(PDF_CACHE_MB_ENV, "64")) * 1024 * 1024,
+        max_workers=int(os.environ.get(PDF_WORKERS_ENV, "2")),
+    )
+
+    app.state.archive = SnapshotArchive(
+        max_bytes=int(os.environ.get(ARCHIVE_CACHE_MB_ENV, "256")) * 1024 * 1024,
+    )
+
+    app.state.report_jobs = ReportJobQueue(
+        ttl_seconds=float(os.environ.get(REPORT_TTL_HOURS_ENV, "24")) * 3600,
+        max_workers=int(os.environ.get(REPORT_WORKERS_ENV, "2")),
+    )
+    app.state.report_jobs.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    manager = getattr(app.state, "snapshot_manager", None)
+    if manager is not None:
+        manager.stop_watcher()
+
+    pdf_cache = getattr(app.state, "pdf_cache", None)
+    if pdf_cache is not None:
+        pdf_cache.shutdown()
+
+    report_jobs = getattr(app.state, "report_jobs", None)
+    if report_jobs is not None:
+        report_jobs.shutdown()
 
 
 @app.get("/health")
@@ -43,6 +131,14 @@ app.include_router(clusters.router)
 app.include_router(map_data.router)
 app.include_router(report_data.router)
 app.include_router(report_pdf.router)
+app.include_router(admin.router)
+app.include_router(articles.router)
+app.include_router(metrics.router)
+app.include_router(trends.router)
+app.include_router(search.router)
+app.include_router(archive.router)
+app.include_router(dashboard.router)
+app.include_router(reports.router)
 
 @app.get("/")
 def root():
@@ -0,0 +1,55 @@
+# backend/routers/admin.py
+
+import os
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+router = APIRouter(tags=["admin"])
+
+# If set, POST /admin/reload requires a matching X-Admin-Token header.
+ADMIN_TOKEN_ENV = "COMMUNITY_FLOW_ADMIN_TOKEN"
+
+
+def _get_manager(request: Request):
+    manager = getattr(request.app.state, "snapshot_manager", None)
+    if manager is None:
+        raise HTTPException(status_code=500, detail="Snapshot manager not initialized.")
+    return manager
+
+
+@router.get("/snapshot")
+async def get_snapshot_info(request: Request) -> Dict[str, Any]:
+    """
+    Returns the version and load time of the snapshot currently being served.
+    """
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot.info()
+
+
+@router.post("/admin/reload")
+async def reload_snapshot(
+    request: Request,
+    force: bool = False,
+    x_admin_token: Optional[str] = Header(None),
+) -> Dict[str, Any]:
+    """
+    Reloads google_topics.json in a worker thread and swaps it in atomically.
+
+    Query params:
+      - force: reload even if the file's mtime/size are unchanged
+    """
+    expected = os.environ.get(ADMIN_TOKEN_ENV)
+    if expected and x_admin_token != expected:
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+
+    manager = _get_manager(request)
+    try:
+        reloaded = await run_in_threadpool(manager.reload, force)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=f"Snapshot reload failed: {e}")
+
+    return {"reloaded": reloaded, "snapshot": manager.current.info()}
@@ -0,0 +1,68 @@
+# backend/routers/archive.py
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from backend.schemas import ArchivePage
+from backend.utils.archive import SnapshotArchive
+from backend.utils.date_utils import to_epoch
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.pagination import article_list_item
+
+router = APIRouter(tags=["archive"])
+
+
+def _get_archive(request: Request) -> SnapshotArchive:
+    archive = getattr(request.app.state, "archive", None)
+    if archive is None:
+        raise HTTPException(status_code=500, detail="Archive not initialized.")
+    return archive
+
+
+@router.get("/archive")
+def get_archive_info(request: Request) -> Dict[str, Any]:
+    """
+    Partitions, sources and week range held in the archive, plus cache stats.
+    """
+    try:
+        return _get_archive(request).info()
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/archive/articles", response_model=ArchivePage)
+def list_archived_articles(
+    request: Request,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    source: List[str] = Query([]),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> FastJSONResponse:
+    """
+    Archived articles dated in [since, until), newest first.
+
+    Only the partitions the page spans are mapped (and kept in an LRU),
+    newest first, so old history is read on demand. Runs in the threadpool since
+    a cold partition means file I/O.
+
+    Query params:
+      - since / until: ISO date or datetime (naive values are UTC)
+      - source: restrict to these sources (repeatable)
+      - limit / offset: page of articles
+    """
+    archive = _get_archive(request)
+    try:
+        total, partitions, page = archive.articles(
+            to_epoch(since), to_epoch(until), source, offset=offset, limit=limit
+        )
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=f"Archive read failed: {e}")
+
+    return FastJSONResponse({
+        "total": total,
+        "partitions": partitions,
+        "articles": [article_list_item(a) for a in page],
+    })
@@ -0,0 +1,162 @@
+# backend/routers/articles.py
+
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from backend.schemas import ArticlePage, ArticleQueryResponse
+from backend.utils.article_index import normalize_neighborhood
+from backend.utils.date_utils import to_epoch
+from backend.utils.facets import popcount
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.pagination import (
+    NDJSON_MEDIA_TYPE,
+    CursorError,
+    CursorParamsError,
+    article_list_item,
+    decode_cursor,
+    iter_ndjson,
+    paginate,
+    window_key,
+)
+
+router = APIRouter(tags=["articles"])
+
+
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot
+
+
+def _wants_ndjson(request: Request, format: Optional[str]) -> bool:
+    if format is not None:
+        return format == "ndjson"
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _listing(request: Request, group: str, rows, version: str, window: str, cursor, limit, format):
+    try:
+        if _wants_ndjson(request, format):
+            offset = decode_cursor(cursor, version, window)
+            return StreamingResponse(iter_ndjson(rows, offset), media_type=NDJSON_MEDIA_TYPE)
+        page = paginate(rows, version, cursor, limit, window)
+    except CursorParamsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except CursorError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    return FastJSONResponse({"group": group, **page})
+
+
+@router.get("/clusters/{topic_id}/articles", response_model=ArticlePage)
+async def list_cluster_articles(
+    request: Request,
+    topic_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    format: Optional[Literal["json", "ndjson"]] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    Articles in one topic cluster, in snapshot order.
+
+    Query params:
+      - cursor: next_cursor from the previous page (omit for the first page)
+      - limit: page size
+      - format: "ndjson" (or Accept: application/x-ndjson) streams every
+        remaining article as newline-delimited JSON instead of one page
+      - since / until: ISO date or datetime; only articles dated in [since, until).
+        A cursor only continues the window it was issued for (400 otherwise).
+    """
+    snapshot = _get_snapshot(request)
+    since_epoch, until_epoch = to_epoch(since), to_epoch(until)
+    rows = snapshot.index.topic_articles(str(topic_id), since_epoch, until_epoch)
+    window = window_key(since_epoch, until_epoch)
+    return _listing(request, str(topic_id), rows, snapshot.version, window, cursor, limit, format)
+
+
+@router.get("/map-data/{neighborhood}/articles", response_model=ArticlePage)
+async def list_neighborhood_articles(
+    request: Request,
+    neighborhood: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    format: Optional[Literal["json", "ndjson"]] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    Articles in one neighborhood, in snapshot order. Same params as
+    /clusters/{topic_id}/articles.
+    """
+    snapshot = _get_snapshot(request)
+    since_epoch, until_epoch = to_epoch(since), to_epoch(until)
+    key = normalize_neighborhood(neighborhood)
+    rows = snapshot.index.neighborhood_articles(key, since_epoch, until_epoch)
+    window = window_key(since_epoch, until_epoch)
+    return _listing(request, key, rows, snapshot.version, window, cursor, limit, format)
+
+
+@router.get("/articles", response_model=ArticleQueryResponse)
+async def query_articles(
+    request: Request,
+    theme: List[int] = Query([]),
+    topic_id: List[int] = Query([]),
+    source: List[str] = Query([]),
+    neighborhood: List[str] = Query([]),
+    week: List[str] = Query([], description="ISO week, e.g. 2025-W48"),
+    weeks: Optional[int] = Query(None, ge=1, le=520),
+    sort: Literal["date_desc", "date_asc", "snapshot"] = "date_desc",
+    limit: int = Query(20, ge=0, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """
+    Articles matching any combination of filters, plus facet counts.
+
+    Query params (each filter may be repeated; values of one filter are
+    OR-ed, different filters are AND-ed):
+      - theme, topic_id, source, neighborhood
+      - week: ISO week label; weeks: only the N most recent weeks with data
+      - sort: date_desc / date_asc / snapshot order
+      - limit / offset: page of articles
+
+    facets gives, for every dimension, the count per value with all the
+    *other* filters applied, which is what a cross-filtering UI needs.
+    """
+    snapshot = _get_snapshot(request)
+    facets = snapshot.facets
+
+    week_values = list(week)
+    if weeks is not None:
+        recent = facets.recent_weeks(weeks)
+        week_values = [w for w in week_values if w in recent] if week_values else recent
+        if not week_values:
+            week_values = [""]  # no week qualifies; matches nothing
+
+    filters = {
+        "theme": [str(t) for t in theme],
+        "topic": [str(t) for t in topic_id],
+        "source": [s.strip() for s in source],
+        "neighborhood": [normalize_neighborhood(n) for n in neighborhood],
+        "week": week_values,
+    }
+
+    def build() -> Dict[str, Any]:
+        matched, counts = facets.query(filters)
+        rows = facets.page(matched, sort, offset, limit)
+        return {
+            "total": popcount(matched),
+            "articles": [article_list_item(snapshot.articles[row]) for row in rows],
+            "facets": {
+                dim: [{"value": value, "count": n} for value, n in values]
+                for dim, values in counts.items()
+            },
+        }
+
+    if not any(filters.values()) and sort == "date_desc" and limit == 20 and offset == 0:
+        return FastJSONResponse(snapshot.cached_response("articles", build))
+    return FastJSONResponse(build())
@@ -1,27 +1,27 @@
 # backend/routers/clusters.py
 
-from collections import Counter, defaultdict
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 from fastapi import APIRouter, HTTPException, Request
 
 from backend.schemas import (
     ClustersResponse,
-    ClusterSummary,
-    ThemeCount,
-    KeywordCount,
-    ClusterArticle,
     SingleClusterResponse,
 )
+from backend.utils.article_index import ArticleIndex, GroupStats
+from backend.utils.date_utils import to_epoch
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.pagination import article_summary
 
 router = APIRouter(tags=["clusters"])
 
 
-def _get_articles(request: Request) -> List[Dict[str, Any]]:
-    articles = getattr(request.app.state, "articles", None)
-    if articles is None:
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
         raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
-    return articles
+    return snapshot
 
 
 @router.get("/clusters", response_model=Union[ClustersResponse, SingleClusterResponse])
@@ -30,7 +30,9 @@ async def get_clusters(
     topic_id: Optional[int] = None,
     include_articles: bool = False,
     limit_articles: int = 20,
-) -> Union[ClustersResponse, SingleClusterResponse]:
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> FastJSONResponse:
     """
     Returns clusters grouped by topic_id.
 
@@ -38,93 +40,87 @@ async def get_clusters(
       - topic_id: if provided, returns ONLY that cluster
       - include_articles: if true, includes sample articles per cluster
       - limit_articles: max articles returned per cluster when include_articles=true
+      - since / until: ISO date or datetime; only count articles dated in
+        [since, until) (naive values are UTC)
+
+    The payload is built from plain dicts in the shape of the response
+    models and serialized directly (see utils/fast_json.py).
     """
-    articles = _get_articles(request)
+    snapshot = _get_snapshot(request)
 
-    clusters: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for a in articles:
-        tid = a.get("topic_id")
-        if tid is None:
-            continue
-        clusters[str(tid)].append(a)
+    parameterless = (
+        topic_id is None and not include_articles and limit_articles == 20
+        and since is None and until is None
+    )
+    if parameterless:
+        return FastJSONResponse(
+            snapshot.cached_response("clusters", lambda: _build_clusters(snapshot.index, False, 20))
+        )
+
+    index = snapshot.index.window(to_epoch(since), to_epoch(until))
 
     # ---- Return a single cluster if topic_id is provided ----
     if topic_id is not None:
         key = str(topic_id)
-        if key not in clusters:
+        stats = index.topic(key)
+        if stats is None:
             # consistent empty response for missing topic
-            return SingleClusterResponse(
-                topic_id=topic_id,
-                count=0,
-                top_keywords=[],
-                theme_distribution=[],
-                articles=[] if include_articles else None,
+            return FastJSONResponse({
+                "topic_id": topic_id,
+                "count": 0,
+                "top_keywords": [],
+                "theme_distribution": [],
+                "articles": [] if include_articles else None,
+            })
+
+        return FastJSONResponse(
+            _build_cluster_response(
+                topic_key=key,
+                stats=stats,
+                cluster_articles=index.topic_articles(key),
+                include_articles=include_articles,
+                limit_articles=limit_articles,
             )
-
-        return _build_cluster_response(
-            topic_key=key,
-            cluster_articles=clusters[key],
-            include_articles=include_articles,
-            limit_articles=limit_articles,
-            single=True,
         )
 
     # ---- Otherwise return all clusters ----
-    out: List[ClusterSummary] = []
-    for key in sorted(clusters.keys(), key=lambda x: int(x)):
+    return FastJSONResponse(_build_clusters(index, include_articles, limit_articles))
+
+
+def _build_clusters(index: ArticleIndex, include_articles: bool, limit_articles: int) -> Dict[str, Any]:
+    out: List[Dict[str, Any]] = []
+    for key in index.topic_keys:
         out.append(
             _build_cluster_response(
                 topic_key=key,
-                cluster_articles=clusters[key],
+                stats=index.topic_stats[key],
+                cluster_articles=index.topic_articles(key),
                 include_articles=include_articles,
                 limit_articles=limit_articles,
-                single=False,
             )
         )
 
-    return ClustersResponse(total_clusters=len(out), clusters=out)
+    return {"total_clusters": len(out), "clusters": out}
 
 
 def _build_cluster_response(
     topic_key: str,
-    cluster_articles: List[Dict[str, Any]],
+    stats: GroupStats,
+    cluster_articles: Sequence[Mapping[str, Any]],
     include_articles: bool,
     limit_articles: int,
-    single: bool,
-) -> Union[ClusterSummary, SingleClusterResponse]:
-    keyword_counter = Counter()
-    theme_counter = Counter()
-
-    for a in cluster_articles:
-        for k in a.get("keywords") or []:
-            keyword_counter[str(k).lower()] += 1
-        for t in a.get("themes") or []:
-            theme_counter[str(t)] += 1
-
+) -> Dict[str, Any]:
+    """
+    One ClusterSummary / SingleClusterResponse as a plain dict.
+    """
     articles_out = None
     if include_articles:
-        articles_out = []
-        for a in cluster_articles[: max(0, limit_articles)]:
-            articles_out.append(
-                ClusterArticle(
-                    title=a.get("title"),
-                    date=a.get("date"),
-                    link=a.get("link"),
-                    source=a.get("source"),
-                    neighborhood=a.get("neighborhood"),
-                    themes=a.get("themes") or [],
-                    keywords=a.get("keywords") or [],
-                )
-            )
-
-    common_kwargs = dict(
-        topic_id=int(topic_key),
-        count=len(cluster_articles),
-        top_keywords=[KeywordCount(keyword=k, count=c) for k, c in keyword_counter.most_common(10)],
-        theme_distribution=[ThemeCount(id=tid, count=c) for tid, c in theme_counter.most_common()],
-        articles=articles_out,
-    )
-
-    if single:
-        return SingleClusterResponse(**common_kwargs)
-    return ClusterSummary(**common_kwargs)
+        articles_out = [article_summary(a) for a in cluster_articles[: max(0, limit_articles)]]
+
+    return {
+        "topic_id": int(topic_key),
+        "count": stats.count,
+        "top_keywords": [{"keyword": k, "count": c} for k, c in stats.top_keywords],
+        "theme_distribution": [{"id": tid, "count": c} for tid, c in stats.theme_distribution],
+        "articles": articles_out,
+    }
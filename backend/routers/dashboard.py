@@ -0,0 +1,178 @@
+# backend/routers/dashboard.py
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import APIRouter, HTTPException, Request
+
+from backend.routers.clusters import _build_cluster_response, _build_clusters
+from backend.routers.map_data import _build_neighborhood_block, _build_neighborhoods
+from backend.routers.themes import _build_themes
+from backend.schemas import DashboardQuery, DashboardRequest, DashboardResponse
+from backend.utils.article_index import ArticleIndex, normalize_neighborhood
+from backend.utils.date_utils import to_epoch
+from backend.utils.fast_json import FastJSONResponse, dumps
+from backend.utils.report_builder import build_report_data
+
+router = APIRouter(tags=["dashboard"])
+
+MAX_QUERIES = 20
+
+# What HomePage.js shows: theme totals, the five latest items, all clusters.
+DEFAULT_QUERIES = (
+    DashboardQuery(kind="themes"),
+    DashboardQuery(kind="report-data", limit=5),
+    DashboardQuery(kind="clusters"),
+)
+
+
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot
+
+
+def _is_default(query: DashboardQuery) -> bool:
+    """
+    True if `query` has its kind's default params.
+
+    Only such queries are cached, under the key the kind's own route uses
+    ("themes", "clusters", ...), so both share one serialized body and
+    clients cannot add cache entries.
+    """
+    defaults = DashboardQuery(kind=query.kind, id=query.id)
+    return query == defaults
+
+
+def _build(
+    query: DashboardQuery,
+    snapshot: Any,
+    index: ArticleIndex,
+    since: Optional[int],
+    until: Optional[int],
+) -> Dict[str, Any]:
+    """
+    Same payload as the query's own endpoint, over `index`.
+    """
+    if query.kind == "themes":
+        return _build_themes(index)
+
+    if query.kind == "clusters":
+        if query.topic_id is None:
+            return _build_clusters(index, query.include_articles, query.limit_articles)
+        key = str(query.topic_id)
+        stats = index.topic(key)
+        if stats is None:
+            return {
+                "topic_id": query.topic_id,
+                "count": 0,
+                "top_keywords": [],
+                "theme_distribution": [],
+                "articles": [] if query.include_articles else None,
+            }
+        return _build_cluster_response(
+            topic_key=key,
+            stats=stats,
+            cluster_articles=index.topic_articles(key),
+            include_articles=query.include_articles,
+            limit_articles=query.limit_articles,
+        )
+
+    if query.kind == "map-data":
+        if query.neighborhood is None:
+            return _build_neighborhoods(index)
+        key = normalize_neighborhood(query.neighborhood)
+        return _build_neighborhood_block(key, index.neighborhood(key))
+
+    # report-data works from the full snapshot's date index
+    return build_report_data(
+        limit=query.limit,
+        sort=query.sort,
+        articles=snapshot.articles,
+        since=since,
+        until=until,
+        index=snapshot.index,
+    )
+
+
+def _run_queries(
+    snapshot: Any,
+    queries: Sequence[DashboardQuery],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> bytes:
+    """
+    {"snapshot_version": ..., "results": {id: payload}} as JSON bytes.
+
+    Without since/until, default-param queries come from (or go into) the
+    snapshot's serialized-response cache; others are built each time. With
+    since/until, the windowed index is built once and shared by all
+    queries. Results are spliced in as already-serialized JSON, never
+    decoded and re-encoded.
+    """
+    ids = [q.id or q.kind for q in queries]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Query ids must be unique; set `id` on repeated kinds.")
+
+    since_epoch, until_epoch = to_epoch(since), to_epoch(until)
+    windowed = since_epoch is not None or until_epoch is not None
+
+    window: Optional[ArticleIndex] = None
+    bodies: List[Tuple[str, bytes]] = []
+    for result_id, query in zip(ids, queries):
+        if not windowed and _is_default(query):
+            build: Callable[[], Any] = lambda q=query: _build(q, snapshot, snapshot.index, None, None)
+            body = snapshot.cached_response(query.kind, build)
+        elif not windowed:
+            body = dumps(_build(query, snapshot, snapshot.index, None, None))
+        else:
+            if window is None:
+                window = snapshot.index.window(since_epoch, until_epoch)
+            body = dumps(_build(query, snapshot, window, since_epoch, until_epoch))
+        bodies.append((result_id, body))
+
+    results = b",".join(dumps(result_id) + b":" + body for result_id, body in bodies)
+    return b'{"snapshot_version":' + dumps(snapshot.version) + b',"results":{' + results + b"}}"
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+def get_dashboard(
+    request: Request,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> FastJSONResponse:
+    """
+    Everything the home page needs in one response: themes, the five
+    latest report items and clusters (results keyed "themes",
+    "report-data", "clusters").
+
+    Query params:
+      - since / until: ISO date or datetime; restrict every result to
+        articles dated in [since, until) (naive values are UTC)
+    """
+    snapshot = _get_snapshot(request)
+    if since is None and until is None:
+        return FastJSONResponse(
+            snapshot.cached_response("dashboard", lambda: _run_queries(snapshot, DEFAULT_QUERIES, None, None))
+        )
+    return FastJSONResponse(_run_queries(snapshot, DEFAULT_QUERIES, since, until))
+
+
+@router.post("/dashboard", response_model=DashboardResponse)
+def post_dashboard(request: Request, body: DashboardRequest) -> FastJSONResponse:
+    """
+    Run several aggregate queries in one request.
+
+    Each query names an endpoint (`kind`: themes, clusters, map-data,
+    report-data) with that endpoint's params; results are keyed by `id`
+    (default: the kind) and match what the endpoint itself returns.
+    since / until apply to every query.
+    """
+    if not body.queries:
+        raise HTTPException(status_code=400, detail="At least one query is required.")
+    if len(body.queries) > MAX_QUERIES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_QUERIES} queries per request.")
+
+    snapshot = _get_snapshot(request)
+    return FastJSONResponse(_run_queries(snapshot, body.queries, body.since, body.until))
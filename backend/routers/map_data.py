@@ -1,67 +1,81 @@
 # backend/routers/map_data.py
 
-from collections import Counter, defaultdict
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Request
 
+from backend.utils.article_index import ArticleIndex, GroupStats, normalize_neighborhood
+from backend.utils.date_utils import to_epoch
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.map_geojson import GEOJSON_MEDIA_TYPE, GEOJSON_RESPONSE_KEY, build_feature_collection
+
 router = APIRouter(tags=["map-data"])
 
 
-def _get_articles(request: Request) -> List[Dict[str, Any]]:
-    articles = getattr(request.app.state, "articles", None)
-    if articles is None:
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
         raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
-    return articles
+    return snapshot
 
 
 @router.get("/map-data")
 async def get_map_data(
     request: Request,
     neighborhood: Optional[str] = None,
-) -> Dict[str, Any]:
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    format: Literal["json", "geojson"] = "json",
+) -> FastJSONResponse:
     """
     Aggregates articles by neighborhood and returns theme counts per neighborhood.
 
     Query params:
       - neighborhood: if provided, returns only that neighborhood's stats
+      - since / until: ISO date or datetime; only count articles dated in
+        [since, until) (naive values are UTC)
+      - format: "geojson" for a FeatureCollection with one point per
+        community area (see utils/map_geojson.py); the unfiltered one is
+        prebuilt with the snapshot
     """
-    articles = _get_articles(request)
+    snapshot = _get_snapshot(request)
+
+    if format == "geojson":
+        if neighborhood is None and since is None and until is None:
+            return FastJSONResponse(
+                snapshot.cached_response(GEOJSON_RESPONSE_KEY, lambda: build_feature_collection(snapshot.index)),
+                media_type=GEOJSON_MEDIA_TYPE,
+            )
+        index = snapshot.index.window(to_epoch(since), to_epoch(until))
+        return FastJSONResponse(build_feature_collection(index, neighborhood), media_type=GEOJSON_MEDIA_TYPE)
 
-    # Normalize neighborhood names
-    def norm(n: Any) -> str:
-        if not n:
-            return "Unknown"
-        return str(n).strip()
+    if neighborhood is None and since is None and until is None:
+        return FastJSONResponse(
+            snapshot.cached_response("map-data", lambda: _build_neighborhoods(snapshot.index))
+        )
 
-    by_neighborhood: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for a in articles:
-        by_neighborhood[norm(a.get("neighborhood"))].append(a)
+    index = snapshot.index.window(to_epoch(since), to_epoch(until))
 
     if neighborhood is not None:
-        key = norm(neighborhood)
-        return _build_neighborhood_block(key, by_neighborhood.get(key, []))
+        key = normalize_neighborhood(neighborhood)
+        return FastJSONResponse(_build_neighborhood_block(key, index.neighborhood(key)))
 
-    out = []
-    for key in sorted(by_neighborhood.keys()):
-        out.append(_build_neighborhood_block(key, by_neighborhood[key]))
+    return FastJSONResponse(_build_neighborhoods(index))
 
-    return {"total_neighborhoods": len(out), "neighborhoods": out}
 
+def _build_neighborhoods(index: ArticleIndex) -> Dict[str, Any]:
+    out = []
+    for key in index.neighborhood_keys:
+        out.append(_build_neighborhood_block(key, index.neighborhood(key)))
 
-def _build_neighborhood_block(name: str, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
-    theme_counter = Counter()
-    keyword_counter = Counter()
+    return {"total_neighborhoods": len(out), "neighborhoods": out}
 
-    for a in articles:
-        for t in a.get("themes") or []:
-            theme_counter[str(t)] += 1
-        for k in a.get("keywords") or []:
-            keyword_counter[str(k).lower()] += 1
 
+def _build_neighborhood_block(name: str, stats: GroupStats) -> Dict[str, Any]:
     return {
         "neighborhood": name,
-        "article_count": len(articles),
-        "theme_distribution": [{"id": tid, "count": c} for tid, c in theme_counter.most_common()],
-        "top_keywords": [{"keyword": k, "count": c} for k, c in keyword_counter.most_common(10)],
+        "article_count": stats.count,
+        "theme_distribution": [{"id": tid, "count": c} for tid, c in stats.theme_distribution],
+        "top_keywords": [{"keyword": k, "count": c} for k, c in stats.top_keywords],
     }
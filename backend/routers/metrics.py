@@ -0,0 +1,19 @@
+# backend/routers/metrics.py
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+
+from backend.utils.metrics import CONTENT_TYPE, render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request) -> Response:
+    """
+    Prometheus text exposition of request, snapshot and process metrics.
+    """
+    registry = getattr(request.app.state, "metrics", None)
+    if registry is None:
+        raise HTTPException(status_code=500, detail="Metrics not initialized.")
+    return Response(content=render_metrics(registry, request.app.state), media_type=CONTENT_TYPE)
@@ -1,6 +1,7 @@
 # backend/routers/report_data.py
 
 from collections import Counter
+from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Request, Query
@@ -12,16 +13,17 @@ from backend.schemas import (
     ReportClusterCount,
     ReportItemCompact,
 )
-from backend.utils.date_utils import parse_rss_date
+from backend.utils.date_utils import parse_rss_date, to_epoch
+from backend.utils.fast_json import FastJSONResponse
 
 router = APIRouter(tags=["report-data"])
 
 
-def _get_articles(request: Request) -> List[Dict[str, Any]]:
-    articles = getattr(request.app.state, "articles", None)
-    if articles is None:
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
         raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
-    return articles
+    return snapshot
 
 
 # @router.get("/report-data", response_model=ReportDataResponse)
@@ -86,7 +88,33 @@ def _get_articles(request: Request) -> List[Dict[str, Any]]:
 
 @router.get("/report-data")
 def get_report_data(
+    request: Request,
     limit: int = Query(10, ge=1, le=100),
-    sort: str = Query("date_desc")
-):
-    return build_report_data(limit=limit, sort=sort)
\ No newline at end of file
+    sort: str = Query("date_desc"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> FastJSONResponse:
+    """
+    Query params:
+      - limit: number of latest items to return
+      - sort: "date_desc" (newest first), "date_asc" (oldest first) or
+        anything else to keep file order
+      - since / until: ISO date or datetime; restricts the whole report to
+        articles dated in [since, until) (naive values are UTC)
+    """
+    snapshot = _get_snapshot(request)
+
+    def build():
+        return build_report_data(
+            limit=limit,
+            sort=sort,
+            articles=snapshot.articles,
+            since=to_epoch(since),
+            until=to_epoch(until),
+            index=snapshot.index,
+        )
+
+    # The dashboard's default request is served from bytes cached per snapshot.
+    if limit == 10 and sort == "date_desc" and since is None and until is None:
+        return FastJSONResponse(snapshot.cached_response("report-data", build))
+    return FastJSONResponse(build())
@@ -1,20 +1,46 @@
-from fastapi import APIRouter
-from fastapi.responses import StreamingResponse
-import io
+from datetime import date
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
 from backend.utils.report_builder import build_report_data
-from backend.utils.pdf_service import generate_weekly_report_pdf
+from backend.utils.pdf_cache import PdfCache
 
 router = APIRouter()
 
 
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot
+
+
+def _get_pdf_cache(request: Request) -> PdfCache:
+    pdf_cache = getattr(request.app.state, "pdf_cache", None)
+    if pdf_cache is None:
+        raise HTTPException(status_code=500, detail="PDF cache not initialized.")
+    return pdf_cache
+
+
 @router.get("/report-pdf")
-def download_weekly_report_pdf():
-    report_data = build_report_data(limit=10, sort="date_desc")
-    pdf_bytes = generate_weekly_report_pdf(report_data)
+async def download_weekly_report_pdf(request: Request):
+    snapshot = _get_snapshot(request)
+    pdf_cache = _get_pdf_cache(request)
+
+    limit, sort = 10, "date_desc"
+    # The PDF prints its generation date, so it is part of the cache key.
+    key = (snapshot.version, limit, sort, date.today().isoformat())
+
+    pdf_bytes = await pdf_cache.get_or_render(
+        key,
+        lambda: build_report_data(
+            limit=limit, sort=sort, articles=snapshot.articles, index=snapshot.index
+        ),
+    )
 
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+    return Response(
+        content=pdf_bytes,
         media_type="application/pdf",
         headers={
             "Content-Disposition": "attachment; filename=community_flow_weekly_report.pdf"
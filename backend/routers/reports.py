@@ -0,0 +1,110 @@
+# backend/routers/reports.py
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from backend.schemas import ReportJobRequest, ReportJobStatus
+from backend.utils.article_index import normalize_neighborhood
+from backend.utils.date_utils import to_epoch
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.report_builder import build_report_data
+from backend.utils.report_jobs import DONE, QueueFull, ReportJob, ReportJobQueue
+
+router = APIRouter(tags=["reports"])
+
+
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot
+
+
+def _get_report_jobs(request: Request) -> ReportJobQueue:
+    jobs = getattr(request.app.state, "report_jobs", None)
+    if jobs is None:
+        raise HTTPException(status_code=500, detail="Report job queue not initialized.")
+    return jobs
+
+
+def _job_status(job: ReportJob) -> Dict[str, Any]:
+    # FastJSONResponse skips response_model filtering, so keep the on-disk
+    # record's internal fields out of the ReportJobStatus payload here.
+    out = job.to_json()
+    out.pop("owner", None)
+    out["status_url"] = f"/reports/{job.id}"
+    out["download_url"] = f"/reports/{job.id}/pdf" if job.status == DONE else None
+    return out
+
+
+@router.post("/reports", response_model=ReportJobStatus, status_code=202)
+async def submit_report(request: Request, body: ReportJobRequest) -> FastJSONResponse:
+    """
+    Queue a PDF report for one neighborhood, theme and/or date range.
+
+    Returns the job (202); poll its status_url until status is "done", then
+    fetch download_url. Submitting the same parameters again returns the
+    same job.
+    """
+    snapshot = _get_snapshot(request)
+    jobs = _get_report_jobs(request)
+
+    params = {
+        "neighborhood": normalize_neighborhood(body.neighborhood) if body.neighborhood is not None else None,
+        "theme": body.theme,
+        "since": body.since.isoformat() if body.since is not None else None,
+        "until": body.until.isoformat() if body.until is not None else None,
+        "limit": body.limit,
+        "sort": body.sort,
+    }
+    filters = {k: params[k] for k in ("neighborhood", "theme", "since", "until") if params[k] is not None}
+
+    def build() -> Dict[str, Any]:
+        data = build_report_data(
+            limit=body.limit,
+            sort=body.sort,
+            articles=snapshot.articles,
+            since=to_epoch(body.since),
+            until=to_epoch(body.until),
+            index=snapshot.index,
+            neighborhood=params["neighborhood"],
+            theme=body.theme,
+        )
+        data["filters"] = filters
+        data["items_shown"] = body.limit
+        return data
+
+    try:
+        job = jobs.submit(params, snapshot.version, build)
+    except QueueFull as e:
+        raise HTTPException(status_code=503, detail=f"Report queue is full, retry later ({e}).")
+    return FastJSONResponse(_job_status(job), status_code=202)
+
+
+@router.get("/reports/{job_id}", response_model=ReportJobStatus)
+async def get_report_status(request: Request, job_id: str) -> FastJSONResponse:
+    job = _get_report_jobs(request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired report job.")
+    return FastJSONResponse(_job_status(job))
+
+
+@router.get("/reports/{job_id}/pdf")
+async def download_report(request: Request, job_id: str) -> FileResponse:
+    jobs = _get_report_jobs(request)
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired report job.")
+    if job.status != DONE:
+        raise HTTPException(status_code=409, detail=f"Report is {job.status}, not ready for download.")
+
+    path = jobs.pdf_path(job.id)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Report file expired.")
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"community_flow_report_{job.id[:8]}.pdf",
+    )
@@ -0,0 +1,79 @@
+# backend/routers/search.py
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from backend.schemas import SearchResponse
+from backend.utils.article_index import ArticleIndex, normalize_neighborhood
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.pagination import article_list_item
+
+router = APIRouter(tags=["search"])
+
+
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_articles(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    theme: Optional[int] = None,
+    topic_id: Optional[int] = None,
+    neighborhood: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+) -> FastJSONResponse:
+    """
+    Full-text search over title, clean_text and keywords, ranked by BM25.
+
+    Query params:
+      - q: search terms (any term may match; more and rarer matches rank higher)
+      - theme / topic_id / neighborhood: only articles in that group
+      - limit / offset: page of results
+    """
+    snapshot = _get_snapshot(request)
+
+    rows = _filter_rows(snapshot.index, theme, topic_id, neighborhood)
+    total, hits = snapshot.search.search(q, offset + limit, rows)
+
+    return FastJSONResponse({
+        "query": q,
+        "total": total,
+        "results": [_build_hit(snapshot.articles[row], score) for row, score in hits[offset:]],
+    })
+
+
+def _build_hit(a: Mapping[str, Any], score: float) -> Dict[str, Any]:
+    return {**article_list_item(a), "score": round(score, 4)}
+
+
+def _filter_rows(
+    index: ArticleIndex,
+    theme: Optional[int],
+    topic_id: Optional[int],
+    neighborhood: Optional[str],
+) -> Optional[List[int]]:
+    """
+    Rows matching every given filter, or None when there are no filters.
+    """
+    groups = []
+    if theme is not None:
+        groups.append(index.theme_rows.get(str(theme), ()))
+    if topic_id is not None:
+        groups.append(index.topic_rows.get(str(topic_id), ()))
+    if neighborhood is not None:
+        groups.append(index.neighborhood_rows.get(normalize_neighborhood(neighborhood), ()))
+    if not groups:
+        return None
+
+    groups.sort(key=len)
+    rows = set(groups[0])
+    for group in groups[1:]:
+        rows.intersection_update(group)
+    return sorted(rows)
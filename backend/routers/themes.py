@@ -1,36 +1,33 @@
 # backend/routers/themes.py
 
+from typing import Any, Dict
+
 from fastapi import APIRouter, Request, HTTPException
-from collections import Counter
-from typing import Any, Dict, List
 
-from backend.schemas import ThemesResponse, ThemeCount
+from backend.schemas import ThemesResponse
+from backend.utils.article_index import ArticleIndex
+from backend.utils.fast_json import FastJSONResponse
 
 router = APIRouter(tags=["themes"])
 
 
-def _get_articles(request: Request) -> List[Dict[str, Any]]:
-    articles = getattr(request.app.state, "articles", None)
-    if articles is None:
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
         raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
-    return articles
+    return snapshot
 
 
 @router.get("/themes", response_model=ThemesResponse)
-async def get_themes(request: Request) -> ThemesResponse:
-    articles = _get_articles(request)
-
-    theme_counts = Counter()
-
-    for article in articles:
-        themes = article.get("themes") or []
-        if isinstance(themes, list):
-            for t in themes:
-                theme_counts[str(t)] += 1
-        else:
-            theme_counts[str(themes)] += 1
-
-    return ThemesResponse(
-        total_articles=len(articles),
-        themes=[ThemeCount(id=tid, count=theme_counts[tid]) for tid in sorted(theme_counts.keys())],
-    )
+async def get_themes(request: Request) -> FastJSONResponse:
+    snapshot = _get_snapshot(request)
+
+    # Serialized once per snapshot; see utils/fast_json.py.
+    return FastJSONResponse(snapshot.cached_response("themes", lambda: _build_themes(snapshot.index)))
+
+
+def _build_themes(index: ArticleIndex) -> Dict[str, Any]:
+    return {
+        "total_articles": index.total_articles,
+        "themes": [{"id": tid, "count": c} for tid, c in index.theme_counts],
+    }
@@ -0,0 +1,92 @@
+# backend/routers/trends.py
+
+from datetime import date
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from backend.schemas import TrendsResponse
+from backend.utils.article_index import normalize_neighborhood
+from backend.utils.fast_json import FastJSONResponse
+from backend.utils.rollups import WeeklyRollups, week_of, week_range
+
+router = APIRouter(tags=["trends"])
+
+
+def _get_snapshot(request: Request):
+    snapshot = getattr(request.app.state, "snapshot", None)
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Articles not loaded at startup.")
+    return snapshot
+
+
+@router.get("/trends", response_model=TrendsResponse)
+async def get_trends(
+    request: Request,
+    kind: Literal["theme", "topic", "neighborhood"] = "theme",
+    key: Optional[str] = None,
+    weeks: int = Query(8, ge=1, le=520),
+    end: Optional[date] = None,
+) -> FastJSONResponse:
+    """
+    Weekly counts per theme, topic or neighborhood over the last N ISO weeks.
+
+    Query params:
+      - kind: "theme", "topic" or "neighborhood"
+      - key: a single theme id / topic id / neighborhood (default: all of them)
+      - weeks: number of weeks in each series
+      - end: any date in the last week (default: the latest week with data)
+
+    Served from the weekly rollups (utils/rollups.py); no article is read.
+    """
+    snapshot = _get_snapshot(request)
+
+    if key is None and weeks == 8 and end is None:
+        return FastJSONResponse(
+            snapshot.cached_response(
+                f"trends:{kind}", lambda: _build_trends(snapshot.rollups, kind, None, 8, None)
+            )
+        )
+    return FastJSONResponse(_build_trends(snapshot.rollups, kind, key, weeks, end))
+
+
+def _build_trends(
+    rollups: WeeklyRollups,
+    kind: str,
+    key: Optional[str],
+    n_weeks: int,
+    end: Optional[date],
+) -> Dict[str, Any]:
+    last = week_of(end) if end is not None else rollups.latest_week
+    labels = week_range(last, n_weeks) if last is not None else []
+
+    if key is None:
+        keys = rollups.keys(kind)
+    elif kind == "neighborhood":
+        keys = [normalize_neighborhood(key)]
+    else:
+        keys = [key.strip()]
+
+    return {
+        "kind": kind,
+        "weeks": labels,
+        "totals": rollups.totals(labels),
+        "series": [_build_series(k, rollups.series(kind, k, labels)) for k in keys],
+    }
+
+
+def _build_series(key: str, counts: List[int]) -> Dict[str, Any]:
+    """
+    One TrendSeries: counts oldest first, plus the change over the last week.
+    """
+    current = counts[-1] if counts else 0
+    previous = counts[-2] if len(counts) > 1 else 0
+    delta = current - previous
+
+    return {
+        "key": key,
+        "counts": counts,
+        "total": sum(counts),
+        "delta": delta,
+        "delta_pct": round(100.0 * delta / previous, 1) if previous else None,
+    }
@@ -1,6 +1,7 @@
 # backend/schemas.py
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -74,3 +75,117 @@ class ReportDataResponse(BaseModel):
     theme_distribution: List[ThemeCount]
     top_clusters: List[ReportClusterCount]
     latest_items: List[ReportItemCompact]
+
+
+# ---------- Paginated article listings ----------
+
+class ArticleListItem(ClusterArticle):
+    topic_id: Optional[int] = None
+
+
+class ArticlePage(BaseModel):
+    group: str
+    total: int
+    articles: List[ClusterArticle]
+    next_cursor: Optional[str] = None
+
+
+# ---------- Trends endpoint ----------
+
+class TrendSeries(BaseModel):
+    key: str
+    counts: List[int]
+    total: int
+    delta: int
+    delta_pct: Optional[float] = None
+
+
+class TrendsResponse(BaseModel):
+    kind: str
+    weeks: List[str]
+    totals: List[int]
+    series: List[TrendSeries]
+
+
+# ---------- Search endpoint ----------
+
+class SearchHit(ArticleListItem):
+    score: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    results: List[SearchHit]
+
+
+# ---------- Faceted article query ----------
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class ArticleQueryResponse(BaseModel):
+    total: int
+    articles: List[ArticleListItem]
+    facets: Dict[str, List[FacetCount]]
+
+
+# ---------- Archive ----------
+
+class ArchivePage(BaseModel):
+    total: int
+    partitions: int
+    articles: List[ArticleListItem]
+
+
+# ---------- Dashboard (batched aggregates) ----------
+
+class DashboardQuery(BaseModel):
+    id: Optional[str] = None
+    kind: Literal["themes", "clusters", "map-data", "report-data"]
+    # clusters
+    topic_id: Optional[int] = None
+    include_articles: bool = False
+    limit_articles: int = Field(20, ge=0, le=100)
+    # map-data
+    neighborhood: Optional[str] = None
+    # report-data
+    limit: int = Field(10, ge=1, le=100)
+    sort: Literal["date_desc", "date_asc", "none"] = "date_desc"
+
+
+class DashboardRequest(BaseModel):
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    queries: List[DashboardQuery]
+
+
+class DashboardResponse(BaseModel):
+    snapshot_version: str
+    results: Dict[str, Any]
+
+
+# ---------- Report jobs ----------
+
+class ReportJobRequest(BaseModel):
+    neighborhood: Optional[str] = None
+    theme: Optional[int] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    limit: int = Field(10, ge=1, le=100)
+    sort: Literal["date_desc", "date_asc"] = "date_desc"
+
+
+class ReportJobStatus(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "done", "failed"]
+    params: Dict[str, Any]
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    size_bytes: Optional[int] = None
+    status_url: str
+    download_url: Optional[str] = None
@@ -0,0 +1,362 @@
+"""
+backend/utils/archive.py
+
+Partitioned history of every snapshot the pipeline has produced.
+
+google_topics.json only holds the current scrape. Each pipeline run also
+merges its articles into data/archive/, one binary snapshot file (see
+snapshot_format) per (source, ISO week):
+
+    data/archive/manifest.json
+    data/archive/google-news-rss/2025-W48.cfsnap
+    data/archive/meetup/2025-W47.cfsnap
+    ...
+
+The manifest lists every partition with its row count and date range, so
+the backend can pick the partitions a query needs without opening any of
+them. The served snapshot stays the only resident data; SnapshotArchive maps
+older partitions on first use and keeps them in an LRU bounded by bytes, so
+years of history cost neither startup time nor RSS.
+
+Articles are deduplicated on the same link hash the weekly rollups use.
+"""
+
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .article_store import ArticleStore, iter_column
+from .date_index import DateIndex
+from .rollups import article_key, iso_week
+from .snapshot_format import BINARY_SUFFIX, read_binary_snapshot, write_binary_snapshot
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR_ENV = "COMMUNITY_FLOW_ARCHIVE_DIR"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+UNDATED_WEEK = "undated"
+
+
+def get_archive_dir() -> Path:
+    """
+    data/archive under the project root, or COMMUNITY_FLOW_ARCHIVE_DIR.
+    """
+    override = os.environ.get(ARCHIVE_DIR_ENV)
+    if override:
+        return Path(override).resolve()
+    return Path(__file__).resolve().parents[2] / "data" / "archive"
+
+
+def source_slug(source: Any) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", str(source or "").lower()).strip("-")
+    return slug or "unknown"
+
+
+# ---------- manifest ----------
+
+def read_manifest(archive_dir: Union[str, Path]) -> Dict[str, Any]:
+    path = Path(archive_dir) / MANIFEST_NAME
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {"format_version": FORMAT_VERSION, "partitions": []}
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported archive manifest version {manifest.get('format_version')}: {path}")
+    return manifest
+
+
+def _write_manifest(archive_dir: Path, manifest: Dict[str, Any]) -> None:
+    path = archive_dir / MANIFEST_NAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ---------- writing (pipeline side) ----------
+
+def _partition_rows(articles: Sequence[Mapping[str, Any]]) -> Dict[Tuple[str, str], List[int]]:
+    dates = DateIndex(iter_column(articles, "date"))
+    partitions: Dict[Tuple[str, str], List[int]] = {}
+    for row, (epoch, source) in enumerate(zip(dates.epochs, iter_column(articles, "source"))):
+        week = iso_week(epoch) if epoch is not None else UNDATED_WEEK
+        partitions.setdefault((source_slug(source), week), []).append(row)
+    return partitions
+
+
+def _keys(store: Sequence[Mapping[str, Any]]) -> set:
+    return {
+        article_key(link, title, date_value)
+        for link, title, date_value in zip(
+            iter_column(store, "link"), iter_column(store, "title"), iter_column(store, "date")
+        )
+    }
+
+
+def archive_snapshot(articles: Sequence[Mapping[str, Any]], archive_dir: Union[str, Path, None] = None) -> int:
+    """
+    Merge `articles` into the archive; returns the number of new articles.
+
+    Only partitions that receive new articles are rewritten (atomically, like
+    every snapshot file), then the manifest is replaced.
+    """
+    archive_dir = Path(archive_dir) if archive_dir is not None else get_archive_dir()
+    archive_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = read_manifest(archive_dir)
+    entries = {(p["source"], p["week"]): p for p in manifest["partitions"]}
+
+    added = 0
+    for (source, week), rows in sorted(_partition_rows(articles).items()):
+        entry = entries.get((source, week))
+        path = archive_dir / source / f"{week}{BINARY_SUFFIX}"
+
+        existing: List[Mapping[str, Any]] = []
+        if entry is not None and path.exists():
+            existing = list(read_binary_snapshot(path))
+        seen = _keys(existing)
+
+        fresh = []
+        for row in rows:
+            a = articles[row]
+            key = article_key(a.get("link"), a.get("title"), a.get("date"))
+            if key not in seen:
+                seen.add(key)
+                fresh.append(dict(a))
+        if not fresh:
+            continue
+
+        store = ArticleStore.from_articles([dict(a) for a in existing] + fresh)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_binary_snapshot(store, path)
+        added += len(fresh)
+
+        epochs = [e for e in DateIndex(iter_column(store, "date")).epochs if e is not None]
+        entries[(source, week)] = {
+            "source": source,
+            "week": week,
+            "path": f"{source}/{week}{BINARY_SUFFIX}",
+            "rows": len(store),
+            "bytes": path.stat().st_size,
+            "min_epoch": min(epochs) if epochs else None,
+            "max_epoch": max(epochs) if epochs else None,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    if added:
+        manifest["partitions"] = [entries[k] for k in sorted(entries)]
+        _write_manifest(archive_dir, manifest)
+    return added
+
+
+# ---------- reading (backend side) ----------
+
+class _Partition:
+    __slots__ = ("store", "dates", "nbytes")
+
+    def __init__(self, store: ArticleStore, nbytes: int):
+        self.store = store
+        self.dates = DateIndex(iter_column(store, "date"))
+        self.nbytes = nbytes
+
+
+class SnapshotArchive:
+    """
+    Lazy, LRU-bounded access to the archived partitions.
+
+    Thread-safe: routes using it run in the threadpool. The manifest is
+    re-read whenever its file changes, and cached partitions are keyed by
+    file state, so a pipeline run never leaves stale data behind.
+    """
+
+    def __init__(self, archive_dir: Optional[Path] = None, max_bytes: int = 256 * 1024 * 1024):
+        self.archive_dir = Path(archive_dir) if archive_dir is not None else get_archive_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._manifest: Dict[str, Any] = {"partitions": []}
+        self._manifest_key: Optional[Tuple[int, int]] = None
+        self._cache: "OrderedDict[Tuple[str, int, int], _Partition]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- manifest ----------
+
+    def manifest(self) -> Dict[str, Any]:
+        path = self.archive_dir / MANIFEST_NAME
+        try:
+            st = path.stat()
+        except OSError:
+            return {"partitions": []}
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if key != self._manifest_key:
+                self._manifest = read_manifest(self.archive_dir)
+                self._manifest_key = key
+            return self._manifest
+
+    def select(
+        self,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        sources: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Manifest entries that may hold articles dated in [since, until).
+        """
+        wanted = {source_slug(s) for s in sources}
+        out = []
+        for p in self.manifest()["partitions"]:
+            if wanted and p["source"] not in wanted:
+                continue
+            if p["min_epoch"] is None:
+                continue
+            if since is not None and p["max_epoch"] < since:
+                continue
+            if until is not None and p["min_epoch"] >= until:
+                continue
+            out.append(p)
+        return out
+
+    # ---------- partitions ----------
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._size
+
+    def load(self, entry: Mapping[str, Any]) -> _Partition:
+        path = self.archive_dir / entry["path"]
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            partition = self._cache.get(key)
+            if partition is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return partition
+            self.misses += 1
+
+        partition = _Partition(read_binary_snapshot(path), st.st_size)
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = partition
+                self._size += partition.nbytes
+            while self._size > self.max_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._size -= evicted.nbytes
+                self.evictions += 1
+        return partition
+
+    def articles(
+        self,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        sources: Sequence[str] = (),
+        offset: int = 0,
+        limit: int = 100,
+    ) -> Tuple[int, int, List[Mapping[str, Any]]]:
+        """
+        (total, partitions read, newest-first page) of archived articles
+        dated in [since, until).
+
+        Partitions are merged newest first and each is mapped only once the
+        merge reaches its newest date, so a page reads the few partitions it
+        spans, with or without a window. total comes from the manifest row
+        counts; only partitions the window cuts through are opened for it
+        (their date index is binary-searched).
+        """
+        selected = self.select(since, until, sources)
+        read = set()
+
+        def window(entry: Mapping[str, Any]) -> Sequence[int]:
+            read.add(entry["path"])
+            return self.load(entry).dates.window_rows(since, until)
+
+        total = 0
+        for entry in selected:
+            inside = (since is None or entry["min_epoch"] >= since) and (until is None or entry["max_epoch"] < until)
+            total += entry["rows"] if inside else len(window(entry))
+
+        pending = sorted(selected, key=lambda p: p["max_epoch"], reverse=True)
+        heap: List[Tuple[int, int, Mapping[str, Any], Iterator[Tuple[int, Mapping[str, Any]]]]] = []
+        seq = 0
+
+        def push(stream: Iterator[Tuple[int, Mapping[str, Any]]]) -> None:
+            nonlocal seq
+            for epoch, article in islice(stream, 1):
+                heapq.heappush(heap, (-epoch, seq, article, stream))
+                seq += 1
+
+        page: List[Mapping[str, Any]] = []
+        taken = 0
+        next_entry = 0
+        while taken < offset + limit:
+            # the next partition may hold articles newer than every loaded one
+            if next_entry < len(pending) and (not heap or -heap[0][0] <= pending[next_entry]["max_epoch"]):
+                entry = pending[next_entry]
+                next_entry += 1
+                push(self._newest_first(self.load(entry), window(entry)))
+                continue
+            if not heap:
+                break
+            _, _, article, stream = heapq.heappop(heap)
+            if taken >= offset:
+                page.append(article)
+            taken += 1
+            push(stream)
+
+        return total, len(read), page
+
+    @staticmethod
+    def _newest_first(partition: _Partition, rows: Sequence[int]) -> Iterator[Tuple[int, Mapping[str, Any]]]:
+        epochs = partition.dates.epochs
+        store = partition.store
+        for row in reversed(rows):
+            yield epochs[row], store[row]
+
+    def info(self) -> Dict[str, Any]:
+        partitions = self.manifest()["partitions"]
+        weeks = sorted({p["week"] for p in partitions if p["week"] != UNDATED_WEEK})
+        return {
+            "partitions": len(partitions),
+            "articles": sum(p["rows"] for p in partitions),
+            "sources": sorted({p["source"] for p in partitions}),
+            "first_week": weeks[0] if weeks else None,
+            "last_week": weeks[-1] if weeks else None,
+            "cache": {
+                "resident_bytes": self.resident_bytes,
+                "max_bytes": self.max_bytes,
+                "partitions": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            },
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Merge a google_topics.json into the partitioned archive")
+    parser.add_argument("json_file")
+    parser.add_argument("--archive-dir", default=None)
+    args = parser.parse_args()
+
+    with open(args.json_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    added = archive_snapshot(data, args.archive_dir)
+    print(f"Archived {added} new articles → {args.archive_dir or get_archive_dir()}")
@@ -0,0 +1,220 @@
+"""
+backend/utils/article_index.py
+
+Precomputed aggregates over one article snapshot.
+
+The /themes, /clusters and /map-data routers used to walk every article and
+rebuild Counters on each request. ArticleIndex does that work once per
+snapshot (at startup and whenever the snapshot changes) so the routers only
+copy out results proportional to the response size.
+
+Counters are filled in the same article order the routers used, so ties in
+most_common() resolve identically and payloads stay byte-for-byte the same.
+The index reads the snapshot column by column (see article_store.iter_column)
+and stores groupings as row numbers, so it never materializes per-article
+dicts from an ArticleStore. It also owns the snapshot's DateIndex, which
+answers date-ordered and since/until queries.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .article_store import NumericColumn, Rows, iter_column, value_getter
+from .date_index import DateIndex
+
+
+TOP_KEYWORDS = 10
+
+
+def normalize_neighborhood(n: Any) -> str:
+    """
+    Normalize neighborhood names the way /map-data always has.
+    """
+    if not n:
+        return "Unknown"
+    return str(n).strip()
+
+
+class GroupStats:
+    """
+    Counts for one group of articles (a topic cluster or a neighborhood).
+    """
+
+    __slots__ = ("count", "top_keywords", "theme_distribution")
+
+    def __init__(
+        self,
+        count: int,
+        top_keywords: List[Tuple[str, int]],
+        theme_distribution: List[Tuple[str, int]],
+    ):
+        self.count = count
+        self.top_keywords = top_keywords
+        self.theme_distribution = theme_distribution
+
+
+class _GroupBuilder:
+    __slots__ = ("rows", "keywords", "themes")
+
+    def __init__(self):
+        self.rows = array("I")
+        self.keywords = Counter()
+        self.themes = Counter()
+
+    def add(self, row: int, keywords: Any, themes: Any) -> None:
+        self.rows.append(row)
+        for k in keywords or []:
+            self.keywords[str(k).lower()] += 1
+        for t in themes or []:
+            self.themes[str(t)] += 1
+
+    def stats(self) -> GroupStats:
+        return GroupStats(
+            count=len(self.rows),
+            top_keywords=self.keywords.most_common(TOP_KEYWORDS),
+            theme_distribution=self.themes.most_common(),
+        )
+
+
+def _empty_stats() -> GroupStats:
+    return GroupStats(count=0, top_keywords=[], theme_distribution=[])
+
+
+class ArticleIndex:
+    """
+    Read-only aggregate index built from a snapshot (list of dicts or ArticleStore).
+
+    Attributes:
+      - articles: the underlying snapshot (never mutated)
+      - total_articles: len(articles)
+      - theme_counts: [(theme_id, count)] sorted by theme id, as /themes returns
+      - theme_rows: row numbers per theme id (each row once)
+      - topic_keys: topic ids (as strings) sorted numerically
+      - topic_rows / topic_stats: row numbers + counts per topic_id
+      - neighborhood_keys: normalized neighborhood names, sorted
+      - neighborhood_rows / neighborhood_stats: row numbers + counts per neighborhood
+    """
+
+    def __init__(
+        self,
+        articles: Sequence[Mapping[str, Any]],
+        rows: Optional[Sequence[int]] = None,
+    ):
+        """
+        Index all of `articles`, or only `rows` (row numbers in snapshot order).
+
+        Only the full index carries a DateIndex (`dates`); see window().
+        """
+        self.articles = articles
+        self.total_articles = len(articles) if rows is None else len(rows)
+        self.dates: Optional[DateIndex] = None
+
+        theme_counter = Counter()
+        theme_rows: Dict[str, array] = {}
+        by_topic: Dict[str, _GroupBuilder] = {}
+        by_neighborhood: Dict[str, _GroupBuilder] = {}
+
+        fields = ("themes", "keywords", "topic_id", "neighborhood")
+        if rows is None:
+            self.dates = DateIndex(iter_column(articles, "date"))
+            numbered = enumerate(zip(*(iter_column(articles, f) for f in fields)))
+        else:
+            getters = [value_getter(articles, f) for f in fields]
+            numbered = ((row, tuple(g(row) for g in getters)) for row in rows)
+
+        for row, (themes, keywords, tid, neighborhood) in numbered:
+            theme_ids = [str(t) for t in themes or []] if isinstance(themes or [], list) else [str(themes)]
+            for t in theme_ids:
+                theme_counter[t] += 1
+                bucket = theme_rows.get(t)
+                if bucket is None:
+                    bucket = theme_rows[t] = array("I")
+                if not bucket or bucket[-1] != row:
+                    bucket.append(row)
+
+            if tid is not None:
+                key = str(tid)
+                group = by_topic.get(key)
+                if group is None:
+                    group = by_topic[key] = _GroupBuilder()
+                group.add(row, keywords, themes)
+
+            key = normalize_neighborhood(neighborhood)
+            group = by_neighborhood.get(key)
+            if group is None:
+                group = by_neighborhood[key] = _GroupBuilder()
+            group.add(row, keywords, themes)
+
+        self.theme_counts: List[Tuple[str, int]] = [
+            (tid, theme_counter[tid]) for tid in sorted(theme_counter.keys())
+        ]
+        self.theme_rows: Dict[str, array] = theme_rows
+
+        self.topic_rows: Dict[str, array] = {k: g.rows for k, g in by_topic.items()}
+        self.topic_keys: List[str] = sorted(by_topic.keys(), key=lambda x: int(x))
+        self.topic_stats: Dict[str, GroupStats] = {k: g.stats() for k, g in by_topic.items()}
+
+        self.neighborhood_rows: Dict[str, array] = {k: g.rows for k, g in by_neighborhood.items()}
+        self.neighborhood_keys: List[str] = sorted(by_neighborhood.keys())
+        self.neighborhood_stats: Dict[str, GroupStats] = {
+            k: g.stats() for k, g in by_neighborhood.items()
+        }
+
+    def window(self, since: Optional[int], until: Optional[int]) -> "ArticleIndex":
+        """
+        Index restricted to articles dated in [since, until) (epoch seconds).
+
+        Rows are located with the date index's binary search and aggregated
+        in snapshot order, so counts and tie-breaking match the full index.
+        """
+        if self.dates is None:
+            raise ValueError("window() needs the full snapshot index")
+        if since is None and until is None:
+            return self
+        return ArticleIndex(self.articles, sorted(self.dates.window_rows(since, until)))
+
+    def rows_in_window(self, rows: Sequence[int], since: Optional[int], until: Optional[int]) -> Sequence[int]:
+        """
+        `rows` (ascending row numbers) restricted to articles dated in
+        [since, until), still in snapshot order, without re-aggregating.
+
+        Starts from the shorter side: the date index's slice for the window,
+        each row probed against `rows` by binary search, or `rows`, each
+        checked against its parsed date.
+        """
+        if since is None and until is None:
+            return rows
+        if self.dates is None:
+            raise ValueError("rows_in_window() needs the full snapshot index")
+        window = self.dates.window_rows(since, until)
+        if len(window) < len(rows):
+            n = len(rows)
+
+            def member(row: int) -> bool:
+                i = bisect_left(rows, row)
+                return i < n and rows[i] == row
+
+            return array("I", sorted(filter(member, window)))
+
+        epochs = self.dates.epochs.values
+        lo = NumericColumn.NULL + 1 if since is None else since
+        hi = 2 ** 63 if until is None else until
+        return array("I", (row for row in rows if lo <= epochs[row] < hi))
+
+    # ---------- lookups ----------
+
+    def topic(self, key: str) -> Optional[GroupStats]:
+        return self.topic_stats.get(key)
+
+    def topic_articles(self, key: str, since: Optional[int] = None, until: Optional[int] = None) -> Rows:
+        rows = self.topic_rows.get(key, array("I"))
+        return Rows(self.articles, self.rows_in_window(rows, since, until))
+
+    def neighborhood(self, key: str) -> GroupStats:
+        return self.neighborhood_stats.get(key) or _empty_stats()
+
+    def neighborhood_articles(self, key: str, since: Optional[int] = None, until: Optional[int] = None) -> Rows:
+        rows = self.neighborhood_rows.get(key, array("I"))
+        return Rows(self.articles, self.rows_in_window(rows, since, until))
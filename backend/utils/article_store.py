@@ -0,0 +1,485 @@
+"""
+backend/utils/article_store.py
+
+Compact columnar storage for the article snapshot.
+
+json.load gives one dict per article, each with its own copies of the key
+slots, the repeated `source` / `neighborhood` strings and every keyword. At a
+few hundred thousand articles that dominates worker RSS. ArticleStore keeps
+one column per field instead:
+
+  - text fields (title, text, clean_text, link, date): UTF-8 bytes in one
+    shared buffer plus an array of offsets
+  - categorical fields (source, neighborhood, topic_id): a dictionary of
+    distinct values plus an array of integer codes
+  - list fields (themes, keywords): dictionary-encoded element codes in one
+    flat array plus per-row offsets
+  - numeric values derived at load time (epoch dates, see date_index): a
+    plain int64 array
+
+It still behaves like a read-only list of dicts: store[i] returns an
+ArticleView (a Mapping that decodes fields on access), and iterating yields
+views in snapshot order. Aggregations should prefer iter_column(), which
+reads one field for every row without building any per-article object.
+
+Values that don't fit a column's encoding (a non-string title, a themes value
+that isn't a list, ...) are kept verbatim in a small per-column overflow dict,
+so a round trip through the store always returns exactly what was loaded.
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+_ENCODING = "utf-8"
+_ERRORS = "surrogatepass"
+
+
+def _rows_out(rows: Dict[int, Any]) -> Dict[str, Any]:
+    # row-keyed dicts are serialized as JSON objects (string keys)
+    return {str(row): v for row, v in rows.items()}
+
+
+def _rows_in(rows: Dict[str, Any]) -> Dict[int, Any]:
+    return {int(row): v for row, v in rows.items()}
+
+
+class StringColumn:
+    """
+    Strings in one shared UTF-8 buffer addressed by offsets.
+    """
+
+    __slots__ = ("_buf", "_offsets", "_overflow")
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._offsets = array("Q", [0])
+        # row -> raw value, for anything that isn't a str (None included)
+        self._overflow: Dict[int, Any] = {}
+
+    def append(self, value: Any) -> None:
+        if isinstance(value, str):
+            self._buf += value.encode(_ENCODING, _ERRORS)
+        else:
+            self._overflow[len(self._offsets) - 1] = value
+        self._offsets.append(len(self._buf))
+
+    def freeze(self) -> None:
+        self._buf = bytes(self._buf)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Any:
+        if i in self._overflow:
+            return self._overflow[i]
+        return str(self._buf[self._offsets[i]:self._offsets[i + 1]], _ENCODING, _ERRORS)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(len(self)))
+
+    def nbytes(self) -> int:
+        return len(self._buf) + self._offsets.itemsize * len(self._offsets)
+
+    def dump_state(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return {"buf": self._buf, "offsets": self._offsets}, {"overflow": _rows_out(self._overflow)}
+
+    @classmethod
+    def load_state(cls, buffers: Dict[str, Any], meta: Dict[str, Any]) -> "StringColumn":
+        column = cls()
+        column._buf = buffers["buf"]
+        column._offsets = buffers["offsets"]
+        column._overflow = _rows_in(meta["overflow"])
+        return column
+
+
+def _dict_key(value: Any) -> Tuple[type, Any]:
+    # Keep 1, 1.0 and True distinct so values round-trip with their type.
+    return (type(value), value)
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded column: distinct values plus one int code per row.
+    """
+
+    __slots__ = ("values", "_lookup", "codes", "_overflow")
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._lookup: Dict[Tuple[type, Any], int] = {}
+        self.codes = array("i")
+        self._overflow: Dict[int, Any] = {}
+
+    def encode(self, value: Any) -> int:
+        """
+        Code for `value`, adding it to the dictionary if needed; -1 if unhashable.
+        """
+        try:
+            key = _dict_key(value)
+            code = self._lookup.get(key)
+        except TypeError:
+            return -1
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._lookup[key] = code
+        return code
+
+    def append(self, value: Any) -> None:
+        code = self.encode(value)
+        if code < 0:
+            self._overflow[len(self.codes)] = value
+        self.codes.append(code)
+
+    def freeze(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Any:
+        code = self.codes[i]
+        if code < 0:
+            return self._overflow[i]
+        return self.values[code]
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self.values
+        overflow = self._overflow
+        for i, code in enumerate(self.codes):
+            yield overflow[i] if code < 0 else values[code]
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+    def dump_state(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return {"codes": self.codes}, {"values": self.values, "overflow": _rows_out(self._overflow)}
+
+    @classmethod
+    def load_state(cls, buffers: Dict[str, Any], meta: Dict[str, Any]) -> "CategoricalColumn":
+        column = cls()
+        column.values = meta["values"]
+        column._lookup = {_dict_key(v): code for code, v in enumerate(column.values)}
+        column.codes = buffers["codes"]
+        column._overflow = _rows_in(meta["overflow"])
+        return column
+
+
+class ListColumn:
+    """
+    Lists of hashable values: dictionary-encoded elements in one flat array.
+    """
+
+    __slots__ = ("_elements", "_codes", "_offsets", "_overflow")
+
+    def __init__(self):
+        self._elements = CategoricalColumn()
+        self._codes = array("i")
+        self._offsets = array("Q", [0])
+        # row -> raw value, for non-lists and lists with unhashable elements
+        self._overflow: Dict[int, Any] = {}
+
+    def append(self, value: Any) -> None:
+        row = len(self._offsets) - 1
+        if isinstance(value, list):
+            codes = [self._elements.encode(v) for v in value]
+            if -1 in codes:
+                self._overflow[row] = value
+            else:
+                self._codes.extend(codes)
+        else:
+            self._overflow[row] = value
+        self._offsets.append(len(self._codes))
+
+    def freeze(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Any:
+        if i in self._overflow:
+            return self._overflow[i]
+        values = self._elements.values
+        return [values[c] for c in self._codes[self._offsets[i]:self._offsets[i + 1]]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(len(self)))
+
+    def nbytes(self) -> int:
+        return self._codes.itemsize * len(self._codes) + self._offsets.itemsize * len(self._offsets)
+
+    def dump_state(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        buffers = {"codes": self._codes, "offsets": self._offsets}
+        meta = {"elements": self._elements.values, "overflow": _rows_out(self._overflow)}
+        return buffers, meta
+
+    @classmethod
+    def load_state(cls, buffers: Dict[str, Any], meta: Dict[str, Any]) -> "ListColumn":
+        column = cls()
+        column._elements = CategoricalColumn.load_state(
+            {"codes": array("i")}, {"values": meta["elements"], "overflow": {}}
+        )
+        column._codes = buffers["codes"]
+        column._offsets = buffers["offsets"]
+        column._overflow = _rows_in(meta["overflow"])
+        return column
+
+
+class NumericColumn:
+    """
+    64-bit integers in an array, with a sentinel standing in for None.
+
+    Used for values derived at load time (e.g. epoch seconds for `date`).
+    """
+
+    NULL = -(2 ** 63)
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.values = array("q")
+        for v in values:
+            self.append(v)
+
+    def append(self, value: Any) -> None:
+        self.values.append(self.NULL if value is None else value)
+
+    def freeze(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> Any:
+        v = self.values[i]
+        return None if v == self.NULL else v
+
+    def __iter__(self) -> Iterator[Any]:
+        null = self.NULL
+        return (None if v == null else v for v in self.values)
+
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+
+# Column layout for the fields written by the NLP pipeline. Any other key is
+# kept in a sparse per-field dict.
+FIELD_COLUMNS = {
+    "title": StringColumn,
+    "text": StringColumn,
+    "date": StringColumn,
+    "link": StringColumn,
+    "source": CategoricalColumn,
+    "neighborhood": CategoricalColumn,
+    "clean_text": StringColumn,
+    "keywords": ListColumn,
+    "themes": ListColumn,
+    "topic_id": CategoricalColumn,
+}
+
+
+class ArticleView(Mapping):
+    """
+    Read-only dict-like view of one row of an ArticleStore.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ArticleStore", row: int):
+        self._store = store
+        self._row = row
+
+    def _keys(self) -> Tuple[str, ...]:
+        return self._store._layouts[self._row]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return self._store._value(self._row, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._keys():
+            return default
+        return self._store._value(self._row, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"ArticleView({dict(self)!r})"
+
+    def __reduce__(self):
+        # Never pickle the whole store along with one row.
+        return (dict, (dict(self),))
+
+
+class ArticleStore(Sequence):
+    """
+    Columnar, list-like container of articles. Build with from_articles().
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, Any] = {name: cls() for name, cls in FIELD_COLUMNS.items()}
+        # Per-row key tuple (dictionary-encoded): preserves which keys each
+        # article had and in what order, so dict(view) matches the source.
+        self._layouts = CategoricalColumn()
+        self._extras: Dict[str, Dict[int, Any]] = {}
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Mapping[str, Any]]) -> "ArticleStore":
+        store = cls()
+        for a in articles:
+            store.append(a)
+        store.freeze()
+        return store
+
+    def append(self, article: Mapping[str, Any]) -> None:
+        row = len(self._layouts)
+        self._layouts.append(tuple(article.keys()))
+        for name, column in self._columns.items():
+            column.append(article.get(name))
+        for key, value in article.items():
+            if key not in self._columns:
+                self._extras.setdefault(key, {})[row] = value
+
+    def freeze(self) -> None:
+        for column in self._columns.values():
+            column.freeze()
+
+    # ---------- serialization (see snapshot_format) ----------
+
+    def dump_state(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        (buffers, meta): flat name -> array/bytes buffers, and JSON-able metadata.
+        """
+        buffers: Dict[str, Any] = {}
+        meta: Dict[str, Any] = {"columns": {}, "extras": {}}
+        named = dict(self._columns)
+        named["_layouts"] = self._layouts
+        for name, column in named.items():
+            column_buffers, column_meta = column.dump_state()
+            for key, buf in column_buffers.items():
+                buffers[f"{name}.{key}"] = buf
+            meta["columns"][name] = column_meta
+        meta["extras"] = {key: _rows_out(rows) for key, rows in self._extras.items()}
+        return buffers, meta
+
+    @classmethod
+    def load_state(cls, buffers: Dict[str, Any], meta: Dict[str, Any]) -> "ArticleStore":
+        """
+        Rebuild a store from dump_state() output. Buffers may be memoryviews
+        (e.g. over an mmap) and are used as-is, without copying.
+        """
+        store = cls()
+        for name, column_cls in FIELD_COLUMNS.items():
+            column_buffers = {
+                key.split(".", 1)[1]: buf
+                for key, buf in buffers.items()
+                if key.split(".", 1)[0] == name
+            }
+            store._columns[name] = column_cls.load_state(column_buffers, meta["columns"][name])
+
+        layouts_meta = dict(meta["columns"]["_layouts"])
+        layouts_meta["values"] = [tuple(keys) for keys in layouts_meta["values"]]
+        store._layouts = CategoricalColumn.load_state(
+            {"codes": buffers["_layouts.codes"]}, layouts_meta
+        )
+        store._extras = {key: _rows_in(rows) for key, rows in meta["extras"].items()}
+        return store
+
+    # ---------- columnar access ----------
+
+    def column(self, name: str) -> Sequence:
+        """
+        Raw column for `name`; rows where the key is absent read as None.
+        """
+        return self._columns[name]
+
+    def iter_column(self, name: str) -> Iterator[Any]:
+        if name in self._columns:
+            return iter(self._columns[name])
+        extras = self._extras.get(name, {})
+        return (extras.get(i) for i in range(len(self)))
+
+    def _value(self, row: int, key: str) -> Any:
+        column = self._columns.get(key)
+        if column is not None:
+            return column[row]
+        return self._extras[key][row]
+
+    def nbytes(self) -> int:
+        """
+        Approximate size of the array-backed column data (excludes dictionaries).
+        """
+        return sum(c.nbytes() for c in self._columns.values()) + self._layouts.nbytes()
+
+    # ---------- list interface ----------
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [ArticleView(self, r) for r in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("ArticleStore index out of range")
+        return ArticleView(self, i)
+
+    def __iter__(self) -> Iterator[ArticleView]:
+        return (ArticleView(self, i) for i in range(len(self)))
+
+
+def iter_column(articles: Sequence[Mapping[str, Any]], name: str) -> Iterator[Any]:
+    """
+    Yield `name` for every article, for either an ArticleStore or a list of dicts.
+    """
+    if isinstance(articles, ArticleStore):
+        return articles.iter_column(name)
+    return (a.get(name) for a in articles)
+
+
+def value_getter(articles: Sequence[Mapping[str, Any]], name: str) -> Callable[[int], Any]:
+    """
+    Row number -> value of `name`, without building a view for ArticleStores.
+    """
+    if isinstance(articles, ArticleStore) and name in FIELD_COLUMNS:
+        return articles.column(name).__getitem__
+    return lambda row: articles[row].get(name)
+
+
+class Rows(Sequence):
+    """
+    Lazy ordered subset of a snapshot, addressed by row numbers.
+
+    Used for per-topic / per-neighborhood groupings so the index stores only
+    integers and callers materialize just the rows they return.
+    """
+
+    __slots__ = ("_articles", "_rows")
+
+    def __init__(self, articles: Sequence[Mapping[str, Any]], rows: Sequence[int]):
+        self._articles = articles
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Rows(self._articles, self._rows[i])
+        return self._articles[self._rows[i]]
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        articles = self._articles
+        return (articles[r] for r in self._rows)
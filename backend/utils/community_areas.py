@@ -0,0 +1,268 @@
+"""
+backend/utils/community_areas.py
+
+Chicago's 77 community areas, and neighborhood inference from free text.
+
+Scrapers only know an article is about "Chicago". infer_neighborhood() finds
+community-area names and common neighborhood aliases ("Pilsen" -> Lower West
+Side, "Wicker Park" -> West Town) in an article's title and text and returns
+the community area mentioned most.
+
+All names are matched in a single pass with an Aho-Corasick automaton, so
+the cost is linear in the text length no matter how many names there are.
+Text and names are normalized the same way (lowercase, runs of anything but
+letters/digits become one space) and padded with spaces, which makes every
+match a whole-word match without a separate boundary check.
+
+Coordinates are approximate area centroids (WGS84); they place a point per
+area on the /map-data GeoJSON, not boundaries.
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+# Value the scrapers write when they know nothing more specific.
+DEFAULT_NEIGHBORHOOD = "Chicago"
+
+TITLE_WEIGHT = 2
+
+
+class CommunityArea(NamedTuple):
+    number: int
+    name: str
+    lat: float
+    lon: float
+    aliases: Tuple[str, ...] = ()
+
+
+# Names that are also common words or other cities ("Austin", "the Loop" in
+# "stay in the loop") are only matched through their qualified aliases.
+COMMUNITY_AREAS: Tuple[CommunityArea, ...] = (
+    CommunityArea(1, "Rogers Park", 42.009, -87.670),
+    CommunityArea(2, "West Ridge", 41.999, -87.692, ("west rogers park",)),
+    CommunityArea(3, "Uptown", 41.966, -87.655, ("buena park",)),
+    CommunityArea(4, "Lincoln Square", 41.969, -87.689, ("ravenswood",)),
+    CommunityArea(5, "North Center", 41.950, -87.680, ("roscoe village",)),
+    CommunityArea(6, "Lake View", 41.943, -87.653, ("lakeview", "wrigleyville", "boystown", "northalsted")),
+    CommunityArea(7, "Lincoln Park", 41.922, -87.647, ("old town",)),
+    CommunityArea(8, "Near North Side", 41.900, -87.634, ("river north", "streeterville", "gold coast", "magnificent mile")),
+    CommunityArea(9, "Edison Park", 42.006, -87.814),
+    CommunityArea(10, "Norwood Park", 41.986, -87.805),
+    CommunityArea(11, "Jefferson Park", 41.971, -87.763),
+    CommunityArea(12, "Forest Glen", 41.983, -87.753),
+    CommunityArea(13, "North Park", 41.981, -87.721),
+    CommunityArea(14, "Albany Park", 41.968, -87.720),
+    CommunityArea(15, "Portage Park", 41.958, -87.765),
+    CommunityArea(16, "Irving Park", 41.953, -87.724),
+    CommunityArea(17, "Dunning", 41.947, -87.808),
+    CommunityArea(18, "Montclare", 41.925, -87.799),
+    CommunityArea(19, "Belmont Cragin", 41.931, -87.766),
+    CommunityArea(20, "Hermosa", 41.920, -87.734),
+    CommunityArea(21, "Avondale", 41.939, -87.712),
+    CommunityArea(22, "Logan Square", 41.923, -87.703, ("bucktown",)),
+    CommunityArea(23, "Humboldt Park", 41.903, -87.721),
+    CommunityArea(24, "West Town", 41.899, -87.675, ("wicker park", "ukrainian village", "east village", "noble square")),
+    CommunityArea(25, "Austin", 41.894, -87.763, ("austin chicago", "chicago s austin", "austin neighborhood", "west side austin")),
+    CommunityArea(26, "West Garfield Park", 41.880, -87.729),
+    CommunityArea(27, "East Garfield Park", 41.881, -87.704, ("garfield park",)),
+    CommunityArea(28, "Near West Side", 41.875, -87.668, ("west loop", "greektown", "little italy", "university village")),
+    CommunityArea(29, "North Lawndale", 41.860, -87.718),
+    CommunityArea(30, "South Lawndale", 41.844, -87.713, ("little village", "la villita")),
+    CommunityArea(31, "Lower West Side", 41.853, -87.666, ("pilsen",)),
+    CommunityArea(32, "Loop", 41.879, -87.628, ("chicago loop", "chicago s loop", "loop chicago", "downtown chicago")),
+    CommunityArea(33, "Near South Side", 41.856, -87.621, ("south loop", "printers row", "prairie district")),
+    CommunityArea(34, "Armour Square", 41.840, -87.633, ("chinatown",)),
+    CommunityArea(35, "Douglas", 41.835, -87.618, ("douglas community area", "illinois institute of technology")),
+    CommunityArea(36, "Oakland", 41.823, -87.603, ("oakland chicago",)),
+    CommunityArea(37, "Fuller Park", 41.809, -87.632),
+    CommunityArea(38, "Grand Boulevard", 41.813, -87.617, ("bronzeville",)),
+    CommunityArea(39, "Kenwood", 41.809, -87.596),
+    CommunityArea(40, "Washington Park", 41.793, -87.618),
+    CommunityArea(41, "Hyde Park", 41.794, -87.593),
+    CommunityArea(42, "Woodlawn", 41.778, -87.597),
+    CommunityArea(43, "South Shore", 41.762, -87.575),
+    CommunityArea(44, "Chatham", 41.741, -87.613),
+    CommunityArea(45, "Avalon Park", 41.746, -87.586),
+    CommunityArea(46, "South Chicago", 41.740, -87.555),
+    CommunityArea(47, "Burnside", 41.728, -87.597),
+    CommunityArea(48, "Calumet Heights", 41.729, -87.578),
+    CommunityArea(49, "Roseland", 41.707, -87.623),
+    CommunityArea(50, "Pullman", 41.700, -87.607),
+    CommunityArea(51, "South Deering", 41.690, -87.566),
+    CommunityArea(52, "East Side", 41.705, -87.535),
+    CommunityArea(53, "West Pullman", 41.673, -87.637),
+    CommunityArea(54, "Riverdale", 41.660, -87.605, ("altgeld gardens",)),
+    CommunityArea(55, "Hegewisch", 41.660, -87.548),
+    CommunityArea(56, "Garfield Ridge", 41.797, -87.770),
+    CommunityArea(57, "Archer Heights", 41.810, -87.727),
+    CommunityArea(58, "Brighton Park", 41.818, -87.699),
+    CommunityArea(59, "McKinley Park", 41.831, -87.673),
+    CommunityArea(60, "Bridgeport", 41.838, -87.648),
+    CommunityArea(61, "New City", 41.807, -87.658, ("back of the yards", "canaryville")),
+    CommunityArea(62, "West Elsdon", 41.794, -87.724),
+    CommunityArea(63, "Gage Park", 41.795, -87.697),
+    CommunityArea(64, "Clearing", 41.780, -87.768, ("clearing chicago",)),
+    CommunityArea(65, "West Lawn", 41.771, -87.723),
+    CommunityArea(66, "Chicago Lawn", 41.775, -87.696, ("marquette park",)),
+    CommunityArea(67, "West Englewood", 41.778, -87.666),
+    CommunityArea(68, "Englewood", 41.779, -87.645),
+    CommunityArea(69, "Greater Grand Crossing", 41.762, -87.614, ("grand crossing",)),
+    CommunityArea(70, "Ashburn", 41.747, -87.708),
+    CommunityArea(71, "Auburn Gresham", 41.743, -87.655),
+    CommunityArea(72, "Beverly", 41.714, -87.677),
+    CommunityArea(73, "Washington Heights", 41.717, -87.651),
+    CommunityArea(74, "Mount Greenwood", 41.695, -87.713),
+    CommunityArea(75, "Morgan Park", 41.690, -87.667),
+    CommunityArea(76, "O'Hare", 41.977, -87.905, ("ohare",)),
+    CommunityArea(77, "Edgewater", 41.987, -87.661, ("andersonville",)),
+)
+
+# Matched only through aliases (see above).
+_ALIAS_ONLY = {"Austin", "Loop", "Douglas", "Oakland", "Clearing"}
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_text(text: Any) -> str:
+    """
+    " pilsen s best yoga " for "Pilsen's best yoga!" (see module docstring).
+    """
+    return " " + _NON_WORD.sub(" ", str(text or "").lower()).strip() + " "
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of patterns.
+
+    The goto function is a list of dicts (one per trie node); failure links
+    are folded into the output lists at build time, so matching is a single
+    loop over the text with one dict lookup per character in the common case.
+    """
+
+    def __init__(self, patterns: Mapping[str, Any]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+
+        for pattern, value in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((len(pattern), value))
+
+        # breadth-first, so a node's failure target is complete before its children
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def finditer(self, text: str) -> Iterable[Tuple[int, int, Any]]:
+        """
+        (start offset, length, value) for every occurrence of every pattern.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0) if node else root.get(ch, 0)
+            for length, value in out[node]:
+                yield i - length + 1, length, value
+
+
+def _patterns() -> Dict[str, str]:
+    patterns: Dict[str, str] = {}
+    for area in COMMUNITY_AREAS:
+        names = list(area.aliases)
+        if area.name not in _ALIAS_ONLY:
+            names.append(area.name)
+        for name in names:
+            patterns[normalize_text(name)] = area.name
+    return patterns
+
+
+_MATCHER: Optional[PatternMatcher] = None
+
+_BY_NAME: Dict[str, CommunityArea] = {}
+for _area in COMMUNITY_AREAS:
+    _BY_NAME[normalize_text(_area.name)] = _area
+    for _alias in _area.aliases:
+        _BY_NAME[normalize_text(_alias)] = _area
+
+
+def matcher() -> PatternMatcher:
+    global _MATCHER
+    if _MATCHER is None:
+        _MATCHER = PatternMatcher(_patterns())
+    return _MATCHER
+
+
+def area_for(name: Any) -> Optional[CommunityArea]:
+    """
+    The community area a neighborhood value refers to (by name or alias).
+    """
+    return _BY_NAME.get(normalize_text(name))
+
+
+def mentions(text: Any) -> List[Tuple[int, str]]:
+    """
+    (offset, community area name) for each mention in `text`, in order.
+
+    Where names overlap ("west garfield park" contains "garfield park") the
+    earlier, longer match wins.
+    """
+    found = sorted(
+        (start, -length, name) for start, length, name in matcher().finditer(normalize_text(text))
+    )
+    out: List[Tuple[int, str]] = []
+    end = 0
+    for start, neg_length, name in found:
+        # adjacent names share the padding space between them
+        if start < end - 1:
+            continue
+        out.append((start, name))
+        end = start - neg_length
+    return out
+
+
+def infer_neighborhood(title: Any, text: Any) -> Optional[str]:
+    """
+    Community area mentioned most in an article, or None.
+
+    Title mentions count TITLE_WEIGHT times; ties go to the area mentioned
+    first (title before text).
+    """
+    scores: Dict[str, int] = {}
+    first: Dict[str, int] = {}
+    position = 0
+    for weight, field in ((TITLE_WEIGHT, title), (1, text)):
+        for _, name in mentions(field):
+            scores[name] = scores.get(name, 0) + weight
+            first.setdefault(name, position)
+            position += 1
+    if not scores:
+        return None
+    return min(scores, key=lambda name: (-scores[name], first[name]))
+
+
+def needs_inference(neighborhood: Any) -> bool:
+    """
+    True if the scraper left the neighborhood empty or at the city default.
+    """
+    return not neighborhood or str(neighborhood).strip() == DEFAULT_NEIGHBORHOOD
@@ -0,0 +1,391 @@
+"""
+backend/utils/compression.py
+
+gzip / brotli response compression with a per-snapshot cache.
+
+Responses from the snapshot-backed paths (the ConditionalGet ones) are a
+pure function of the snapshot version, path and query, so their compressed
+encodings are too. CompressionMiddleware compresses each such body once per
+(version, path, query, encoding), at the highest level since it is paid
+once, and serves later requests straight from an LRU bounded by bytes --
+the route, the aggregation and the compressor are all skipped. Entries from
+an older snapshot version are dropped as soon as a newer one is seen.
+
+Every other compressible response (other paths, NDJSON streams) is
+compressed on the fly at a fast level, chunk by chunk, so streams still
+flush as they go.
+
+brotli is used when the package is installed and the client accepts it;
+otherwise gzip. Every response from a cached path carries Vary:
+Accept-Encoding, whether or not it was compressed, so shared caches keep
+the encodings apart. When an encoding was negotiated its ETag is made weak
+(as nginx does), since the bytes differ from the identity encoding -- on
+the 200 and on the 304 that revalidates it alike; If-None-Match ignores W/
+so revalidation still matches.
+"""
+
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .etag import DEFAULT_ETAG_PATHS, snapshot_version
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+MINIMUM_SIZE = 1024
+
+COMPRESSIBLE_TYPES = (
+    b"application/json",
+    b"application/geo+json",
+    b"application/x-ndjson",
+    b"text/",
+)
+
+# Per-request (streaming) vs once-per-snapshot (cached) effort.
+GZIP_STREAM_LEVEL = 6
+GZIP_CACHED_LEVEL = 9
+BROTLI_STREAM_QUALITY = 4
+BROTLI_CACHED_QUALITY = 11
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """
+    Best supported encoding the client accepts ("br", "gzip") or None.
+
+    Honors q-values (q=0 refuses) and "*"; ties prefer brotli.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_CACHED_QUALITY if cached else BROTLI_STREAM_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_CACHED_LEVEL if cached else GZIP_STREAM_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    """
+    Incremental compressor that flushes after every chunk.
+    """
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_STREAM_QUALITY)
+            self._zlib = None
+        else:
+            self._br = None
+            self._zlib = zlib.compressobj(GZIP_STREAM_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self._br is not None:
+            return self._br.process(data) + self._br.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._br is not None:
+            return self._br.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+def _is_compressible(headers: Iterable[Tuple[bytes, bytes]]) -> bool:
+    content_type = b""
+    for name, value in headers:
+        if name == b"content-encoding":
+            return False
+        if name == b"content-type":
+            content_type = value.lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _weak_etags(headers: Iterable[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    return [
+        (name, b"W/" + value if name == b"etag" and not value.startswith(b"W/") else value)
+        for name, value in headers
+    ]
+
+
+def _encoded_headers(headers: Iterable[Tuple[bytes, bytes]], encoding: str, length: Optional[int]) -> List[Tuple[bytes, bytes]]:
+    out: List[Tuple[bytes, bytes]] = []
+    for name, value in _weak_etags(headers):
+        if name in (b"content-length", b"vary"):
+            continue
+        out.append((name, value))
+    out.append((b"content-encoding", encoding.encode()))
+    out.append((b"vary", b"Accept-Encoding"))
+    if length is not None:
+        out.append((b"content-length", str(length).encode()))
+    return out
+
+
+def _with_vary(headers: Iterable[Tuple[bytes, bytes]], weak: bool = False) -> List[Tuple[bytes, bytes]]:
+    headers = _weak_etags(headers) if weak else list(headers)
+    return [(n, v) for n, v in headers if n != b"vary"] + [(b"vary", b"Accept-Encoding")]
+
+
+def _varying(send: Send, weak: bool) -> Send:
+    """
+    `send` adding Vary (and weak ETags if `weak`) to the response start.
+    """
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message = {**message, "headers": _with_vary(message.get("headers", []), weak)}
+        await send(message)
+
+    return wrapped
+
+
+class CompressedCache:
+    """
+    (path, query, encoding) -> (headers, body) for one snapshot version, LRU
+    bounded by body bytes. Thread-safe; shared by all requests of a worker.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[List[Tuple[bytes, bytes]], bytes]]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _sync(self, version: str) -> None:
+        if version != self._version:
+            self._entries.clear()
+            self._size = 0
+            self._version = version
+
+    def get(
+        self, version: str, key: Tuple[str, str, str], count: bool = True,
+    ) -> Optional[Tuple[List[Tuple[bytes, bytes]], bytes]]:
+        with self._lock:
+            self._sync(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry
+
+    def put(self, version: str, key: Tuple[str, str, str], headers: List[Tuple[bytes, bytes]], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            # a request that outlived a reload must not evict the new version
+            if version != self._version:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[1])
+            self._entries[key] = (headers, body)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+
+def _normalized_query(query_string: bytes) -> str:
+    # same normalization as the ETag: ?a=1&b=2 and ?b=2&a=1 share an entry
+    return urlencode(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware: cached encodings for `cached_paths`, streaming
+    compression for every other compressible response.
+
+    Pass `cache` to share (and observe) the cache; by default the
+    middleware owns a 64 MB one.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: Optional[CompressedCache] = None,
+        cached_paths: Iterable[str] = DEFAULT_ETAG_PATHS,
+        minimum_size: int = MINIMUM_SIZE,
+        get_version: Callable[[Scope], Optional[str]] = snapshot_version,
+    ):
+        self.app = app
+        self.cached_paths = frozenset(cached_paths)
+        self.cache = cache if cache is not None else CompressedCache(64 * 1024 * 1024)
+        self.minimum_size = minimum_size
+        self.get_version = get_version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        conditional = False
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                encoding = negotiate(value.decode("latin-1"))
+            elif name == b"if-none-match":
+                conditional = True
+
+        on_cached_path = scope["path"] in self.cached_paths
+        if encoding is None or scope["method"] == "HEAD":
+            # uncompressed, but the headers match what a GET would carry
+            if on_cached_path:
+                send = _varying(send, weak=encoding is not None)
+            await self.app(scope, receive, send)
+            return
+
+        cacheable = scope["method"] == "GET" and on_cached_path
+        version = self.get_version(scope) if cacheable else None
+        if version is None:
+            await self._stream(scope, receive, send, encoding)
+            return
+
+        key = (scope["path"], _normalized_query(scope.get("query_string", b"")), encoding)
+        # Revalidations go through so ConditionalGet can answer 304.
+        if not conditional:
+            entry = self.cache.get(version, key)
+            if entry is not None:
+                headers, body = entry
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        await self._buffered(scope, receive, send, encoding, version, key, reuse=conditional)
+
+    async def _buffered(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        encoding: str,
+        version: str,
+        key: Tuple[str, str, str],
+        reuse: bool,
+    ) -> None:
+        """
+        Run the route, compress its 200 body once and cache it.
+        """
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] != 200 or not _is_compressible(message.get("headers", [])):
+                    # e.g. ConditionalGet's 304: same Vary and ETag form as the 200
+                    passthrough = True
+                    await send({**message, "headers": _with_vary(message.get("headers", []), weak=True)})
+                    return
+                start = message
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if len(body) < self.minimum_size:
+                await send({**start, "headers": _with_vary(start.get("headers", []), weak=True)})
+                await send({"type": "http.response.body", "body": body})
+                return
+            # a revalidation that missed its 304 may still find the encoding cached
+            cached = self.cache.get(version, key, count=False) if reuse else None
+            if cached is None:
+                compressed = compress(body, encoding, cached=True)
+                headers = _encoded_headers(start.get("headers", []), encoding, len(compressed))
+                self.cache.put(version, key, headers, compressed)
+            else:
+                headers, compressed = cached
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, capture)
+
+    async def _stream(self, scope: Scope, receive: Receive, send: Send, encoding: str) -> None:
+        start: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+
+        async def wrapped(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if not _is_compressible(message.get("headers", [])):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            if compressor is None:
+                if not more:
+                    # complete body in one message: compress whole, or not at all
+                    if len(body) < self.minimum_size:
+                        await send({**start, "headers": _with_vary(start.get("headers", []))})
+                        await send(message)
+                        return
+                    data = compress(body, encoding)
+                    await send({**start, "headers": _encoded_headers(start.get("headers", []), encoding, len(data))})
+                    await send({"type": "http.response.body", "body": data})
+                    return
+                compressor = _StreamCompressor(encoding)
+                await send({**start, "headers": _encoded_headers(start.get("headers", []), encoding, None)})
+
+            data = compressor.chunk(body) if body else b""
+            if not more:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more})
+
+        await self.app(scope, receive, wrapped)
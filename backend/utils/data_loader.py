@@ -6,8 +6,19 @@ analytics endpoints (/themes, /clusters, /map-data, /report-data, /report-pdf).
 """
 
 import json
+import logging
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+from .article_store import ArticleStore
+from .snapshot_format import SnapshotFormatError, binary_path_for, read_binary_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Overrides the snapshot location (benchmarks, staging copies of the data).
+DATA_FILE_ENV = "COMMUNITY_FLOW_DATA_FILE"
 
 
 def get_data_file_path() -> Path:
@@ -17,19 +28,55 @@ def get_data_file_path() -> Path:
 
     We go two levels up from this file:
         backend/utils/data_loader.py -> backend/ -> project root.
+
+    COMMUNITY_FLOW_DATA_FILE, if set, is used instead.
     """
+    override = os.environ.get(DATA_FILE_ENV)
+    if override:
+        return Path(override).resolve()
     project_root = Path(__file__).resolve().parents[2]
     return project_root / "data" / "cleaned" / "google_topics.json"
 
 
-def load_articles() -> List[Dict[str, Any]]:
+def resolve_snapshot_file(data_file: Optional[Path] = None) -> Path:
+    """
+    The file load_articles() will read: the binary companion
+    (google_topics.cfsnap, see snapshot_format) when it is at least as new as
+    the JSON, otherwise the JSON itself.
+    """
+    data_file = Path(data_file) if data_file is not None else get_data_file_path()
+    binary_file = binary_path_for(data_file)
+    try:
+        binary_mtime = binary_file.stat().st_mtime_ns
+    except OSError:
+        return data_file
+    try:
+        if data_file.stat().st_mtime_ns > binary_mtime:
+            return data_file
+    except OSError:
+        pass
+    return binary_file
+
+
+def load_articles(data_file: Optional[Path] = None) -> Sequence[Mapping[str, Any]]:
     """
     Load processed article data from google_topics.json.
 
-    This is called once at FastAPI startup (see backend/main.py) and also
-    by pure helper utilities like report_builder.
+    Prefers the binary snapshot written next to it by the pipeline (returned
+    as a list-like ArticleStore) and falls back to parsing the JSON (a list
+    of dicts) if the binary file is missing, stale or unreadable.
+
+    This always reads the file. Request-time callers should go through
+    get_cached_articles() instead.
     """
-    data_file = get_data_file_path()
+    data_file = Path(data_file) if data_file is not None else get_data_file_path()
+
+    source = resolve_snapshot_file(data_file)
+    if source != data_file:
+        try:
+            return read_binary_snapshot(source)
+        except (SnapshotFormatError, OSError) as e:
+            logger.warning("Ignoring binary snapshot %s (%s); falling back to JSON", source, e)
 
     if not data_file.exists():
         raise FileNotFoundError(f"Data file not found: {data_file}")
@@ -44,3 +91,76 @@ def load_articles() -> List[Dict[str, Any]]:
 
     return data
 
+
+# ---------- Process-wide snapshot cache ----------
+#
+# Keyed by resolved path; an entry is reused only while the (mtime_ns, size)
+# of the file actually read (JSON or binary companion) are unchanged, so a
+# rewritten snapshot is picked up on the next call without any explicit
+# signal. Cached snapshots are held as a columnar ArticleStore rather than
+# the list of dicts json.load returns.
+
+_cache: Dict[str, Tuple[Tuple[int, int], ArticleStore]] = {}
+_cache_lock = threading.Lock()
+
+
+def snapshot_version(stat_key: Tuple[int, int]) -> str:
+    """
+    Stable version string for a snapshot file state (mtime_ns, size).
+    """
+    mtime_ns, size = stat_key
+    return f"{mtime_ns:x}-{size:x}"
+
+
+def _stat_key(data_file: Path) -> Tuple[int, int]:
+    st = data_file.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_cached_snapshot(
+    data_file: Optional[Path] = None,
+) -> Tuple[Tuple[int, int], ArticleStore]:
+    """
+    Like get_cached_articles(), but also returns the (mtime_ns, size) key the
+    articles were loaded under, so callers can version what they derive.
+    """
+    data_file = Path(data_file) if data_file is not None else get_data_file_path()
+    source = resolve_snapshot_file(data_file)
+    if not source.exists():
+        raise FileNotFoundError(f"Data file not found: {data_file}")
+
+    cache_key = str(data_file.resolve())
+
+    with _cache_lock:
+        stat_key = _stat_key(source)
+        entry = _cache.get(cache_key)
+        if entry is not None and entry[0] == stat_key:
+            return entry
+
+        articles = load_articles(data_file)
+        if not isinstance(articles, ArticleStore):
+            articles = ArticleStore.from_articles(articles)
+        entry = (stat_key, articles)
+        _cache[cache_key] = entry
+        return entry
+
+
+def get_cached_articles(data_file: Optional[Path] = None) -> ArticleStore:
+    """
+    Return the parsed snapshot, re-reading the file only if it changed on disk.
+
+    The returned store is list-like and shared between callers; it is
+    read-only.
+    """
+    return get_cached_snapshot(data_file)[1]
+
+
+def invalidate_articles_cache(data_file: Optional[Path] = None) -> None:
+    """
+    Drop a cached snapshot (or every cached snapshot if no path is given).
+    """
+    with _cache_lock:
+        if data_file is None:
+            _cache.clear()
+        else:
+            _cache.pop(str(Path(data_file).resolve()), None)
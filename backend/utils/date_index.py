@@ -0,0 +1,109 @@
+"""
+backend/utils/date_index.py
+
+Parsed-date index for time-ordered and time-windowed queries.
+
+Article dates are RSS strings ("Sun, 30 Nov 2025 02:19:00 GMT"), which sort
+by weekday name rather than chronologically. DateIndex parses every date
+once per snapshot into epoch seconds and keeps the row numbers sorted by
+that value, so:
+  - latest/oldest N is a slice of the sorted order
+  - a since/until window is two binary searches
+
+Rows whose date is missing or unparseable sort as the oldest items (as if
+dated 1970-01-01) and are excluded from any since/until window.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+from .article_store import NumericColumn
+from .date_utils import parse_date_epoch
+
+
+class DateIndex:
+    """
+    Epoch seconds per row plus row numbers ordered by date.
+
+    Attributes:
+      - epochs: NumericColumn of epoch seconds per row (None if undated)
+      - order: dated row numbers, oldest first (ties keep snapshot order)
+      - undated: row numbers with no usable date, in snapshot order
+    """
+
+    def __init__(self, dates: Iterable[Any]):
+        self.epochs = NumericColumn(parse_date_epoch(d) for d in dates)
+
+        values = self.epochs.values
+        null = NumericColumn.NULL
+        dated = [row for row, v in enumerate(values) if v != null]
+        dated.sort(key=values.__getitem__)
+
+        self.order = array("I", dated)
+        self.undated = array("I", (row for row, v in enumerate(values) if v == null))
+        self._sorted_epochs = array("q", (values[row] for row in dated))
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def window_bounds(self, since: Optional[int], until: Optional[int]) -> Tuple[int, int]:
+        """
+        Positions [lo, hi) in `order` covering since <= epoch < until.
+        """
+        lo = 0 if since is None else bisect_left(self._sorted_epochs, since)
+        hi = len(self.order) if until is None else bisect_left(self._sorted_epochs, until)
+        return lo, max(lo, hi)
+
+    def rows(
+        self,
+        sort: str = "date_desc",
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[int]:
+        """
+        Up to `limit` row numbers in the requested order, within [since, until).
+
+        sort is "date_desc" or "date_asc"; anything else keeps snapshot order.
+        Without a window, undated rows are included as the oldest items. Only
+        the returned rows are copied, so "latest N" costs O(log n + N).
+        """
+        windowed = since is not None or until is not None
+
+        if sort not in ("date_desc", "date_asc"):
+            rows: Sequence[int] = range(len(self))
+            if windowed:
+                rows = sorted(self.window_rows(since, until))
+            return rows if limit is None else rows[:max(0, limit)]
+
+        lo, hi = self.window_bounds(since, until)
+        undated = array("I") if windowed else self.undated
+        if limit is None:
+            limit = (hi - lo) + len(undated)
+        limit = max(0, limit)
+
+        if sort == "date_asc":
+            head = undated[:limit]
+            return head + self.order[lo:min(hi, lo + limit - len(head))]
+
+        n = min(hi - lo, limit)
+        newest = self.order[hi - n:hi][::-1]
+        return newest + undated[:limit - n]
+
+    def count(self, since: Optional[int] = None, until: Optional[int] = None) -> int:
+        """
+        Number of rows rows() would return without a limit.
+        """
+        if since is None and until is None:
+            return len(self)
+        lo, hi = self.window_bounds(since, until)
+        return hi - lo
+
+    def window_rows(self, since: Optional[int], until: Optional[int]) -> Sequence[int]:
+        """
+        Row numbers dated within [since, until), in date order.
+        """
+        lo, hi = self.window_bounds(since, until)
+        return self.order[lo:hi]
+
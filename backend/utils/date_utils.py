@@ -1,6 +1,6 @@
 # backend/utils/date_utils.py
 
-from datetime import datetime
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import Optional
 
@@ -17,3 +17,31 @@ def parse_rss_date(date_str: Optional[str]) -> Optional[datetime]:
         return parsedate_to_datetime(date_str)
     except Exception:
         return None
+
+
+def to_epoch(dt: Optional[datetime]) -> Optional[int]:
+    """
+    Seconds since the Unix epoch; naive datetimes are taken as UTC.
+    """
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def parse_date_epoch(date_str: Optional[str]) -> Optional[int]:
+    """
+    Parses an article date to epoch seconds, or None if it can't be parsed.
+
+    Accepts RSS dates (see parse_rss_date) and ISO 8601 dates/datetimes.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    dt = parse_rss_date(date_str)
+    if dt is None:
+        try:
+            dt = datetime.fromisoformat(date_str.strip())
+        except ValueError:
+            return None
+    return to_epoch(dt)
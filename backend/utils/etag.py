@@ -0,0 +1,120 @@
+"""
+backend/utils/etag.py
+
+Conditional GET support for the snapshot-backed analytics endpoints.
+
+Every GET response from /themes, /clusters, /map-data, /report-data, /trends,
+/articles and /dashboard is a pure function of the snapshot version, the path and the query
+parameters, so a strong ETag can be computed from those alone -- before the
+route runs. A matching If-None-Match is answered with 304 straight from this
+middleware, without touching the router, the aggregation or the JSON encoder.
+"""
+
+import hashlib
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_ETAG_PATHS = (
+    "/themes", "/clusters", "/map-data", "/report-data", "/trends", "/articles", "/dashboard",
+)
+
+
+def make_etag(version: str, path: str, query_string: bytes) -> str:
+    """
+    Strong ETag for (snapshot version, path, normalized query params).
+
+    Query params are sorted so ?a=1&b=2 and ?b=2&a=1 share a tag.
+    """
+    params = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+    h = hashlib.blake2b(digest_size=12)
+    h.update(version.encode())
+    h.update(b"\0")
+    h.update(path.encode())
+    for k, v in params:
+        h.update(b"\0")
+        h.update(k.encode())
+        h.update(b"=")
+        h.update(v.encode())
+    return f'"{h.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match uses weak comparison: W/ prefixes are ignored.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def snapshot_version(scope: Scope) -> Optional[str]:
+    """
+    Version of the snapshot the app serves, or None before it is loaded.
+    """
+    app = scope.get("app")
+    snapshot = getattr(getattr(app, "state", None), "snapshot", None)
+    return getattr(snapshot, "version", None)
+
+
+class ConditionalGetMiddleware:
+    """
+    Pure ASGI middleware adding ETag/Cache-Control and answering 304s.
+
+    Only GET/HEAD requests to `paths` are handled; headers are added to 200
+    responses only, so validation errors are never cached.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str] = DEFAULT_ETAG_PATHS,
+        max_age: int = 300,
+        get_version: Callable[[Scope], Optional[str]] = snapshot_version,
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.cache_control = f"public, max-age={max_age}".encode()
+        self.get_version = get_version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        version = self.get_version(scope)
+        if version is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = make_etag(version, scope["path"], scope.get("query_string", b""))
+        validators: List[Tuple[bytes, bytes]] = [
+            (b"etag", etag.encode()),
+            (b"cache-control", self.cache_control),
+        ]
+
+        for name, value in scope["headers"]:
+            if name == b"if-none-match" and etag_matches(value.decode("latin-1"), etag):
+                await send({"type": "http.response.start", "status": 304, "headers": validators})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers: List[Any] = list(message.get("headers", []))
+                headers.extend(validators)
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,57 @@
+"""
+backend/utils/fast_json.py
+
+Fast JSON responses for prebuilt payloads.
+
+Routers that return pydantic models pay for building one model per item,
+re-validating the result against `response_model`, running
+jsonable_encoder and finally the stdlib encoder. Payloads that are already
+plain dicts/lists of JSON types can skip all of that: routers keep
+`response_model=...` on the decorator (so the OpenAPI schema is unchanged)
+but return a FastJSONResponse, which FastAPI sends as-is.
+
+orjson is used when installed; otherwise the stdlib encoder with the same
+settings as Starlette's JSONResponse, so the bytes are identical either way.
+"""
+
+import json
+from typing import Any
+
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Compact UTF-8 JSON, byte-compatible with starlette's JSONResponse.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # e.g. lone surrogates or non-str keys; let the stdlib handle them
+            pass
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response for plain payloads, or for bytes already produced by dumps().
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -0,0 +1,102 @@
+"""
+backend/utils/map_geojson.py
+
+/map-data as a GeoJSON FeatureCollection.
+
+One Point feature per community area (at its approximate centroid, see
+community_areas), carrying everything the map page draws: article count,
+intensity (count relative to the busiest area, 0..1), theme counts, the top
+theme and top keywords. Areas without articles are included with zero
+counts so the map always shows all 77. Neighborhood values that are not a
+community area ("Chicago", "Unknown") become features with a null geometry,
+so feature counts still add up to the snapshot total.
+
+Neighborhood values naming the same area (e.g. "Pilsen" and "Lower West
+Side") are merged into that area's feature.
+
+The unfiltered collection is built once per snapshot, when the snapshot is
+built (see snapshot.build_snapshot), and served from Snapshot.responses.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .article_index import TOP_KEYWORDS, ArticleIndex, normalize_neighborhood
+from .community_areas import COMMUNITY_AREAS, area_for
+
+GEOJSON_RESPONSE_KEY = "map-data:geojson"
+GEOJSON_MEDIA_TYPE = "application/geo+json"
+
+
+class _AreaTotals:
+    __slots__ = ("count", "themes", "keywords")
+
+    def __init__(self):
+        self.count = 0
+        self.themes: Counter = Counter()
+        self.keywords: Counter = Counter()
+
+
+def _properties(name: str, number: Optional[int], totals: _AreaTotals, max_count: int) -> Dict[str, Any]:
+    theme_counts = dict(totals.themes.most_common())
+    return {
+        "neighborhood": name,
+        "community_area": number,
+        "article_count": totals.count,
+        "intensity": round(totals.count / max_count, 4) if number is not None and max_count else None,
+        "theme_counts": theme_counts,
+        "top_theme": next(iter(theme_counts), None),
+        "top_keywords": [k for k, _ in totals.keywords.most_common(TOP_KEYWORDS)],
+    }
+
+
+def build_feature_collection(index: ArticleIndex, neighborhood: Optional[str] = None) -> Dict[str, Any]:
+    """
+    FeatureCollection over `index`; only `neighborhood`'s feature if given.
+    """
+    by_area: Dict[str, _AreaTotals] = {area.name: _AreaTotals() for area in COMMUNITY_AREAS}
+    unlocated: Dict[str, _AreaTotals] = {}
+
+    for key in index.neighborhood_keys:
+        stats = index.neighborhood(key)
+        area = area_for(key)
+        if area is not None:
+            totals = by_area[area.name]
+        else:
+            totals = unlocated.setdefault(key, _AreaTotals())
+        totals.count += stats.count
+        totals.themes.update(dict(stats.theme_distribution))
+        totals.keywords.update(dict(stats.top_keywords))
+
+    max_count = max((t.count for t in by_area.values()), default=0)
+
+    wanted: Optional[str] = None
+    if neighborhood is not None:
+        area = area_for(neighborhood)
+        wanted = area.name if area is not None else normalize_neighborhood(neighborhood)
+
+    features: List[Dict[str, Any]] = []
+    for area in COMMUNITY_AREAS:
+        if wanted is not None and area.name != wanted:
+            continue
+        features.append({
+            "type": "Feature",
+            "id": area.number,
+            "geometry": {"type": "Point", "coordinates": [area.lon, area.lat]},
+            "properties": _properties(area.name, area.number, by_area[area.name], max_count),
+        })
+    for key, totals in unlocated.items():
+        if wanted is not None and key != wanted:
+            continue
+        features.append({
+            "type": "Feature",
+            "geometry": None,
+            "properties": _properties(key, None, totals, max_count),
+        })
+
+    return {
+        "type": "FeatureCollection",
+        "total_articles": sum(f["properties"]["article_count"] for f in features),
+        "max_article_count": max_count,
+        "features": features,
+    }
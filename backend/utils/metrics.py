@@ -0,0 +1,301 @@
+"""
+backend/utils/metrics.py
+
+Request and snapshot metrics in the Prometheus text exposition format.
+
+MetricsMiddleware times every HTTP request and records, per route template
+(e.g. "/clusters/{topic_id}/articles", never the raw path):
+  - a latency histogram
+  - the number of requests in flight
+  - a response size histogram (body bytes, streamed bodies included)
+  - request counts by status code, and a separate error counter for
+    5xx responses and unhandled exceptions
+
+render_metrics() adds gauges for the snapshot being served (load and index
+build time, article count, column memory) and the process's resident memory,
+read at scrape time.
+
+Everything is recorded on the event loop thread with plain dict/list
+updates, so there are no locks and the per-request cost is a few
+microseconds. Histograms use fixed buckets; nothing grows with traffic
+except one series per (method, route, status) actually seen.
+"""
+
+import os
+import sys
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Label used for requests that match no route (404s, scanners), so random
+# paths cannot create new series.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with fixed upper bounds.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterable[Tuple[str, int]]:
+        total = 0
+        for bound, n in zip(self.bounds, self.counts):
+            total += n
+            yield _format_value(bound), total
+        yield "+Inf", self.count
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """
+    Per-route request metrics. One instance per app, shared by the
+    middleware (writes) and the /metrics route (reads).
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.sizes: Dict[Tuple[str, str], Histogram] = {}
+        self.in_flight: Dict[Tuple[str, str], int] = {}
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+
+    def request_started(self, key: Tuple[str, str]) -> None:
+        self.in_flight[key] = self.in_flight.get(key, 0) + 1
+
+    def request_finished(
+        self,
+        key: Tuple[str, str],
+        status: int,
+        seconds: float,
+        body_bytes: int,
+        failed: bool,
+    ) -> None:
+        self.in_flight[key] -= 1
+
+        latency = self.latency.get(key)
+        if latency is None:
+            latency = self.latency[key] = Histogram(LATENCY_BUCKETS)
+            self.sizes[key] = Histogram(SIZE_BUCKETS)
+        latency.observe(seconds)
+        self.sizes[key].observe(body_bytes)
+
+        counted = (key[0], key[1], status)
+        self.requests[counted] = self.requests.get(counted, 0) + 1
+        if failed or status >= 500:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    # ---------- exposition ----------
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+
+        lines.append("# HELP http_requests_total HTTP requests by route and status code.")
+        lines.append("# TYPE http_requests_total counter")
+        for (method, route, status), n in sorted(self.requests.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {n}")
+
+        lines.append("# HELP http_request_errors_total Requests that failed with a 5xx or an unhandled exception.")
+        lines.append("# TYPE http_request_errors_total counter")
+        for (method, route), n in sorted(self.errors.items()):
+            lines.append(f"http_request_errors_total{_labels(method=method, route=route)} {n}")
+
+        lines.append("# HELP http_requests_in_flight Requests currently being handled.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        for (method, route), n in sorted(self.in_flight.items()):
+            lines.append(f"http_requests_in_flight{_labels(method=method, route=route)} {n}")
+
+        self._render_histograms(
+            lines, "http_request_duration_seconds", "Request latency in seconds.", self.latency
+        )
+        self._render_histograms(
+            lines, "http_response_size_bytes", "Response body size in bytes.", self.sizes
+        )
+        return lines
+
+    @staticmethod
+    def _render_histograms(
+        lines: List[str], name: str, help_text: str, histograms: Dict[Tuple[str, str], Histogram]
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, route), h in sorted(histograms.items()):
+            for le, n in h.cumulative():
+                lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {n}")
+            labels = _labels(method=method, route=route)
+            lines.append(f"{name}_sum{labels} {_format_value(h.sum)}")
+            lines.append(f"{name}_count{labels} {h.count}")
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """
+    Current RSS from /proc on Linux; peak RSS from getrusage elsewhere.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (ImportError, OSError, ValueError):
+        return None
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _gauge(lines: List[str], name: str, help_text: str, value: Any, labels: str = "") -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} gauge")
+    lines.append(f"{name}{labels} {_format_value(value)}")
+
+
+def render_metrics(registry: MetricsRegistry, state: Any) -> str:
+    """
+    Full /metrics payload: request metrics plus snapshot and process gauges.
+    """
+    lines = registry.render()
+
+    snapshot = getattr(state, "snapshot", None)
+    if snapshot is not None:
+        _gauge(lines, "community_flow_snapshot_info", "Snapshot currently served.", 1,
+               _labels(version=snapshot.version, path=snapshot.path))
+        _gauge(lines, "community_flow_snapshot_articles", "Articles in the current snapshot.",
+               len(snapshot.articles))
+        _gauge(lines, "community_flow_snapshot_load_seconds",
+               "Seconds spent loading and indexing the current snapshot.", snapshot.load_seconds)
+        _gauge(lines, "community_flow_snapshot_index_build_seconds",
+               "Seconds spent building the article and search indexes for the current snapshot.",
+               snapshot.index_seconds)
+        _gauge(lines, "community_flow_snapshot_loaded_timestamp_seconds",
+               "Unix time the current snapshot was swapped in.", snapshot.loaded_at.timestamp())
+        nbytes = getattr(snapshot.articles, "nbytes", None)
+        if nbytes is not None:
+            _gauge(lines, "community_flow_snapshot_column_bytes",
+                   "Bytes held by the snapshot's column arrays (mapped or in memory).", nbytes())
+        _gauge(lines, "community_flow_search_index_bytes",
+               "Bytes held by the search index's posting lists and norms.", snapshot.search.nbytes())
+
+    pdf_cache = getattr(state, "pdf_cache", None)
+    if pdf_cache is not None:
+        lines.append("# HELP community_flow_pdf_cache_events_total Rendered-PDF cache lookups by outcome.")
+        lines.append("# TYPE community_flow_pdf_cache_events_total counter")
+        for event in ("hits", "misses", "coalesced", "evictions"):
+            lines.append(
+                f"community_flow_pdf_cache_events_total{_labels(event=event)} {getattr(pdf_cache, event)}"
+            )
+
+    compressed_cache = getattr(state, "compressed_cache", None)
+    if compressed_cache is not None:
+        lines.append("# HELP community_flow_compressed_cache_events_total Compressed-response cache lookups by outcome.")
+        lines.append("# TYPE community_flow_compressed_cache_events_total counter")
+        for event in ("hits", "misses", "evictions"):
+            lines.append(
+                f"community_flow_compressed_cache_events_total{_labels(event=event)} {getattr(compressed_cache, event)}"
+            )
+        _gauge(lines, "community_flow_compressed_cache_bytes",
+               "Bytes of gzip/brotli bodies cached for the current snapshot.", compressed_cache.size)
+
+    rss = resident_memory_bytes()
+    if rss is not None:
+        _gauge(lines, "process_resident_memory_bytes", "Resident memory size in bytes.", rss)
+    _gauge(lines, "process_start_time_seconds", "Unix time the metrics registry was created.",
+           registry.started_at)
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    Path template of the route that will handle `scope`.
+
+    Routes are matched up front (not read back from the scope afterwards) so
+    the in-flight gauge is labelled while the request is still running.
+    """
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    partial = None
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+        if match == Match.PARTIAL and partial is None:
+            partial = getattr(route, "path", None)
+    return partial or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware feeding a MetricsRegistry.
+
+    Should be the outermost middleware so latency includes everything the
+    client waits for (CORS, 304s answered by ConditionalGetMiddleware, ...).
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["method"], _route_template(scope))
+        registry = self.registry
+        status = 500
+        body_bytes = 0
+        failed = True
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        registry.request_started(key)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+            failed = False
+        finally:
+            registry.request_finished(key, status, time.perf_counter() - started, body_bytes, failed)
@@ -0,0 +1,130 @@
+"""
+backend/utils/pagination.py
+
+Cursor pagination and NDJSON streaming for article listings.
+
+Cursors are opaque to clients: a URL-safe token holding the snapshot version,
+the listing's since/until window and an offset into the group's row list. A
+cursor minted against one snapshot is rejected after a reload, and one
+replayed with a different window is rejected outright, instead of silently
+skipping or repeating articles.
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence
+
+from .fast_json import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Fields returned per article, matching schemas.ClusterArticle.
+ARTICLE_FIELDS = ("title", "date", "link", "source", "neighborhood")
+
+
+class CursorError(ValueError):
+    """
+    Raised for malformed cursors or cursors from another snapshot version.
+    """
+
+
+class CursorParamsError(CursorError):
+    """
+    Raised for a cursor replayed with different query params than it was
+    minted for (a client bug rather than a stale cursor).
+    """
+
+
+def window_key(since: Optional[int], until: Optional[int]) -> str:
+    """
+    The since/until window (epoch seconds) as stored in a cursor.
+    """
+    return f"{'' if since is None else since},{'' if until is None else until}"
+
+
+def encode_cursor(version: str, offset: int, window: str = ",") -> str:
+    raw = f"{version}:{window}:{offset}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str], version: str, window: str = ",") -> int:
+    """
+    Offset stored in `cursor` (0 if no cursor was given), which must have
+    been minted for `version` and `window` (see window_key).
+    """
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        cursor_version, cursor_window, offset = raw.rsplit(":", 2)
+        offset_int = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise CursorError("Malformed cursor.")
+    if cursor_version != version:
+        raise CursorError("Cursor is from an older snapshot; restart pagination.")
+    if cursor_window != window:
+        raise CursorParamsError("Cursor was issued for a different since/until window.")
+    if offset_int < 0:
+        raise CursorError("Malformed cursor.")
+    return offset_int
+
+
+def article_summary(a: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    The ClusterArticle projection of one article, as a plain dict.
+    """
+    out: Dict[str, Any] = {f: a.get(f) for f in ARTICLE_FIELDS}
+    out["themes"] = a.get("themes") or []
+    out["keywords"] = a.get("keywords") or []
+    return out
+
+
+def article_list_item(a: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    The ArticleListItem projection: ClusterArticle fields plus topic_id.
+    """
+    out = article_summary(a)
+    out["topic_id"] = a.get("topic_id")
+    return out
+
+
+def paginate(
+    rows: Sequence[Mapping[str, Any]],
+    version: str,
+    cursor: Optional[str],
+    limit: int,
+    window: str = ",",
+) -> Dict[str, Any]:
+    """
+    One page of `rows` starting at `cursor`, plus the cursor for the next page.
+    """
+    offset = decode_cursor(cursor, version, window)
+    page = rows[offset:offset + limit]
+    end = offset + len(page)
+    return {
+        "total": len(rows),
+        "articles": [article_summary(a) for a in page],
+        "next_cursor": encode_cursor(version, end, window) if end < len(rows) else None,
+    }
+
+
+def iter_ndjson(
+    rows: Sequence[Mapping[str, Any]],
+    offset: int = 0,
+    batch_size: int = 200,
+) -> Iterator[bytes]:
+    """
+    Yield rows[offset:] as NDJSON, `batch_size` lines per chunk.
+
+    Rows are decoded and serialized one at a time, so memory stays constant
+    regardless of how many articles are streamed.
+    """
+    lines = []
+    for a in rows[offset:]:
+        lines.append(dumps(article_summary(a)))
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
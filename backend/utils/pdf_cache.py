@@ -0,0 +1,201 @@
+"""
+backend/utils/pdf_cache.py
+
+Rendered-PDF cache for /report-pdf.
+
+Rendering a report with reportlab is CPU-bound and the output only depends on
+the snapshot version and the report parameters, so:
+  - finished PDFs are kept in a byte-bounded LRU keyed by (version, params)
+  - concurrent requests for the same key await one shared render
+  - renders run in a process pool so they never hold the API's GIL; a pool
+    broken by a dying worker (OOM, crash) is replaced, see RenderPool
+"""
+
+import asyncio
+import multiprocessing
+import sys
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .pdf_service import generate_weekly_report_pdf
+
+
+def shutdown_executor(executor: Executor) -> None:
+    """
+    Shut down without waiting, dropping queued work where the Python
+    version supports it (cancel_futures is 3.9+).
+    """
+    if sys.version_info >= (3, 9):
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        executor.shutdown(wait=False)
+
+
+class RenderPool:
+    """
+    Lazily started process pool for PDF renders.
+
+    When a worker dies, ProcessPoolExecutor is broken for good and fails
+    every later submission, so the broken pool is dropped and the render
+    retried once in a new one: renders that merely shared the pool with the
+    dying worker succeed, one that kills its worker again fails.
+    """
+
+    def __init__(self, max_workers: int = 2, executor: Optional[Executor] = None):
+        self.max_workers = max_workers
+        self._executor = executor
+        self.restarts = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # spawn: the API process runs threads (snapshot watcher, threadpool),
+            # which fork() would copy in an undefined state.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _drop(self, broken: Executor) -> None:
+        # concurrent renders all see the same broken pool; replace it once
+        if self._executor is broken:
+            self._executor = None
+            self.restarts += 1
+            shutdown_executor(broken)
+
+    async def render(self, report_data: Dict[str, Any]) -> bytes:
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, generate_weekly_report_pdf, report_data)
+            except BrokenProcessPool:
+                self._drop(executor)
+                if attempt:
+                    raise
+        raise AssertionError("unreachable")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            shutdown_executor(self._executor)
+            self._executor = None
+
+
+class PdfCache:
+    """
+    Byte-bounded LRU of rendered PDFs with single-flight rendering.
+
+    Must only be used from one event loop; all bookkeeping happens on the
+    loop thread, so no locks are needed.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_workers: int = 2,
+        executor: Optional[Executor] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self._pool = RenderPool(max_workers, executor)
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._size = 0
+        self._inflight: Dict[Hashable, "asyncio.Future[bytes]"] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    # ---------- pool ----------
+
+    def shutdown(self) -> None:
+        self._pool.shutdown()
+
+    # ---------- LRU ----------
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        pdf = self._entries.get(key)
+        if pdf is not None:
+            self._entries.move_to_end(key)
+        return pdf
+
+    def put(self, key: Hashable, pdf: bytes) -> None:
+        if len(pdf) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = pdf
+        self._size += len(pdf)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "inflight": len(self._inflight),
+            "pool_restarts": self._pool.restarts,
+        }
+
+    # ---------- render ----------
+
+    async def get_or_render(
+        self,
+        key: Hashable,
+        build_report_data: Callable[[], Dict[str, Any]],
+    ) -> bytes:
+        """
+        Return the cached PDF for `key`, rendering it at most once.
+
+        `build_report_data` is only called on a miss, in the default thread
+        pool; the resulting payload is rendered in the process pool. The render
+        runs as its own task, so a client disconnecting does not cancel it for
+        the other requests waiting on the same key.
+        """
+        pdf = self.get(key)
+        if pdf is not None:
+            self.hits += 1
+            return pdf
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._render(key, build_report_data))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._render_done(key, t))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _render(
+        self,
+        key: Hashable,
+        build_report_data: Callable[[], Dict[str, Any]],
+    ) -> bytes:
+        loop = asyncio.get_running_loop()
+        report_data = await loop.run_in_executor(None, build_report_data)
+        pdf = await self._pool.render(report_data)
+        self.put(key, pdf)
+        return pdf
+
+    def _render_done(self, key: Hashable, task: "asyncio.Future[bytes]") -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every waiter went away.
+            task.exception()
@@ -1,17 +1,62 @@
 import io
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any
+from xml.sax.saxutils import escape
 
 from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import StyleSheet1, getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 
+# Latest items listed when the payload does not say otherwise.
+DEFAULT_ITEMS_SHOWN = 5
+
+
+# Styles are built once per process (each render worker keeps its own) and
+# shared by every document; flowables only read them. The fonts are
+# reportlab's built-in Helvetica family, so there is nothing to register.
+@lru_cache(maxsize=None)
+def _styles() -> StyleSheet1:
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def _table_style() -> TableStyle:
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ])
+
+
+def _escaped(filters: Dict[str, Any]) -> Dict[str, Any]:
+    # Filter values come from the request and end up in Paragraph markup.
+    return {k: escape(str(v)) if v is not None else None for k, v in filters.items()}
+
+
+def _filters_line(filters: Dict[str, Any]) -> str:
+    """
+    Paragraph markup describing `filters` (already escaped).
+    """
+    parts = []
+    if filters.get("neighborhood"):
+        parts.append(f"Neighborhood: {filters['neighborhood']}")
+    if filters.get("theme") is not None:
+        parts.append(f"Theme: {filters['theme']}")
+    if filters.get("since") or filters.get("until"):
+        parts.append(f"Articles dated {filters.get('since') or '…'} to {filters.get('until') or 'now'}")
+    return " · ".join(parts)
+
 
 def generate_weekly_report_pdf(report_data: Dict[str, Any]) -> bytes:
     """
     Build Community Flow Weekly Wellness PDF from /report-data payload
+
+    Optional keys: "filters" (neighborhood / theme / since / until the
+    payload was restricted to, printed under the header) and "items_shown"
+    (how many latest items to list).
     """
     buffer = io.BytesIO()
 
@@ -24,15 +69,23 @@ def generate_weekly_report_pdf(report_data: Dict[str, Any]) -> bytes:
         bottomMargin=50,
     )
 
-    styles = getSampleStyleSheet()
+    styles = _styles()
+    filters = _escaped(report_data.get("filters") or {})
     story = []
 
     # ---------- Header ----------
     story.append(Paragraph("COMMUNITY FLOW", styles["Title"]))
-    story.append(Paragraph(
-        "Weekly Wellness Weather Report — Chicago",
-        styles["Heading2"]
-    ))
+    if filters:
+        story.append(Paragraph(
+            f"Wellness Weather Report — {filters.get('neighborhood') or 'Chicago'}",
+            styles["Heading2"]
+        ))
+        story.append(Paragraph(_filters_line(filters), styles["Normal"]))
+    else:
+        story.append(Paragraph(
+            "Weekly Wellness Weather Report — Chicago",
+            styles["Heading2"]
+        ))
     story.append(Spacer(1, 12))
 
     generated_date = datetime.now().strftime("%B %d, %Y")
@@ -58,11 +111,7 @@ def generate_weekly_report_pdf(report_data: Dict[str, Any]) -> bytes:
         ])
 
     theme_table = Table(theme_rows, colWidths=[2 * inch, 2 * inch])
-    theme_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
-    ]))
+    theme_table.setStyle(_table_style())
     story.append(theme_table)
     story.append(Spacer(1, 12))
 
@@ -77,18 +126,15 @@ def generate_weekly_report_pdf(report_data: Dict[str, Any]) -> bytes:
         ])
 
     cluster_table = Table(cluster_rows, colWidths=[2 * inch, 2 * inch])
-    cluster_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
-    ]))
+    cluster_table.setStyle(_table_style())
     story.append(cluster_table)
     story.append(Spacer(1, 12))
 
     # ---------- Latest Articles ----------
-    story.append(Paragraph("Latest 5 Items", styles["Heading3"]))
+    shown = report_data.get("latest_items", [])[:report_data.get("items_shown", DEFAULT_ITEMS_SHOWN)]
+    story.append(Paragraph(f"Latest {len(shown)} Items", styles["Heading3"]))
 
-    for article in report_data.get("latest_items", [])[:5]:
+    for article in shown:
         story.append(Paragraph(
             f"<b>{article.get('title')}</b>",
             styles["Normal"]
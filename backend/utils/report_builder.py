@@ -1,42 +1,84 @@
 # backend/utils/report_builder.py
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 from collections import Counter
 
-from .data_loader import load_articles
+from .article_index import ArticleIndex, normalize_neighborhood
+from .article_store import iter_column, value_getter
+from .data_loader import get_cached_articles
+from .date_index import DateIndex
 
 
-def build_report_data(limit: int = 10, sort: str = "date_desc") -> Dict[str, Any]:
+def build_report_data(
+    limit: int = 10,
+    sort: str = "date_desc",
+    articles: Optional[Sequence[Mapping[str, Any]]] = None,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+    index: Optional[ArticleIndex] = None,
+    neighborhood: Optional[str] = None,
+    theme: Optional[int] = None,
+) -> Dict[str, Any]:
     """
     Pure function that returns the same payload as /report-data.
     No FastAPI Request object needed.
+
+    Routers pass the snapshot already held in app.state (and its index, whose
+    DateIndex answers ordering and since/until windows by binary search);
+    standalone callers fall back to the process-wide snapshot cache instead
+    of re-parsing the file.
+
+    since/until are epoch seconds; when given, every section of the report
+    covers only articles dated in [since, until). `neighborhood` and `theme`
+    narrow it the same way (report jobs, see utils/report_jobs.py).
     """
-    items: List[Dict[str, Any]] = load_articles()  # list of articles from snapshot
+    items: Sequence[Mapping[str, Any]] = articles if articles is not None else get_cached_articles()
+
+    if neighborhood is not None or theme is not None:
+        if index is None or index.articles is not items or index.dates is None:
+            index = ArticleIndex(items)
+        return _filtered_report_data(items, index, limit, sort, since, until, neighborhood, theme)
+
+    if index is not None and index.articles is items and index.dates is not None:
+        dates = index.dates
+    else:
+        dates = DateIndex(iter_column(items, "date"))
 
     # --- sort ---
-    # Assuming item["date"] is a comparable string; if you already parse dates, reuse your existing logic
-    if sort == "date_desc":
-        items_sorted = sorted(items, key=lambda x: x.get("date", ""), reverse=True)
-    elif sort == "date_asc":
-        items_sorted = sorted(items, key=lambda x: x.get("date", ""))
+    # Chronological by parsed date; undated items count as the oldest.
+    # plain dicts: the payload is JSON-encoded and pickled for PDF rendering
+    latest_items = [dict(items[row]) for row in dates.rows(sort, since, until, limit=int(limit))]
+
+    if since is None and until is None:
+        themes_column = iter_column(items, "themes")
+        topic_column = iter_column(items, "topic_id")
     else:
-        items_sorted = items
+        window = sorted(dates.window_rows(since, until))
+        get_themes = value_getter(items, "themes")
+        get_topic = value_getter(items, "topic_id")
+        themes_column = (get_themes(row) for row in window)
+        topic_column = (get_topic(row) for row in window)
 
-    latest_items = items_sorted[: int(limit)]
+    return _report_payload(dates.count(since, until), themes_column, topic_column, latest_items)
 
+
+def _report_payload(
+    total: int,
+    themes_column: Iterable[Any],
+    topic_column: Iterable[Any],
+    latest_items: List[Dict[str, Any]],
+) -> Dict[str, Any]:
     # --- theme distribution ---
     theme_counter = Counter()
-    for it in items:
-        themes = it.get("themes") or []
-        for t in themes:
+    for themes in themes_column:
+        for t in themes or []:
             theme_counter[int(t)] += 1
 
     theme_distribution = [{"id": k, "count": v} for k, v in sorted(theme_counter.items())]
 
     # --- top clusters ---
     cluster_counter = Counter()
-    for it in items:
-        topic_id = it.get("topic_id")
+    for topic_id in topic_column:
         if topic_id is not None:
             cluster_counter[int(topic_id)] += 1
 
@@ -46,8 +88,57 @@ def build_report_data(limit: int = 10, sort: str = "date_desc") -> Dict[str, Any
     ]
 
     return {
-        "total_articles": len(items),
+        "total_articles": total,
         "theme_distribution": theme_distribution,
         "top_clusters": top_clusters,
         "latest_items": latest_items,
     }
+
+
+def _filtered_report_data(
+    items: Sequence[Mapping[str, Any]],
+    index: ArticleIndex,
+    limit: int,
+    sort: str,
+    since: Optional[int],
+    until: Optional[int],
+    neighborhood: Optional[str],
+    theme: Optional[int],
+) -> Dict[str, Any]:
+    """
+    build_report_data restricted to one neighborhood and/or theme.
+
+    Starts from the smallest of the index's row groups, so the cost follows
+    the size of the selection rather than the snapshot.
+    """
+    dates = index.dates
+    groups: List[Sequence[int]] = []
+    if neighborhood is not None:
+        groups.append(index.neighborhood_rows.get(normalize_neighborhood(neighborhood), ()))
+    if theme is not None:
+        groups.append(index.theme_rows.get(str(theme), ()))
+    if since is not None or until is not None:
+        groups.append(dates.window_rows(since, until))
+
+    groups.sort(key=len)
+    selected = set(groups[0])
+    for rows in groups[1:]:
+        selected.intersection_update(rows)
+
+    latest_items: List[Dict[str, Any]] = []
+    if selected and limit > 0:
+        for row in dates.rows(sort, since, until):
+            if row in selected:
+                latest_items.append(dict(items[row]))
+                if len(latest_items) >= limit:
+                    break
+
+    ordered = sorted(selected)
+    get_themes = value_getter(items, "themes")
+    get_topic = value_getter(items, "topic_id")
+    return _report_payload(
+        len(ordered),
+        (get_themes(row) for row in ordered),
+        (get_topic(row) for row in ordered),
+        latest_items,
+    )
@@ -0,0 +1,403 @@
+"""
+backend/utils/report_jobs.py
+
+Background PDF report jobs for /reports.
+
+Parameterized reports (one neighborhood, one theme, a custom date range)
+can take seconds to render, so they do not run inside a request: POST
+/reports queues a job and returns its id, the client polls GET
+/reports/{id} and downloads GET /reports/{id}/pdf once it is done.
+
+  - A job id is a hash of (snapshot version, parameters, generation date),
+    so submitting a report that is already queued, running or done returns
+    that job instead of rendering it again.
+  - At most `max_workers` jobs render at once, each in a process of the
+    queue's own RenderPool (see pdf_cache); at most `max_pending` more wait
+    for a slot, beyond that submissions are refused.
+  - Each job's status (<id>.json) and finished PDF (<id>.pdf) are written to
+    `storage_dir`, so any worker process can answer status and download
+    requests and results survive restarts. A periodic sweep deletes files
+    older than `ttl_seconds`.
+  - A queued or running job records its owner: the pid of the process
+    running it plus that process's start time (Linux) or a token drawn at
+    import. If no live process matches the owner (a restart, a crash -- even
+    one that brought the server back under the same pid, as PID 1 in a
+    container), the job is reported failed and the next identical submission
+    queues it again.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from concurrent.futures import Executor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from .pdf_cache import RenderPool
+
+logger = logging.getLogger(__name__)
+
+REPORT_DIR_ENV = "COMMUNITY_FLOW_REPORT_DIR"
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class QueueFull(Exception):
+    """
+    Raised by submit() when `max_pending` jobs are already waiting.
+    """
+
+
+def get_report_dir() -> Path:
+    """
+    data/reports under the project root, or COMMUNITY_FLOW_REPORT_DIR.
+    """
+    override = os.environ.get(REPORT_DIR_ENV)
+    if override:
+        return Path(override).resolve()
+    return Path(__file__).resolve().parents[2] / "data" / "reports"
+
+
+def job_id_for(version: str, params: Dict[str, Any], day: date) -> str:
+    payload = json.dumps({"version": version, "params": params, "day": day.isoformat()}, sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Stands in for the process start time where /proc is not available.
+_RUN_TOKEN = uuid.uuid4().hex
+
+
+def _process_started(pid: int) -> Optional[str]:
+    """
+    Start time of process `pid` in clock ticks since boot, from /proc (Linux
+    only); None where it cannot be read.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # the command name may contain spaces; starttime is the 20th field after it
+    fields = stat.rsplit(b")", 1)[-1].split()
+    return fields[19].decode() if len(fields) > 19 else None
+
+
+def current_owner() -> str:
+    """
+    Owner id of this process run: "<pid>:<start time or run token>".
+    """
+    pid = os.getpid()
+    return f"{pid}:{_process_started(pid) or _RUN_TOKEN}"
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    if os.name == "nt":
+        # os.kill() would terminate the process on Windows
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        kernel32.CloseHandle(handle)
+        return code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """
+    Whether the process run `owner` (see current_owner) is still running.
+
+    A live pid alone is not enough: after a restart the server may get the
+    same pid again, so its start time must match too where it can be read.
+    """
+    if not owner:
+        return False
+    if owner == current_owner():
+        return True
+    pid, _, started = owner.partition(":")
+    try:
+        pid_int = int(pid)
+    except ValueError:
+        return False
+    if not _pid_alive(pid_int):
+        return False
+    running_since = _process_started(pid_int)
+    return running_since is None or running_since == started
+
+
+class ReportJob:
+    """
+    One report job; mirrored to <id>.json on every status change.
+    """
+
+    __slots__ = ("id", "params", "status", "owner", "created_at", "started_at", "finished_at", "error", "size_bytes")
+
+    def __init__(self, job_id: str, params: Dict[str, Any]):
+        self.id = job_id
+        self.params = params
+        self.status = QUEUED
+        self.owner: Optional[str] = current_owner()
+        self.created_at = _now()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.error: Optional[str] = None
+        self.size_bytes: Optional[int] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "owner": self.owner,
+            "params": self.params,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "size_bytes": self.size_bytes,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "ReportJob":
+        job = cls(data["job_id"], data.get("params") or {})
+        job.status = data.get("status", QUEUED)
+        job.owner = data.get("owner")
+        job.created_at = data.get("created_at") or job.created_at
+        job.started_at = data.get("started_at")
+        job.finished_at = data.get("finished_at")
+        job.error = data.get("error")
+        job.size_bytes = data.get("size_bytes")
+        return job
+
+
+class ReportJobQueue:
+    """
+    Deduplicating, bounded queue of PDF report jobs with on-disk results.
+
+    Like PdfCache, must only be used from one event loop.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Union[str, Path, None] = None,
+        ttl_seconds: float = 24 * 3600,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        executor: Optional[Executor] = None,
+    ):
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else get_report_dir()
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pool = RenderPool(max_workers, executor)
+        self._slots = asyncio.Semaphore(max_workers)
+        self._jobs: Dict[str, ReportJob] = {}
+        self._tasks: Dict[str, "asyncio.Future[None]"] = {}
+        self._sweeper: Optional["asyncio.Future[None]"] = None
+
+        self.submitted = 0
+        self.deduplicated = 0
+
+    # ---------- storage ----------
+
+    def pdf_path(self, job_id: str) -> Path:
+        return self.storage_dir / f"{job_id}.pdf"
+
+    def _meta_path(self, job_id: str) -> Path:
+        return self.storage_dir / f"{job_id}.json"
+
+    def _save(self, job: ReportJob) -> None:
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        path = self._meta_path(job.id)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job.to_json(), f)
+        os.replace(tmp_path, path)
+
+    def _expired(self, path: Path) -> bool:
+        try:
+            return time.time() - path.stat().st_mtime > self.ttl_seconds
+        except OSError:
+            return True
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        """
+        The job with `job_id` from this process or from disk; None if unknown
+        or expired.
+
+        A job queued or running in a process that no longer exists is
+        returned as failed.
+        """
+        if not _JOB_ID.match(job_id):
+            return None
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+
+        path = self._meta_path(job_id)
+        if self._expired(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                job = ReportJob.from_json(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        if job.status in (QUEUED, RUNNING) and not _owner_alive(job.owner):
+            job.status = FAILED
+            job.error = "abandoned: the process running this job exited"
+        return job
+
+    # ---------- jobs ----------
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == QUEUED)
+
+    def submit(
+        self,
+        params: Dict[str, Any],
+        version: str,
+        build_report_data: Callable[[], Dict[str, Any]],
+    ) -> ReportJob:
+        """
+        Queue a report, or return the identical job already known.
+
+        `build_report_data` runs in the default thread pool when the job
+        starts; its payload is rendered in the process pool. Failed and
+        abandoned jobs, and done jobs whose PDF has gone, are run again.
+        """
+        job_id = job_id_for(version, params, date.today())
+        existing = self.get(job_id)
+        if existing is not None and existing.status != FAILED:
+            if existing.status != DONE or not self._expired(self.pdf_path(job_id)):
+                self.deduplicated += 1
+                return existing
+
+        if self.pending >= self.max_pending:
+            raise QueueFull(f"{self.pending} report jobs already waiting")
+
+        job = ReportJob(job_id, params)
+        self._jobs[job_id] = job
+        self._save(job)
+        self.submitted += 1
+
+        task = asyncio.ensure_future(self._run(job, build_report_data))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda t: self._tasks.pop(job_id, None))
+        return job
+
+    async def _run(self, job: ReportJob, build_report_data: Callable[[], Dict[str, Any]]) -> None:
+        async with self._slots:
+            job.status = RUNNING
+            job.started_at = _now()
+            self._save(job)
+
+            loop = asyncio.get_running_loop()
+            try:
+                report_data = await loop.run_in_executor(None, build_report_data)
+                pdf = await self._pool.render(report_data)
+                await loop.run_in_executor(None, self._write_pdf, job.id, pdf)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Report job %s failed", job.id)
+                job.status = FAILED
+                job.error = str(e) or type(e).__name__
+            else:
+                job.status = DONE
+                job.size_bytes = len(pdf)
+            job.finished_at = _now()
+            self._save(job)
+
+    def _write_pdf(self, job_id: str, pdf: bytes) -> None:
+        path = self.pdf_path(job_id)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp_path, path)
+
+    # ---------- cleanup ----------
+
+    def sweep(self) -> int:
+        """
+        Delete result and status files older than the TTL; returns how many.
+
+        Jobs still queued or running in this process are left alone.
+        """
+        if not self.storage_dir.is_dir():
+            return 0
+        removed = 0
+        for path in self.storage_dir.iterdir():
+            job_id = path.name.split(".", 1)[0]
+            job = self._jobs.get(job_id)
+            if job is not None and job.status in (QUEUED, RUNNING):
+                continue
+            if not self._expired(path):
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+            self._jobs.pop(job_id, None)
+        return removed
+
+    async def _sweep_forever(self) -> None:
+        interval = max(60.0, self.ttl_seconds / 4)
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                removed = await loop.run_in_executor(None, self.sweep)
+                if removed:
+                    logger.info("Removed %d expired report files", removed)
+            except Exception:
+                logger.exception("Report sweep failed")
+            await asyncio.sleep(interval)
+
+    def start(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.ensure_future(self._sweep_forever())
+
+    def shutdown(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._pool.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            **counts,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "pool_restarts": self._pool.restarts,
+        }
@@ -0,0 +1,306 @@
+"""
+backend/utils/rollups.py
+
+Per-ISO-week rollups of theme, topic and neighborhood counts.
+
+Every snapshot is a fresh export of whatever the scrapers currently see, so
+older articles drop out of it over time. The rollups are kept in a file next
+to the snapshot (google_topics.rollups.json) and only ever grow: each time a
+new snapshot arrives, articles not seen before are added to the counts of
+their ISO week. Articles are identified by a 64-bit hash of their link
+(title + date when there is no link); an article keeps the week, themes,
+topic and neighborhood it had when it was first counted.
+
+Only the pipeline (nlp/topic_model.py save_data) writes the file. The
+backend reads it with read_rollups and, if it is missing or behind the
+snapshot being served, folds the snapshot into it in memory only.
+
+/trends reads week series straight from the rollups and never touches
+article-level data.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+from array import array
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .article_index import normalize_neighborhood
+from .article_store import iter_column
+from .date_index import DateIndex
+
+logger = logging.getLogger(__name__)
+
+ROLLUPS_SUFFIX = ".rollups.json"
+FORMAT_VERSION = 1
+
+KINDS = ("theme", "topic", "neighborhood")
+
+
+def rollups_path_for(data_file: Union[str, Path]) -> Path:
+    """
+    data/cleaned/google_topics.json -> data/cleaned/google_topics.rollups.json
+    """
+    data_file = Path(data_file)
+    return data_file.with_name(data_file.stem + ROLLUPS_SUFFIX)
+
+
+def iso_week(epoch: int) -> str:
+    year, week, _ = datetime.fromtimestamp(epoch, timezone.utc).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def week_of(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def week_start(label: str) -> date:
+    """
+    Monday of an ISO week label ("2025-W48").
+    """
+    year, week = label.split("-W")
+    return date.fromisocalendar(int(year), int(week), 1)
+
+
+def week_range(last: str, n: int) -> List[str]:
+    """
+    The `n` consecutive ISO weeks ending with `last`, oldest first.
+    """
+    monday = week_start(last)
+    return [week_of(monday - timedelta(weeks=i)) for i in range(n - 1, -1, -1)]
+
+
+def article_key(link: Any, title: Any, date_value: Any) -> int:
+    ident = str(link) if link else f"{title}\0{date_value}"
+    return int.from_bytes(hashlib.blake2b(ident.encode("utf-8", "surrogatepass"), digest_size=8).digest(), "little")
+
+
+def _sort_keys(kind: str, keys: Iterable[str]) -> List[str]:
+    # topic ids sort numerically, as in /clusters
+    if kind == "topic":
+        return sorted(keys, key=int)
+    return sorted(keys)
+
+
+class WeekCounts:
+    """
+    Counts for one ISO week.
+    """
+
+    __slots__ = ("total", "theme", "topic", "neighborhood")
+
+    def __init__(self):
+        self.total = 0
+        self.theme: Counter = Counter()
+        self.topic: Counter = Counter()
+        self.neighborhood: Counter = Counter()
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "theme": dict(self.theme),
+            "topic": dict(self.topic),
+            "neighborhood": dict(self.neighborhood),
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "WeekCounts":
+        counts = cls()
+        counts.total = int(data.get("total", 0))
+        for kind in KINDS:
+            getattr(counts, kind).update({str(k): int(v) for k, v in data.get(kind, {}).items()})
+        return counts
+
+
+class WeeklyRollups:
+    """
+    ISO week -> WeekCounts, plus the snapshot version last absorbed.
+    """
+
+    def __init__(self, weeks: Optional[Dict[str, WeekCounts]] = None, absorbed: Optional[str] = None):
+        self.weeks: Dict[str, WeekCounts] = weeks or {}
+        self.absorbed = absorbed
+
+    @property
+    def latest_week(self) -> Optional[str]:
+        return max(self.weeks, key=week_start) if self.weeks else None
+
+    def absorb(
+        self,
+        articles: Sequence[Mapping[str, Any]],
+        seen: set,
+        dates: Optional[DateIndex] = None,
+    ) -> int:
+        """
+        Add every dated article whose key is not in `seen` (updated in place).
+
+        Returns the number of articles added.
+        """
+        if dates is None:
+            dates = DateIndex(iter_column(articles, "date"))
+        epochs = dates.epochs
+        columns = zip(
+            epochs,
+            iter_column(articles, "link"),
+            iter_column(articles, "title"),
+            iter_column(articles, "date"),
+            iter_column(articles, "themes"),
+            iter_column(articles, "topic_id"),
+            iter_column(articles, "neighborhood"),
+        )
+
+        added = 0
+        for epoch, link, title, date_value, themes, tid, neighborhood in columns:
+            if epoch is None:
+                continue
+            key = article_key(link, title, date_value)
+            if key in seen:
+                continue
+            seen.add(key)
+            added += 1
+
+            label = iso_week(epoch)
+            week = self.weeks.get(label)
+            if week is None:
+                week = self.weeks[label] = WeekCounts()
+            week.total += 1
+            if isinstance(themes or [], list):
+                for t in themes or []:
+                    week.theme[str(t)] += 1
+            else:
+                week.theme[str(themes)] += 1
+            if tid is not None:
+                week.topic[str(tid)] += 1
+            week.neighborhood[normalize_neighborhood(neighborhood)] += 1
+        return added
+
+    # ---------- queries ----------
+
+    def keys(self, kind: str) -> List[str]:
+        found = set()
+        for week in self.weeks.values():
+            found.update(getattr(week, kind))
+        return _sort_keys(kind, found)
+
+    def totals(self, weeks: Sequence[str]) -> List[int]:
+        return [self.weeks[w].total if w in self.weeks else 0 for w in weeks]
+
+    def series(self, kind: str, key: str, weeks: Sequence[str]) -> List[int]:
+        out = []
+        for w in weeks:
+            week = self.weeks.get(w)
+            out.append(getattr(week, kind).get(key, 0) if week is not None else 0)
+        return out
+
+
+# ---------- persistence ----------
+
+def _pack_seen(seen: Iterable[int]) -> str:
+    return base64.b64encode(array("Q", sorted(seen)).tobytes()).decode("ascii")
+
+
+def _unpack_seen(blob: str) -> set:
+    keys = array("Q")
+    keys.frombytes(base64.b64decode(blob))
+    return set(keys)
+
+
+def load_rollups(path: Union[str, Path]) -> Tuple[WeeklyRollups, set]:
+    """
+    (rollups, seen article keys) from `path`; empty if the file is missing.
+
+    Raises ValueError if the file exists but cannot be used.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return WeeklyRollups(), set()
+
+    if data.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported rollups format version {data.get('format_version')}: {path}")
+    weeks = {label: WeekCounts.from_json(counts) for label, counts in data.get("weeks", {}).items()}
+    return WeeklyRollups(weeks, data.get("absorbed")), _unpack_seen(data.get("seen", ""))
+
+
+def save_rollups(path: Union[str, Path], rollups: WeeklyRollups, seen: Iterable[int]) -> None:
+    """
+    Write atomically; each process uses its own temp file.
+    """
+    path = Path(path)
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "absorbed": rollups.absorbed,
+        "weeks": {label: rollups.weeks[label].to_json() for label in sorted(rollups.weeks, key=week_start)},
+        "seen": _pack_seen(seen),
+    }
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def update_rollups(
+    data_file: Union[str, Path],
+    articles: Sequence[Mapping[str, Any]],
+    version: str,
+    dates: Optional[DateIndex] = None,
+) -> WeeklyRollups:
+    """
+    Fold snapshot `version` into the rollups stored next to `data_file`.
+
+    A version that was already absorbed is only read back. An unreadable
+    rollups file is started over (and logged). Used by the pipeline; the
+    backend only calls read_rollups.
+    """
+    path = rollups_path_for(data_file)
+    try:
+        rollups, seen = load_rollups(path)
+    except (ValueError, OSError) as e:
+        logger.warning("Rebuilding unreadable rollups file %s (%s)", path, e)
+        rollups, seen = WeeklyRollups(), set()
+
+    if rollups.absorbed == version:
+        return rollups
+
+    added = rollups.absorb(articles, seen, dates)
+    rollups.absorbed = version
+    try:
+        save_rollups(path, rollups, seen)
+    except OSError as e:
+        logger.warning("Could not write rollups file %s (%s)", path, e)
+    logger.info("Rollups updated with %d new articles from snapshot %s", added, version)
+    return rollups
+
+
+def read_rollups(
+    data_file: Union[str, Path],
+    articles: Sequence[Mapping[str, Any]],
+    version: str,
+    dates: Optional[DateIndex] = None,
+) -> WeeklyRollups:
+    """
+    The rollups stored next to `data_file`, without ever writing them.
+
+    If the file is missing, unreadable or has not absorbed `version` (the
+    snapshot was not written by the pipeline), the snapshot is folded into
+    the rollups in memory.
+    """
+    path = rollups_path_for(data_file)
+    try:
+        rollups, seen = load_rollups(path)
+    except (ValueError, OSError) as e:
+        logger.warning("Ignoring unreadable rollups file %s (%s)", path, e)
+        rollups, seen = WeeklyRollups(), set()
+
+    if rollups.absorbed != version:
+        added = rollups.absorb(articles, seen, dates)
+        rollups.absorbed = version
+        logger.info("Rollups file %s is behind snapshot %s; %d articles counted in memory", path, version, added)
+    return rollups
@@ -0,0 +1,191 @@
+"""
+backend/utils/search_index.py
+
+Inverted index with BM25 ranking for /search.
+
+Built once per snapshot over each article's title, clean_text and keywords,
+tokenized with the pipeline's own scripts/clean_google_clean_json.tokenize
+(lowercase, strip punctuation, split on whitespace), so queries match the
+keywords the pipeline extracted.
+
+Posting lists are stored compressed: row numbers as gaps from the previous
+row, packed into the narrowest array type that fits (1, 2 or 4 bytes per
+gap), and term frequencies as one byte each. Decoding a list is a single
+itertools.accumulate over the gaps, which runs at C speed.
+
+Queries use OR semantics and score with BM25 (k1=1.2, b=0.75). Terms are
+processed rarest first; once no document outside the current candidates could
+still reach the top `k` (MaxScore), the remaining, more common terms only
+update existing candidates by binary search instead of scanning their whole
+posting list.
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate, chain
+from operator import sub
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from scripts.clean_google_clean_json import tokenize
+
+from .article_store import iter_column
+
+K1 = 1.2
+B = 0.75
+
+def _article_tokens(title: Any, clean_text: Any, keywords: Any) -> List[str]:
+    tokens = tokenize(str(title or "")) + tokenize(str(clean_text or ""))
+    for k in keywords or []:
+        tokens.extend(tokenize(str(k)))
+    return tokens
+
+
+class PostingList:
+    """
+    Rows containing one term (gap-encoded) and the term's frequency in each.
+    """
+
+    __slots__ = ("gaps", "tfs")
+
+    def __init__(self, rows: Sequence[int], tfs: array):
+        gaps = list(map(sub, rows, chain((0,), rows)))
+        widest = max(gaps) if gaps else 0
+        typecode = "B" if widest < 1 << 8 else "H" if widest < 1 << 16 else "I"
+        self.gaps = array(typecode, gaps)
+        self.tfs = tfs
+
+    def __len__(self) -> int:
+        return len(self.gaps)
+
+    def rows(self) -> array:
+        return array("I", accumulate(self.gaps))
+
+    def nbytes(self) -> int:
+        return self.gaps.itemsize * len(self.gaps) + len(self.tfs)
+
+
+class SearchIndex:
+    """
+    term -> PostingList over one snapshot, plus per-row BM25 length norms.
+    """
+
+    def __init__(self, articles: Sequence[Mapping[str, Any]]):
+        building: Dict[str, Tuple[array, array]] = {}
+        lengths = array("I")
+
+        columns = zip(
+            iter_column(articles, "title"),
+            iter_column(articles, "clean_text"),
+            iter_column(articles, "keywords"),
+        )
+        for row, (title, clean_text, keywords) in enumerate(columns):
+            tokens = _article_tokens(title, clean_text, keywords)
+            lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                entry = building.get(term)
+                if entry is None:
+                    entry = building[term] = (array("I"), array("B"))
+                entry[0].append(row)
+                entry[1].append(min(tf, 255))
+
+        self.postings: Dict[str, PostingList] = {}
+        for term in list(building):
+            rows, tfs = building.pop(term)
+            self.postings[term] = PostingList(rows, tfs)
+
+        self.total_docs = len(lengths)
+        avgdl = (sum(lengths) / len(lengths)) if lengths else 0.0
+        # BM25 denominator term k1 * (1 - b + b * dl / avgdl), per row
+        self._norms = array(
+            "d", (K1 * (1 - B + B * dl / avgdl) if avgdl else K1 for dl in lengths)
+        )
+        self._min_norm = min(self._norms) if self._norms else K1
+
+    def __len__(self) -> int:
+        return self.total_docs
+
+    def nbytes(self) -> int:
+        return sum(p.nbytes() for p in self.postings.values()) + self._norms.itemsize * len(self._norms)
+
+    def idf(self, df: int) -> float:
+        n = self.total_docs
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        rows: Optional[Iterable[int]] = None,
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """
+        (number of matching rows, top `k` (row, score) pairs by BM25).
+
+        `rows` restricts the search to those row numbers (facet filters).
+        Ties are broken by row number so pages are stable.
+        """
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in self.postings]
+        if not terms or k <= 0:
+            return 0, []
+
+        allowed: Optional[Set[int]] = set(rows) if rows is not None else None
+        if allowed is not None and not allowed:
+            return 0, []
+
+        # rarest first: the best-scoring, cheapest terms seed the candidates
+        terms.sort(key=lambda t: len(self.postings[t]))
+        lists = [self.postings[t] for t in terms]
+        idfs = [self.idf(len(p)) for p in lists]
+        # a term adds at most idf * tf*(k1+1)/(tf + norm) with its largest tf
+        # and the smallest norm in the snapshot
+        upper_bounds = [
+            idf * max(p.tfs) * (K1 + 1) / (max(p.tfs) + self._min_norm) for p, idf in zip(lists, idfs)
+        ]
+
+        norms = self._norms
+        k1p = K1 + 1
+        scores: Dict[int, float] = {}
+        get = scores.get
+        decoded: List[array] = []
+        pruned = False
+        for i, (postings, idf) in enumerate(zip(lists, idfs)):
+            term_rows = postings.rows()
+            tfs = postings.tfs
+            decoded.append(term_rows)
+
+            remaining = sum(upper_bounds[i:])
+            if len(scores) >= k:
+                threshold = heapq.nlargest(k, scores.values())[-1]
+                pruned = remaining < threshold
+
+            if pruned or (allowed is not None and len(allowed) < len(term_rows)):
+                # probe the term's rows for each candidate; once pruned, only
+                # candidates that can still reach the top k are worth probing
+                if pruned:
+                    targets = [row for row, score in scores.items() if score + remaining >= threshold]
+                else:
+                    targets = allowed
+                n = len(term_rows)
+                for row in targets:
+                    j = bisect_left(term_rows, row)
+                    if j < n and term_rows[j] == row:
+                        tf = tfs[j]
+                        scores[row] = get(row, 0.0) + idf * tf * k1p / (tf + norms[row])
+            elif allowed is not None:
+                for row, tf in zip(term_rows, tfs):
+                    if row in allowed:
+                        scores[row] = get(row, 0.0) + idf * tf * k1p / (tf + norms[row])
+            elif not scores:
+                scores.update({row: idf * tf * k1p / (tf + norms[row]) for row, tf in zip(term_rows, tfs)})
+            else:
+                for row, tf in zip(term_rows, tfs):
+                    scores[row] = get(row, 0.0) + idf * tf * k1p / (tf + norms[row])
+
+        matched = set().union(*decoded)
+        if allowed is not None:
+            matched &= allowed
+
+        top = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+        return len(matched), top
@@ -0,0 +1,260 @@
+"""
+backend/utils/snapshot.py
+
+Versioned article snapshots with zero-downtime reload.
+
+A Snapshot bundles the article list with everything derived from it (the
+ArticleIndex today) plus a version string and load timestamps. Routers read
+`app.state.snapshot` once per request and only use that object, so a reload
+that swaps in a new Snapshot never affects requests already in flight.
+
+Reloads can be triggered three ways, all funnelling into
+SnapshotManager.reload():
+  - POST /admin/reload (backend/routers/admin.py)
+  - SIGHUP to the worker process
+  - a background watcher thread polling the data file's mtime/size (the
+    binary companion's, when that is what gets loaded)
+"""
+
+import logging
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .article_index import ArticleIndex
+from .article_store import ArticleStore
+from .facets import FacetIndex
+from .fast_json import dumps
+from .map_geojson import GEOJSON_RESPONSE_KEY, build_feature_collection
+from .rollups import WeeklyRollups, read_rollups
+from .search_index import SearchIndex
+from .data_loader import (
+    get_cached_snapshot,
+    get_data_file_path,
+    invalidate_articles_cache,
+    resolve_snapshot_file,
+    snapshot_version,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """
+    Immutable bundle of one loaded snapshot and its derived structures.
+    """
+
+    __slots__ = (
+        "articles", "index", "facets", "search", "rollups", "version", "path", "loaded_at", "load_seconds", "index_seconds",
+        "responses",
+    )
+
+    def __init__(
+        self,
+        articles: ArticleStore,
+        index: ArticleIndex,
+        version: str,
+        path: Path,
+        loaded_at: datetime,
+        load_seconds: float,
+        index_seconds: float = 0.0,
+        rollups: Optional[WeeklyRollups] = None,
+        search: Optional[SearchIndex] = None,
+        facets: Optional[FacetIndex] = None,
+    ):
+        self.articles = articles
+        self.index = index
+        self.facets = facets if facets is not None else FacetIndex(index)
+        self.search = search if search is not None else SearchIndex(articles)
+        self.rollups = rollups if rollups is not None else WeeklyRollups()
+        self.version = version
+        self.path = path
+        self.loaded_at = loaded_at
+        self.load_seconds = load_seconds
+        self.index_seconds = index_seconds
+        # Serialized bodies of parameterless responses, built on first use.
+        self.responses: Dict[str, bytes] = {}
+
+    def cached_response(self, key: str, build: Callable[[], Any]) -> bytes:
+        """
+        JSON bytes for `key`, serialized once per snapshot. `build` may
+        return the payload or bytes it already serialized.
+
+        Concurrent first requests may both build; the payload is identical,
+        so whichever finishes last simply wins.
+        """
+        body = self.responses.get(key)
+        if body is None:
+            built = build()
+            body = self.responses[key] = built if isinstance(built, bytes) else dumps(built)
+        return body
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "path": str(self.path),
+            "loaded_at": self.loaded_at.isoformat(),
+            "load_seconds": round(self.load_seconds, 4),
+            "index_seconds": round(self.index_seconds, 4),
+            "total_articles": len(self.articles),
+        }
+
+
+def build_snapshot(data_file: Optional[Path] = None) -> Snapshot:
+    """
+    Load (via the shared cache) and index a snapshot. Does not touch app state.
+
+    load_seconds covers the whole build; index_seconds is the ArticleIndex,
+    FacetIndex and SearchIndex part.
+    The weekly rollups stored next to the data file are read here (never
+    written; see rollups.read_rollups), and the /map-data GeoJSON is
+    prebuilt before the snapshot is published.
+    """
+    data_file = Path(data_file) if data_file is not None else get_data_file_path()
+
+    started = time.perf_counter()
+    stat_key, articles = get_cached_snapshot(data_file)
+    index_started = time.perf_counter()
+    index = ArticleIndex(articles)
+    facets = FacetIndex(index)
+    search = SearchIndex(articles)
+    index_finished = time.perf_counter()
+
+    version = snapshot_version(stat_key)
+    rollups = read_rollups(data_file, articles, version, index.dates)
+    finished = time.perf_counter()
+
+    snapshot = Snapshot(
+        articles=articles,
+        index=index,
+        search=search,
+        facets=facets,
+        rollups=rollups,
+        version=version,
+        path=resolve_snapshot_file(data_file),
+        loaded_at=datetime.now(timezone.utc),
+        load_seconds=finished - started,
+        index_seconds=index_finished - index_started,
+    )
+    snapshot.cached_response(GEOJSON_RESPONSE_KEY, lambda: build_feature_collection(index))
+    return snapshot
+
+
+class SnapshotManager:
+    """
+    Owns the current Snapshot for one app and swaps in new ones atomically.
+
+    `state` is any object with a writable `snapshot` attribute (FastAPI's
+    app.state). Building happens outside of `state`; the only write is a
+    single attribute assignment once the new snapshot is complete.
+    """
+
+    def __init__(self, state: Any, data_file: Optional[Path] = None):
+        self.state = state
+        self.data_file = Path(data_file) if data_file is not None else get_data_file_path()
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+
+    @property
+    def current(self) -> Optional[Snapshot]:
+        return getattr(self.state, "snapshot", None)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Load and index the data file, then publish it.
+
+        Returns True if a new snapshot was swapped in, False if the file was
+        unchanged (checked from its mtime and size before anything is
+        built). Concurrent calls are serialized; a failed load leaves the
+        current snapshot in place and re-raises.
+        """
+        with self._reload_lock:
+            if force:
+                invalidate_articles_cache(self.data_file)
+            elif self.current is not None and self._file_version() == self.current.version:
+                return False
+
+            new = build_snapshot(self.data_file)
+
+            current = self.current
+            if not force and current is not None and current.version == new.version:
+                return False
+
+            self.state.snapshot = new
+            logger.info(
+                "Snapshot %s loaded (%d articles, %.3fs)",
+                new.version, len(new.articles), new.load_seconds,
+            )
+            return True
+
+    # ---------- triggers ----------
+
+    def _file_version(self) -> Optional[str]:
+        """
+        Version the data file would load as now; None if it cannot be read.
+        """
+        try:
+            st = resolve_snapshot_file(self.data_file).stat()
+        except OSError:
+            return None
+        return snapshot_version((st.st_mtime_ns, st.st_size))
+
+    def _is_stale(self) -> bool:
+        version = self._file_version()
+        if version is None:
+            return False
+        current = self.current
+        return current is None or version != current.version
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop_watching.wait(interval):
+            if not self._is_stale():
+                continue
+            try:
+                self.reload()
+            except Exception:
+                # Typically a half-written file; the next poll retries once
+                # the writer finishes and the mtime/size change again.
+                logger.exception("Snapshot reload from watcher failed; keeping current version")
+
+    def start_watcher(self, interval: float = 5.0) -> None:
+        if self._watcher is not None:
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="snapshot-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        if self._watcher is None:
+            return
+        self._stop_watching.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def install_signal_handler(self, loop: Any, sig: int = getattr(signal, "SIGHUP", 0)) -> bool:
+        """
+        Reload on `sig` (SIGHUP by default). Returns False where unsupported.
+        """
+        if not sig:
+            return False
+
+        def _on_signal() -> None:
+            loop.run_in_executor(None, self._reload_logged)
+
+        try:
+            loop.add_signal_handler(sig, _on_signal)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+    def _reload_logged(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            logger.exception("Snapshot reload from signal failed; keeping current version")
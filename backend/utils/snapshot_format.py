@@ -0,0 +1,185 @@
+"""
+backend/utils/snapshot_format.py
+
+Binary, memory-mappable snapshot file for fast backend startup.
+
+json.load over the indented google_topics.json dominates worker startup.
+The NLP pipeline additionally writes google_topics.cfsnap: the ArticleStore
+columns laid out as raw, 8-byte aligned sections that are mapped with mmap
+and used in place, so loading is a header parse plus a checksum pass.
+
+Layout:
+
+    b"CFSNAP01"                    magic (8 bytes)
+    header length                  little-endian uint64
+    header                         UTF-8 JSON: format_version, byteorder,
+                                   rows, checksum, section table
+    padding to 8 bytes
+    sections                       raw column buffers + one JSON "meta"
+                                   section, each padded to 8 bytes
+
+The checksum (BLAKE2b) covers every section. Arrays are stored in native
+byte order; a file written on a machine with a different byte order is
+rejected and the loader falls back to JSON.
+
+    python -m backend.utils.snapshot_format data/cleaned/google_topics.json
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .article_store import ArticleStore
+
+MAGIC = b"CFSNAP01"
+FORMAT_VERSION = 1
+BINARY_SUFFIX = ".cfsnap"
+_ALIGN = 8
+_META_SECTION = "__meta__"
+
+
+class SnapshotFormatError(ValueError):
+    """
+    Raised when a binary snapshot is malformed, corrupt or incompatible.
+    """
+
+
+def binary_path_for(data_file: Union[str, Path]) -> Path:
+    """
+    data/cleaned/google_topics.json -> data/cleaned/google_topics.cfsnap
+    """
+    return Path(data_file).with_suffix(BINARY_SUFFIX)
+
+
+def _padding(n: int) -> int:
+    return -n % _ALIGN
+
+
+def write_binary_snapshot(store: ArticleStore, path: Union[str, Path]) -> Path:
+    """
+    Write `store` to `path` atomically (temp file + rename).
+    """
+    path = Path(path)
+    buffers, meta = store.dump_state()
+
+    sections: List[Dict[str, Any]] = []
+    payloads: List[memoryview] = []
+    offset = 0
+    named = list(buffers.items()) + [
+        (_META_SECTION, json.dumps(meta, ensure_ascii=False).encode("utf-8", "surrogatepass"))
+    ]
+    for name, buf in named:
+        # arrays (or memoryviews of a store loaded from a previous file) keep
+        # their item type; raw byte buffers are stored untyped
+        typecode = getattr(buf, "typecode", None)
+        if typecode is None and isinstance(buf, memoryview) and buf.format != "B":
+            typecode = buf.format
+        view = memoryview(buf).cast("B")
+        sections.append({"name": name, "offset": offset, "length": len(view), "typecode": typecode})
+        payloads.append(view)
+        offset += len(view) + _padding(len(view))
+
+    checksum = hashlib.blake2b(digest_size=16)
+    for view in payloads:
+        checksum.update(view)
+
+    header = json.dumps({
+        "format_version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": len(store),
+        "checksum": checksum.hexdigest(),
+        "sections": sections,
+    }).encode("utf-8")
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        f.write(b"\0" * _padding(len(MAGIC) + 8 + len(header)))
+        for view in payloads:
+            f.write(view)
+            f.write(b"\0" * _padding(len(view)))
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_binary_snapshot(path: Union[str, Path], verify: bool = True) -> ArticleStore:
+    """
+    Map `path` and return an ArticleStore backed by the mapping.
+
+    Column buffers are memoryviews into the mmap, so pages are only read
+    when touched; the mapping lives as long as the store does.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise SnapshotFormatError(f"Empty snapshot file: {path}")
+
+    view = memoryview(mm)
+    if len(view) < len(MAGIC) + 8 or bytes(view[:len(MAGIC)]) != MAGIC:
+        raise SnapshotFormatError(f"Not a Community Flow binary snapshot: {path}")
+
+    (header_len,) = struct.unpack_from("<Q", view, len(MAGIC))
+    header_start = len(MAGIC) + 8
+    try:
+        header = json.loads(bytes(view[header_start:header_start + header_len]))
+    except ValueError:
+        raise SnapshotFormatError(f"Corrupt snapshot header: {path}")
+
+    if header.get("format_version") != FORMAT_VERSION:
+        raise SnapshotFormatError(
+            f"Unsupported snapshot format version {header.get('format_version')}: {path}"
+        )
+    if header.get("byteorder") != sys.byteorder:
+        raise SnapshotFormatError(f"Snapshot written with {header.get('byteorder')} byte order: {path}")
+
+    data_start = header_start + header_len + _padding(header_start + header_len)
+    sections: Dict[str, memoryview] = {}
+    checksum = hashlib.blake2b(digest_size=16)
+    for section in header["sections"]:
+        start = data_start + section["offset"]
+        end = start + section["length"]
+        if end > len(view):
+            raise SnapshotFormatError(f"Truncated snapshot: {path}")
+        raw = view[start:end]
+        if verify:
+            checksum.update(raw)
+        sections[section["name"]] = raw.cast(section["typecode"]) if section["typecode"] else raw
+
+    if verify and checksum.hexdigest() != header["checksum"]:
+        raise SnapshotFormatError(f"Snapshot checksum mismatch: {path}")
+
+    meta = json.loads(str(sections.pop(_META_SECTION), "utf-8", "surrogatepass"))
+    store = ArticleStore.load_state(sections, meta)
+    if len(store) != header["rows"]:
+        raise SnapshotFormatError(f"Snapshot row count mismatch: {path}")
+    return store
+
+
+def convert_json_snapshot(json_file: Union[str, Path], output: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Write the binary companion of an existing google_topics.json.
+    """
+    with open(json_file, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    store = ArticleStore.from_articles(articles)
+    return write_binary_snapshot(store, output or binary_path_for(json_file))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert google_topics.json to the binary snapshot format")
+    parser.add_argument("json_file")
+    parser.add_argument("-o", "--output")
+    args = parser.parse_args()
+
+    out = convert_json_snapshot(args.json_file, args.output)
+    print(f"Binary snapshot saved → {out}")
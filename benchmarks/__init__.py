@@ -0,0 +1,5 @@
+# benchmarks/__init__.py
+
+"""
+Benchmarks and synthetic data generators for the Community Flow backend.
+"""
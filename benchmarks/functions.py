@@ -0,0 +1,108 @@
+"""
+benchmarks/functions.py
+
+In-process benchmarks of the functions behind the analytics endpoints:
+
+  - build_report_data            (/report-data, /report-pdf)
+  - _build_cluster_response      (/clusters)
+  - _build_neighborhood_block    (/map-data)
+  - generate_weekly_report_pdf   (/report-pdf render)
+
+For each corpus size a synthetic snapshot (benchmarks/synthetic.py) is
+loaded into an ArticleStore and indexed exactly as SnapshotManager does,
+then every case is timed with timeit (best and median of --repeat runs,
+per call). Results go to benchmarks/results/ and are compared with the
+previous run.
+
+    python -m benchmarks.functions --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import statistics
+import time
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.results import compare, latest_result, save_result
+
+SUITE = "functions"
+
+# Synthetic dates end on 2025-12-01; windowed cases cover its last 30 days.
+_WINDOW_UNTIL = 1764547200
+_WINDOW_SINCE = _WINDOW_UNTIL - 30 * 24 * 3600
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Tuple[float, float]:
+    """
+    (best, median) seconds per call.
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return min(runs), statistics.median(runs)
+
+
+def _cases(store: Any, index: Any) -> List[Tuple[str, Callable[[], Any]]]:
+    from backend.routers.clusters import _build_cluster_response
+    from backend.routers.map_data import _build_neighborhood_block
+    from backend.utils.pdf_service import generate_weekly_report_pdf
+    from backend.utils.report_builder import build_report_data
+
+    topic = max(index.topic_keys, key=lambda k: index.topic_stats[k].count)
+    neighborhood = max(index.neighborhood_keys, key=lambda k: index.neighborhood_stats[k].count)
+    report = build_report_data(articles=store, index=index)
+
+    return [
+        ("build_report_data", lambda: build_report_data(articles=store, index=index)),
+        ("build_report_data[30d]", lambda: build_report_data(
+            articles=store, index=index, since=_WINDOW_SINCE, until=_WINDOW_UNTIL)),
+        ("_build_cluster_response", lambda: _build_cluster_response(
+            topic, index.topic_stats[topic], index.topic_articles(topic), False, 20)),
+        ("_build_cluster_response[articles]", lambda: _build_cluster_response(
+            topic, index.topic_stats[topic], index.topic_articles(topic), True, 20)),
+        ("_build_neighborhood_block", lambda: _build_neighborhood_block(
+            neighborhood, index.neighborhood(neighborhood))),
+        ("generate_weekly_report_pdf", lambda: generate_weekly_report_pdf(report)),
+    ]
+
+
+def run(sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    from backend.utils.article_index import ArticleIndex
+    from backend.utils.article_store import ArticleStore
+    from benchmarks.synthetic import iter_loaded_articles
+
+    rows = []
+    for n in sizes:
+        store = ArticleStore.from_articles(iter_loaded_articles(n))
+        started = time.perf_counter()
+        index = ArticleIndex(store)
+        elapsed = time.perf_counter() - started
+        # built once per snapshot, so a single run is what production pays
+        rows.append({"n": n, "case": "ArticleIndex", "best_s": elapsed, "median_s": elapsed})
+
+        for name, fn in _cases(store, index):
+            best, median = _time(fn, repeat)
+            rows.append({"n": n, "case": name, "best_s": best, "median_s": median})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="In-process benchmarks of the endpoint builders")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-save", action="store_true", help="print only, do not write results")
+    args = parser.parse_args()
+
+    previous = latest_result(SUITE)
+    rows = run(args.sizes, args.repeat)
+
+    print(f"{'articles':>9}  {'case':<36} {'best ms':>10} {'median ms':>10}")
+    for r in rows:
+        print(f"{r['n']:>9}  {r['case']:<36} {r['best_s'] * 1000:>10.3f} {r['median_s'] * 1000:>10.3f}")
+
+    print()
+    print("\n".join(compare(previous, rows, key=("n", "case"), metrics=("median_s",))))
+
+    if not args.no_save:
+        path = save_result(SUITE, rows, {"sizes": args.sizes, "repeat": args.repeat})
+        print(f"\nResults saved → {path}")
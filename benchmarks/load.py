@@ -0,0 +1,273 @@
+"""
+benchmarks/load.py
+
+Concurrent HTTP load driver for the FastAPI backend.
+
+Starts uvicorn on a synthetic snapshot of --size articles (pointed at it via
+COMMUNITY_FLOW_DATA_FILE), then drives each endpoint in turn with
+--concurrency keep-alive connections for --duration seconds and reports
+p50/p95/p99 latency and throughput per endpoint. Pass --url to drive an
+already running server instead.
+
+The client is a minimal asyncio HTTP/1.1 implementation (Content-Length and
+chunked bodies) so the driver needs nothing beyond the backend's own
+requirements and its overhead stays small next to the server's.
+
+    python -m benchmarks.load --size 100000 --concurrency 16 --duration 10
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.results import compare, latest_result, save_result
+
+SUITE = "load"
+
+DEFAULT_ENDPOINTS = [
+    "/health",
+    "/themes",
+    "/clusters",
+    "/clusters?include_articles=true",
+    "/clusters?topic_id=0&include_articles=true&limit_articles=50",
+    "/map-data",
+    "/map-data?neighborhood=Pilsen",
+    "/map-data?format=geojson",
+    "/report-data",
+    "/report-data?limit=50&since=2025-11-01",
+    "/clusters/0/articles?limit=100",
+    "/dashboard",
+    "/report-pdf",
+]
+
+
+# ---------- client ----------
+
+class _Connection:
+    """
+    One keep-alive HTTP/1.1 connection.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def _connect(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.writer = None
+
+    async def get(self, target: str) -> Tuple[int, int]:
+        """
+        GET `target`; returns (status, body bytes).
+        """
+        if self.writer is None:
+            await self._connect()
+        self.writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Accept-Encoding: identity\r\n\r\n".encode("latin-1")
+        )
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("server closed the connection")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        size = 0
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                chunk_size = int((await self.reader.readline()).split(b";")[0], 16)
+                if chunk_size == 0:
+                    await self.reader.readline()
+                    break
+                size += len(await self.reader.readexactly(chunk_size))
+                await self.reader.readline()
+        elif "content-length" in headers:
+            size = len(await self.reader.readexactly(int(headers["content-length"])))
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, size
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return float("nan")
+    rank = min(len(sorted_values), max(1, math.ceil(q / 100 * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+
+async def drive(host: str, port: int, target: str, concurrency: int, duration: float,
+                warmup: int = 3) -> Dict[str, Any]:
+    """
+    Hit `target` from `concurrency` connections for `duration` seconds.
+    """
+    warm = _Connection(host, port)
+    for _ in range(warmup):
+        await warm.get(target)
+    await warm.close()
+
+    latencies: List[float] = []
+    errors = 0
+    body_bytes = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors, body_bytes
+        conn = _Connection(host, port)
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    status, size = await conn.get(target)
+                except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError):
+                    errors += 1
+                    await conn.close()
+                    continue
+                latencies.append(time.perf_counter() - started)
+                body_bytes += size
+                if status >= 400:
+                    errors += 1
+        finally:
+            await conn.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "endpoint": target,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else float("nan")) * 1000,
+        "avg_kb": body_bytes / len(latencies) / 1024 if latencies else 0.0,
+    }
+
+
+# ---------- server ----------
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_up(host: str, port: int, proc: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"uvicorn did not start within {timeout:.0f}s")
+
+
+def start_server(data_file: str, port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, COMMUNITY_FLOW_DATA_FILE=data_file)
+    cmd = [
+        sys.executable, "-m", "uvicorn", "backend.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    return subprocess.Popen(cmd, env=env)
+
+
+def run(endpoints: List[str], host: str, port: int, concurrency: int, duration: float) -> List[Dict[str, Any]]:
+    rows = []
+    for target in endpoints:
+        row = asyncio.run(drive(host, port, target, concurrency, duration))
+        print(
+            f"{target:<62} {row['rps']:>8.0f} req/s  p50 {row['p50_ms']:>7.2f}  "
+            f"p95 {row['p95_ms']:>7.2f}  p99 {row['p99_ms']:>7.2f} ms  errors {row['errors']}"
+        )
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP load test of the backend endpoints")
+    parser.add_argument("--size", type=int, default=10_000, help="synthetic articles to serve")
+    parser.add_argument("--url", default=None, help="drive an already running server instead")
+    parser.add_argument("--endpoints", nargs="+", default=DEFAULT_ENDPOINTS)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--no-save", action="store_true", help="print only, do not write results")
+    args = parser.parse_args()
+
+    params: Dict[str, Any] = {
+        "size": args.size if args.url is None else None,
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "workers": args.workers,
+    }
+    previous = latest_result(SUITE)
+
+    if args.url is not None:
+        parts = urlsplit(args.url)
+        rows = run(args.endpoints, parts.hostname, parts.port or 80, args.concurrency, args.duration)
+    else:
+        from backend.utils.snapshot_format import convert_json_snapshot
+        from benchmarks.synthetic import write_snapshot
+
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "google_topics.json")
+            write_snapshot(data_file, args.size)
+            convert_json_snapshot(data_file)
+
+            port = _free_port()
+            server = start_server(data_file, port, args.workers)
+            try:
+                _wait_until_up("127.0.0.1", port, server, args.startup_timeout)
+                rows = run(args.endpoints, "127.0.0.1", port, args.concurrency, args.duration)
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+    print()
+    print("\n".join(compare(
+        previous, rows, key=("endpoint",), metrics=("rps", "p50_ms", "p99_ms"), higher_is_better=("rps",)
+    )))
+
+    if not args.no_save:
+        path = save_result(SUITE, rows, params)
+        print(f"\nResults saved → {path}")
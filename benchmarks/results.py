@@ -0,0 +1,117 @@
+"""
+benchmarks/results.py
+
+Saving and comparing benchmark runs.
+
+Each run is written to benchmarks/results/<suite>-<UTC timestamp>.json with
+enough context (git commit, Python, platform, CPU count) to tell runs apart.
+compare() lines a new run up against the previous one for the same suite and
+flags anything that got slower by more than a threshold, so regressions show
+up as soon as the suite is re-run.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# A metric counts as a regression when it is this much worse than last run.
+DEFAULT_THRESHOLD = 0.10
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def latest_result(suite: str, results_dir: Path = RESULTS_DIR) -> Optional[Dict[str, Any]]:
+    """
+    Most recent saved run of `suite`, or None.
+    """
+    runs = sorted(results_dir.glob(f"{suite}-*.json"))
+    if not runs:
+        return None
+    with open(runs[-1], "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_result(suite: str, rows: List[Dict[str, Any]], params: Dict[str, Any],
+                results_dir: Path = RESULTS_DIR) -> Path:
+    """
+    Write one run to results_dir and return its path.
+    """
+    results_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now(timezone.utc)
+    path = results_dir / f"{suite}-{now.strftime('%Y%m%dT%H%M%SZ')}.json"
+    payload = {
+        "suite": suite,
+        "created_at": now.isoformat(),
+        "environment": environment(),
+        "params": params,
+        "rows": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def compare(
+    previous: Optional[Dict[str, Any]],
+    rows: List[Dict[str, Any]],
+    key: Iterable[str],
+    metrics: Iterable[str],
+    higher_is_better: Iterable[str] = (),
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """
+    Human-readable deltas of `rows` against a previous run.
+
+    Rows are matched on the `key` fields; for each metric the relative change
+    is reported and marked REGRESSION past `threshold`.
+    """
+    if previous is None:
+        return ["(no previous run to compare against)"]
+
+    key = tuple(key)
+    better_up = set(higher_is_better)
+    before: Dict[Tuple[Any, ...], Dict[str, Any]] = {
+        tuple(r.get(k) for k in key): r for r in previous.get("rows", [])
+    }
+
+    lines = [f"vs run of {previous.get('created_at')} ({previous.get('environment', {}).get('git_commit')})"]
+    for row in rows:
+        old = before.get(tuple(row.get(k) for k in key))
+        if old is None:
+            continue
+        for metric in metrics:
+            a, b = old.get(metric), row.get(metric)
+            if not a or b is None:
+                continue
+            change = (b - a) / a
+            worse = -change if metric in better_up else change
+            flag = "  REGRESSION" if worse > threshold else ""
+            label = " ".join(str(row.get(k)) for k in key)
+            lines.append(f"  {label:<40} {metric:<10} {a:>10.4g} -> {b:>10.4g} ({change:+.1%}){flag}")
+    return lines
@@ -0,0 +1,86 @@
+"""
+benchmarks/startup_snapshot.py
+
+Backend startup cost of the indented google_topics.json vs the binary
+snapshot (backend/utils/snapshot_format.py).
+
+For each corpus size a synthetic snapshot is written in both formats, then
+each format is loaded into an ArticleStore in a fresh process (cold
+interpreter, warm page cache) -- exactly the work get_cached_snapshot() does
+at startup. Index build time is reported separately since it is the same for
+both formats.
+
+    python -m benchmarks.startup_snapshot --sizes 10000 100000 300000
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+
+def _load(json_file: str, binary: bool) -> Dict[str, float]:
+    from backend.utils.article_index import ArticleIndex
+    from backend.utils.article_store import ArticleStore
+    from backend.utils.data_loader import load_articles
+    from backend.utils.snapshot_format import read_binary_snapshot, binary_path_for
+
+    started = time.perf_counter()
+    if binary:
+        store = read_binary_snapshot(binary_path_for(json_file))
+    else:
+        store = ArticleStore.from_articles(load_articles(Path(json_file)))
+    loaded = time.perf_counter()
+    ArticleIndex(store)
+    indexed = time.perf_counter()
+    return {"load_s": loaded - started, "index_s": indexed - loaded}
+
+
+def run(sizes: List[int], workdir: str) -> List[Dict[str, float]]:
+    from backend.utils.snapshot_format import convert_json_snapshot, binary_path_for
+    from benchmarks.synthetic import write_snapshot
+
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for n in sizes:
+        json_file = os.path.join(workdir, f"google_topics_{n}.json")
+        write_snapshot(json_file, n)
+        convert_json_snapshot(json_file)
+
+        row: Dict[str, float] = {
+            "n": n,
+            "json_mb": os.path.getsize(json_file) / 1024 / 1024,
+            "binary_mb": os.path.getsize(binary_path_for(json_file)) / 1024 / 1024,
+        }
+        for label, binary in (("json", False), ("binary", True)):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                result = pool.submit(_load, json_file, binary).result()
+            row[f"{label}_load_s"] = result["load_s"]
+            row["index_s"] = result["index_s"]
+        rows.append(row)
+
+        os.remove(json_file)
+        os.remove(binary_path_for(json_file))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup load time: JSON vs binary snapshot")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument("--workdir", default=None, help="where to write the temporary snapshots")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        rows = run(args.sizes, workdir)
+
+    print(f"{'articles':>9} {'json MB':>8} {'bin MB':>7} {'json load s':>12} {'bin load s':>11} {'speedup':>8} {'index s':>8}")
+    for r in rows:
+        speedup = r["json_load_s"] / r["binary_load_s"] if r["binary_load_s"] else float("nan")
+        print(
+            f"{r['n']:>9} {r['json_mb']:>8.1f} {r['binary_mb']:>7.1f} "
+            f"{r['json_load_s']:>12.3f} {r['binary_load_s']:>11.3f} {speedup:>7.0f}x {r['index_s']:>8.2f}"
+        )
@@ -0,0 +1,74 @@
+"""
+benchmarks/store_memory.py
+
+Resident memory of the article snapshot: list of dicts (what json.load
+returns) vs the columnar ArticleStore.
+
+Each measurement runs in a fresh process so RSS deltas are not polluted by
+earlier allocations. The store is filled straight from a batched json stream,
+so its process never holds the full list of dicts.
+
+    python -m benchmarks.store_memory --sizes 10000 100000 1000000
+"""
+
+import argparse
+import gc
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # macOS reports ru_maxrss in bytes, Linux in KiB; only used as fallback
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _measure(kind: str, n: int) -> Dict[str, float]:
+    from backend.utils.article_store import ArticleStore
+    from benchmarks.synthetic import iter_loaded_articles
+
+    gc.collect()
+    base = _rss_bytes()
+    started = time.perf_counter()
+
+    if kind == "list":
+        data = list(iter_loaded_articles(n))
+    else:
+        data = ArticleStore.from_articles(iter_loaded_articles(n))
+
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    used = _rss_bytes() - base
+    assert len(data) == n
+    return {"rss_bytes": used, "seconds": elapsed}
+
+
+def run(sizes: List[int]) -> List[Dict[str, float]]:
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for n in sizes:
+        row: Dict[str, float] = {"n": n}
+        for kind in ("list", "store"):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                result = pool.submit(_measure, kind, n).result()
+            row[f"{kind}_mb"] = result["rss_bytes"] / 1024 / 1024
+            row[f"{kind}_build_s"] = result["seconds"]
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot memory: list of dicts vs ArticleStore")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'articles':>10} {'list MB':>10} {'store MB':>10} {'ratio':>7}")
+    for row in run(args.sizes):
+        ratio = row["list_mb"] / row["store_mb"] if row["store_mb"] else float("nan")
+        print(f"{row['n']:>10} {row['list_mb']:>10.1f} {row['store_mb']:>10.1f} {ratio:>6.1f}x")
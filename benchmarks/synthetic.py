@@ -0,0 +1,121 @@
+"""
+benchmarks/synthetic.py
+
+Synthetic articles shaped like data/cleaned/google_topics.json.
+
+Field lengths, vocabularies and value distributions roughly follow the real
+snapshot (Google News RSS items: ~80 char titles, ~250 char links, five
+keywords, one to three themes, six topic clusters), so memory and timing
+numbers measured on this data transfer to production sizes.
+"""
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Iterator, List
+
+SOURCES = ["Google News RSS", "Eventbrite", "Meetup", "Blog"]
+
+NEIGHBORHOODS = [
+    "Chicago", "Pilsen", "Bronzeville", "Logan Square", "Humboldt Park",
+    "Little Village", "Hyde Park", "Woodlawn", "Englewood", "Austin",
+    "Rogers Park", "Uptown", "Lincoln Park", "Lakeview", "Chinatown",
+    "South Shore", "Garfield Park", "Albany Park", "Bridgeport", "Wicker Park",
+]
+
+VOCAB = [
+    "wellness", "chicago", "yoga", "meditation", "healing", "community",
+    "mindfulness", "retreat", "sound", "bath", "spa", "stress", "burnout",
+    "movement", "beginners", "free", "support", "group", "nature", "spiritual",
+    "culture", "self", "body", "care", "rest", "joy", "breathwork", "dance",
+    "workshop", "class", "market", "festival", "garden", "walk", "circle",
+    "women", "color", "mutual", "aid", "affordable", "access", "nonprofit",
+    "summit", "arts", "music", "therapy", "mental", "health", "youth", "elders",
+]
+
+PUBLISHERS = [
+    "Chicago Sun-Times", "Chicago Tribune", "Block Club Chicago", "WTTW News",
+    "City of Chicago (.gov)", "Time Out", "Chicago Reader", "NBC Chicago",
+]
+
+_EPOCH_END = datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    words = rng.choices(VOCAB, k=n_words)
+    words[0] = words[0].capitalize()
+    return " ".join(words)
+
+
+def generate_article(rng: random.Random, i: int) -> Dict[str, Any]:
+    headline = _sentence(rng, rng.randint(6, 12))
+    publisher = rng.choice(PUBLISHERS)
+    title = f"{headline} - {publisher}"
+    text = f"{headline}  {publisher}"
+    when = _EPOCH_END - timedelta(seconds=rng.randint(0, 2 * 365 * 24 * 3600))
+    link_id = "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-", k=220))
+
+    return {
+        "title": title,
+        "text": text,
+        "date": format_datetime(when, usegmt=True),
+        "link": f"https://news.google.com/rss/articles/{link_id}?oc={i}",
+        "source": rng.choice(SOURCES),
+        "neighborhood": rng.choice(NEIGHBORHOODS),
+        "clean_text": f"{headline}  {publisher}",
+        "keywords": rng.sample(VOCAB, 5),
+        "themes": sorted(rng.sample(range(1, 7), rng.randint(1, 3))),
+        "topic_id": rng.randrange(6),
+    }
+
+
+def iter_articles(n: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    for i in range(n):
+        yield generate_article(rng, i)
+
+
+def iter_loaded_articles(n: int, seed: int = 42, batch_size: int = 10_000) -> Iterator[Dict[str, Any]]:
+    """
+    Like iter_articles(), but round-tripped through json in batches so string
+    objects are laid out the way json.load lays them out (shared dict keys,
+    one str object per value occurrence).
+    """
+    batch: List[Dict[str, Any]] = []
+    for a in iter_articles(n, seed):
+        batch.append(a)
+        if len(batch) == batch_size:
+            yield from json.loads(json.dumps(batch))
+            batch = []
+    if batch:
+        yield from json.loads(json.dumps(batch))
+
+
+def generate_articles(n: int, seed: int = 42, as_loaded: bool = True) -> List[Dict[str, Any]]:
+    """
+    Return n synthetic articles (see iter_loaded_articles for as_loaded).
+    """
+    if not as_loaded:
+        return list(iter_articles(n, seed))
+    return list(iter_loaded_articles(n, seed))
+
+
+def write_snapshot(path: str, n: int, seed: int = 42, indent: int = 4) -> None:
+    """
+    Write a google_topics.json-style file (indent=4 like nlp/topic_model.save_data).
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(list(iter_articles(n, seed)), f, indent=indent)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic google_topics.json")
+    parser.add_argument("output")
+    parser.add_argument("-n", "--count", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    write_snapshot(args.output, args.count, args.seed)
+    print(f"Wrote {args.count} synthetic articles → {args.output}")
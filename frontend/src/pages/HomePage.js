@@ -19,17 +19,14 @@ export default function HomePage() {
         setLoading(true);
         setError("");
 
-        const [themesRes, reportRes, clustersRes] = await Promise.all([
-          api.themes(),
-          api.reportData({ limit: 5, sort: "date_desc" }),
-          api.clusters(),
-        ]);
+        // One request (cached per snapshot) instead of three.
+        const { results } = await api.dashboard();
 
         if (!mounted) return;
 
-        setThemes(themesRes);
-        setReport(reportRes);
-        setClusters(clustersRes);
+        setThemes(results.themes);
+        setReport(results["report-data"]);
+        setClusters(results.clusters);
       } catch (e) {
         if (!mounted) return;
         setError(e.message || "Failed to load data");
@@ -38,7 +38,7 @@ export default function MapPage() {
       try {
         setLoading(true);
         setError("");
-        const res = await api.mapData();
+        const res = await api.mapGeoJson();
         if (!mounted) return;
         setData(res);
       } catch (e) {
@@ -65,40 +65,55 @@ export default function MapPage() {
     );
   }
 
-  const neighborhoods = data?.neighborhoods || [];
+  // One feature per community area (zero counts included) plus unlocated
+  // neighborhoods without geometry; list the ones with articles, busiest first.
+  const features = (data?.features || [])
+    .map((f) => f.properties)
+    .filter((p) => p.article_count > 0)
+    .sort((a, b) => b.article_count - a.article_count);
 
   return (
     <div style={styles.page}>
       <h2 style={{ marginTop: 0 }}>Map (Neighborhood Intensity)</h2>
       <div style={styles.muted}>
-        This is a simple “map-data” preview. Later we’ll replace with a real map
-        component.
+        This is a simple preview of the community-area GeoJSON. Later we’ll
+        replace it with a real map component.
       </div>
 
       <div style={styles.cards}>
-        {neighborhoods.map((n) => (
+        {features.map((n) => (
           <div key={n.neighborhood} style={styles.card}>
             <div style={{ fontWeight: 900 }}>{n.neighborhood}</div>
-            <div style={styles.meta}>{n.article_count} articles</div>
+            <div style={styles.meta}>
+              {n.article_count} articles
+              {n.community_area == null ? " · not a community area" : ""}
+            </div>
+            {n.intensity != null ? (
+              <div style={styles.barTrack}>
+                <div style={{ ...styles.barFill, width: `${n.intensity * 100}%` }} />
+              </div>
+            ) : null}
 
             <div style={{ marginTop: 10, fontWeight: 800, fontSize: 13 }}>
               Theme distribution
             </div>
             <div style={styles.pillsWrap}>
-              {(n.theme_distribution || []).map((t) => (
-                <div key={t.id} style={styles.pill}>
-                  Theme {t.id}: {t.count}
-                </div>
-              ))}
+              {Object.entries(n.theme_counts || {})
+                .sort((a, b) => b[1] - a[1])
+                .map(([id, count]) => (
+                  <div key={id} style={styles.pill}>
+                    Theme {id}: {count}
+                  </div>
+                ))}
             </div>
 
             <div style={{ marginTop: 10, fontWeight: 800, fontSize: 13 }}>
               Top keywords
             </div>
             <div style={styles.pillsWrap}>
-              {(n.top_keywords || []).slice(0, 10).map((k) => (
-                <div key={k.keyword} style={styles.pill}>
-                  {k.keyword}: {k.count}
+              {(n.top_keywords || []).map((k) => (
+                <div key={k} style={styles.pill}>
+                  {k}
                 </div>
               ))}
             </div>
@@ -135,6 +150,14 @@ const styles = {
     background: "#fff",
   },
   meta: { fontSize: 12, color: "#6b7280", marginTop: 6 },
+  barTrack: {
+    height: 6,
+    borderRadius: 999,
+    background: "#f3f4f6",
+    marginTop: 8,
+    overflow: "hidden",
+  },
+  barFill: { height: "100%", background: "#6366f1" },
   pillsWrap: { display: "flex", flexWrap: "wrap", gap: 8, marginTop: 8 },
   pill: {
     border: "1px solid #e5e7eb",
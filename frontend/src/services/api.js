@@ -15,6 +15,21 @@ async function get(path, params = {}) {
   return res.json();
 }
 
+async function post(path, body) {
+  const url = `${API_BASE_URL}${path}`;
+
+  const res = await fetch(url, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(body),
+  });
+  if (!res.ok) {
+    const text = await res.text();
+    throw new Error(`POST ${url} failed: ${res.status} ${text}`);
+  }
+  return res.json();
+}
+
 async function getBlob(path, params = {}) {
   const qs = new URLSearchParams(params).toString();
   const url = `${API_BASE_URL}${path}${qs ? `?${qs}` : ""}`;
@@ -32,7 +47,10 @@ export const api = {
   themes: () => get("/themes"),
   clusters: (params) => get("/clusters", params || {}),
   mapData: (params) => get("/map-data", params || {}),
+  mapGeoJson: (params) => get("/map-data", { ...(params || {}), format: "geojson" }),
   reportData: (params) => get("/report-data", params || {}),
+  dashboard: (params) => get("/dashboard", params || {}),
+  batch: (queries, params) => post("/dashboard", { ...(params || {}), queries }),
 
   // ✅ ADD THIS
   reportPdf: (params) => getBlob("/report-pdf", params || {}),
@@ -1,6 +1,175 @@
-def run_pipeline():
-    # TODO: clean text, classify, topic model, save processed JSON
-    print("Running NLP pipeline (placeholder)")
+"""
+nlp/process_pipeline.py
+
+Runs the whole NLP pipeline in one pass, from raw records to the snapshot
+the backend serves (data/cleaned/google_topics.json and its companions).
+
+Records stream through the per-record stages as generators, one record at
+a time, with no intermediate files:
+
+    clean (scripts/clean_text.py)
+      -> keywords (scripts/clean_google_clean_json.py)
+      -> themes (scripts/label_data_google.py)
+      -> neighborhoods (scripts/infer_neighborhoods.py)
+
+Only clustering (nlp/topic_model.py) needs every record at once, so the
+stream is materialized there and the result saved with topic_model's
+save_data (JSON, binary snapshot, rollups, archive).
+
+Input is the raw store (scraper/raw_store.py, read lazily line by line), or
+the .json / .ndjson files given on the command line:
+
+    python nlp/process_pipeline.py                      # google_rss from data/raw
+    python nlp/process_pipeline.py --source all --since 2026-01-01
+    python nlp/process_pipeline.py data/raw/google_rss_2025-12-04.json -o /tmp/topics.json
+
+A run writing elsewhere than the default snapshot archives next to its
+output (/tmp/archive above), not into data/archive; --archive-dir and
+--no-archive override that.
+
+The standalone scripts still work step by step, reading and writing their
+usual files.
+"""
+
+import argparse
+import itertools
+import os
+import sys
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+# The stages live in scripts/, the raw store in scraper/, the model in nlp/.
+for path in (project_root, os.path.join(project_root, "scripts"), os.path.join(project_root, "scraper"), script_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from clean_google_clean_json import add_keywords
+from clean_text import clean_item
+from infer_neighborhoods import infer_item
+from label_data_google import label_item
+from raw_store import RAW_DIR, RawStore, iter_file
+
+Item = Dict[str, Any]
+Stage = Callable[[Iterable[Item]], Iterator[Item]]
+
+DEFAULT_SOURCE = "google_rss"
+
+
+def clean_stage(records: Iterable[Item]) -> Iterator[Item]:
+    for item in records:
+        yield clean_item(item)
+
+
+def keyword_stage(records: Iterable[Item]) -> Iterator[Item]:
+    for item in records:
+        yield add_keywords(item)
+
+
+def theme_stage(records: Iterable[Item]) -> Iterator[Item]:
+    for item in records:
+        yield label_item(item)
+
+
+def neighborhood_stage(records: Iterable[Item], found: Optional[Counter] = None) -> Iterator[Item]:
+    for item in records:
+        area = infer_item(item)
+        if area is not None and found is not None:
+            found[area] += 1
+        yield item
+
+
+def label_records(records: Iterable[Item], found: Optional[Counter] = None) -> Iterator[Item]:
+    """
+    `records` through every per-record stage, lazily.
+    """
+    stream = clean_stage(records)
+    stream = keyword_stage(stream)
+    stream = theme_stage(stream)
+    return neighborhood_stage(stream, found)
+
+
+def read_inputs(
+    inputs: Iterable[str] = (),
+    source: Optional[str] = DEFAULT_SOURCE,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    raw_dir: str = RAW_DIR,
+) -> Iterator[Item]:
+    """
+    Records of the given files in order or, if none, of the raw store
+    (`source` None for every source; since/until are ISO dates).
+    """
+    inputs = list(inputs)
+    if inputs:
+        return itertools.chain.from_iterable(iter_file(path) for path in inputs)
+    return RawStore(raw_dir).iter_records(source, since, until)
+
+
+def run_pipeline(
+    records: Optional[Iterable[Item]] = None,
+    output_file: Optional[str] = None,
+    archive_dir: Optional[str] = None,
+    archive: bool = True,
+) -> List[Item]:
+    """
+    Clean, label and cluster `records` (default: google_rss from the raw
+    store) and save the snapshot to `output_file` (default: topic_model's
+    OUTPUT_FILE); returns the clustered items.
+
+    The articles are archived to `archive_dir` (default: data/archive for
+    the default output, else archive/ next to `output_file`) unless
+    `archive` is false.
+    """
+    # sklearn is only needed from here on
+    from topic_model import OUTPUT_FILE, assign_topics, save_data
+
+    if records is None:
+        records = read_inputs()
+    if output_file is None:
+        output_file = OUTPUT_FILE
+
+    found: Counter = Counter()
+    print("Cleaning, keywording, labeling and locating records...")
+    items = list(label_records(records, found))
+    print(f"Labeled {len(items)} articles; neighborhoods inferred for {sum(found.values())}.")
+
+    assign_topics(items)
+    save_data(items, output_file, archive_dir=archive_dir, archive=archive)
+    print(f"Pipeline complete → {output_file}")
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the NLP pipeline from raw records to the topic snapshot.")
+    parser.add_argument("inputs", nargs="*",
+                        help=".json or .ndjson files to process (default: the raw store).")
+    parser.add_argument("--source", default=DEFAULT_SOURCE,
+                        help="Raw store source to read, or 'all' (default: %(default)s).")
+    parser.add_argument("--since", help="Only raw partitions dated on or after this ISO date.")
+    parser.add_argument("--until", help="Only raw partitions dated before this ISO date.")
+    parser.add_argument("--raw-dir", default=RAW_DIR, help="Raw store directory (default: %(default)s).")
+    parser.add_argument("-o", "--output", help="Snapshot JSON to write (default: data/cleaned/google_topics.json).")
+    parser.add_argument("--archive-dir",
+                        help="Archive to add the articles to (default: data/archive for the default output, "
+                             "else archive/ next to --output).")
+    parser.add_argument("--no-archive", action="store_true", help="Do not archive the articles.")
+    args = parser.parse_args()
+
+    records = read_inputs(
+        args.inputs,
+        source=None if args.source == "all" else args.source,
+        since=args.since,
+        until=args.until,
+        raw_dir=args.raw_dir,
+    )
+    try:
+        run_pipeline(records, args.output, archive_dir=args.archive_dir, archive=not args.no_archive)
+    except ValueError as e:
+        parser.exit(1, f"{e}\n")
+
 
 if __name__ == "__main__":
-    run_pipeline()
+    main()
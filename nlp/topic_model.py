@@ -1,5 +1,6 @@
 import json
 import os
+import sys
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
 
@@ -10,17 +11,66 @@ project_root = os.path.dirname(script_dir)
 INPUT_FILE = os.path.join(project_root, "data", "labeled", "google_labeled.json")
 OUTPUT_FILE = os.path.join(project_root, "data", "cleaned", "google_topics.json")
 
+N_TOPICS = 6
+
+# The backend's binary snapshot writer lives in backend/utils.
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
 def load_data():
     with open(INPUT_FILE, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def save_data(data):
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+def default_archive_dir(output_file):
+    # The default snapshot archives to data/archive (or the backend's
+    # override); any other output gets an archive/ of its own beside it, so
+    # ad-hoc runs never mix into the served history.
+    from backend.utils.archive import get_archive_dir
+
+    if os.path.abspath(output_file) == os.path.abspath(OUTPUT_FILE):
+        return str(get_archive_dir())
+    return os.path.join(os.path.dirname(os.path.abspath(output_file)), "archive")
+
+def save_data(data, output_file=OUTPUT_FILE, archive_dir=None, archive=True):
+    # Write to a temp file and rename so a running backend watching
+    # output_file never reads a half-written snapshot.
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
+    os.replace(tmp_file, output_file)
 
-def build_topic_model():
-    print("Loading cleaned + labeled data...")
-    items = load_data()
+    # Binary companion (google_topics.cfsnap) for fast backend startup; written
+    # after the JSON so it is the newer of the two and gets preferred.
+    from backend.utils.article_store import ArticleStore
+    from backend.utils.snapshot_format import binary_path_for, write_binary_snapshot
+
+    store = ArticleStore.from_articles(data)
+    binary_file = write_binary_snapshot(store, binary_path_for(output_file))
+    print(f"Binary snapshot saved → {binary_file}")
+
+    # Fold the new articles into the weekly rollups kept next to the snapshot.
+    from backend.utils.data_loader import resolve_snapshot_file, snapshot_version
+    from backend.utils.rollups import rollups_path_for, update_rollups
+
+    st = resolve_snapshot_file(output_file).stat()
+    update_rollups(output_file, store, snapshot_version((st.st_mtime_ns, st.st_size)))
+    print(f"Weekly rollups updated → {rollups_path_for(output_file)}")
+
+    # Keep every run's articles in the partitioned archive (see
+    # default_archive_dir for where).
+    if not archive:
+        return
+    from backend.utils.archive import archive_snapshot
+
+    if archive_dir is None:
+        archive_dir = default_archive_dir(output_file)
+    added = archive_snapshot(store, archive_dir)
+    print(f"Archived {added} new articles → {archive_dir}")
+
+def assign_topics(items):
+    if len(items) < N_TOPICS:
+        raise ValueError(f"Need at least {N_TOPICS} articles to cluster, got {len(items)}")
 
     texts = [item["clean_text"] for item in items]
 
@@ -28,14 +78,20 @@ def build_topic_model():
     vectorizer = TfidfVectorizer(stop_words="english", min_df=2)
     X = vectorizer.fit_transform(texts)
 
-    print("Clustering into 6 topics (KMeans)...")
-    kmeans = KMeans(n_clusters=6, random_state=42, n_init="auto")
+    print(f"Clustering into {N_TOPICS} topics (KMeans)...")
+    kmeans = KMeans(n_clusters=N_TOPICS, random_state=42, n_init="auto")
     clusters = kmeans.fit_predict(X)
 
     print("Adding topic_id to each item...")
     for item, cluster_id in zip(items, clusters):
         item["topic_id"] = int(cluster_id)
+    return items
+
+def build_topic_model():
+    print("Loading cleaned + labeled data...")
+    items = load_data()
 
+    assign_topics(items)
     save_data(items)
     print(f"Step 4 completed → Saved to {OUTPUT_FILE}")
 
@@ -0,0 +1,155 @@
+"""
+scraper/dedup.py
+
+Cross-run deduplication of scraped items.
+
+Every item saved to data/raw/ is remembered in a SQLite index
+(data/cache/dedup.sqlite3) by a 16-byte content hash over its canonical
+link, title, text and date. On the next run only items whose hash is not in
+the index are saved, so an unchanged Google News item or Eventbrite event
+is cleaned, labeled and clustered once, and an item whose text changed
+under the same link comes through again. Items repeated within one run
+(the same blog paragraph twice) are saved once.
+
+Links are canonicalized before hashing: scheme and host lower-cased, http
+made https, "www." and the fragment dropped, tracking parameters (utm_*,
+aff, oc, ...) removed and the rest sorted, so the same page reached through
+a different campaign link is still the same item.
+
+The hash is the table's primary key (WITHOUT ROWID), so a lookup is one
+B-tree probe however many items the history holds. New hashes are
+committed only once the items were saved.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Get the project root directory (parent of scraper/)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+INDEX_PATH = os.path.join(project_root, "data", "cache", "dedup.sqlite3")
+
+# Query parameters that only track how a link was reached.
+TRACKING_PARAMS = frozenset({
+    "aff", "fbclid", "gclid", "mc_cid", "mc_eid", "oc", "ref", "ref_src", "_ga", "_gl",
+})
+
+_WHITESPACE = re.compile(r"\s+")
+
+Item = Dict[str, Any]
+
+
+def canonical_link(link: Optional[str]) -> Optional[str]:
+    if not link:
+        return None
+    parts = urlsplit(link.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def _normalized(value: Any) -> Any:
+    return _WHITESPACE.sub(" ", value).strip() if isinstance(value, str) else value
+
+
+def content_hash(item: Item) -> bytes:
+    payload = json.dumps(
+        [canonical_link(item.get("link"))] + [_normalized(item.get(k)) for k in ("title", "text", "date")],
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+class DedupIndex:
+    """
+    SQLite set of content hashes of every item saved so far.
+
+    Thread-safe: sources finishing at the same time are serialized.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # isolation_level=None: transactions are opened explicitly in record_new
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " hash BLOB PRIMARY KEY,"
+            " link TEXT,"
+            " source TEXT NOT NULL,"
+            " first_seen TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS seen_link ON seen (link)")
+        self._lock = threading.Lock()
+        self.counts: Dict[str, Counter] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def record_new(self, source: str, items: Iterable[Item], save: Callable[[List[Item]], Any]) -> List[Item]:
+        """
+        The items of `items` not seen before, passed to `save` and then
+        recorded; nothing is recorded if `save` raises.
+
+        `save` is not called when there are no new items.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            counts = self.counts.setdefault(source, Counter())
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                new: List[Item] = []
+                changed = seen = 0
+                for item in items:
+                    digest = content_hash(item)
+                    if conn.execute("SELECT 1 FROM seen WHERE hash = ?", (digest,)).fetchone():
+                        seen += 1
+                        continue
+                    link = canonical_link(item.get("link"))
+                    if link is not None and conn.execute(
+                        "SELECT 1 FROM seen WHERE link = ? AND first_seen < ? LIMIT 1", (link, now),
+                    ).fetchone():
+                        changed += 1
+                    conn.execute("INSERT INTO seen VALUES (?, ?, ?, ?)", (digest, link, source, now))
+                    new.append(item)
+
+                if new:
+                    save(new)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            counts.update(new=len(new) - changed, changed=changed, seen=seen)
+        return new
+
+    def summary(self, source: str) -> str:
+        counts = self.counts.get(source, Counter())
+        return f"{counts['new']} new, {counts['changed']} changed, {counts['seen']} already seen"
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,322 @@
+"""
+scraper/fetcher.py
+
+Concurrent runner shared by the scrapers.
+
+Every source (blogs, meetup, eventbrite, google_rss) is a list of URLs plus
+a parse function. scrape_sources() fetches all of their URLs concurrently
+on one event loop:
+
+  - one aiohttp session, so connections are pooled and kept alive across
+    requests to the same host
+  - per host, at most `per_host` requests in flight and at least
+    `min_interval` seconds between request starts, so several URLs on one
+    site (the three Meetup searches) do not hit it all at once
+  - connect and total timeouts on every request
+  - 429 / 5xx responses and connection errors are retried with exponential
+    backoff and jitter (Retry-After is honored); other 4xx are not
+  - parsing (BeautifulSoup, ElementTree) runs in a process pool, off the
+    event loop, while other pages are still downloading
+  - with an HttpCache, requests are conditional and a 304 skips the page
+    (see http_cache)
+  - with a DedupIndex, only items not saved by an earlier run are saved
+    (see dedup)
+
+A URL that still fails after its retries is reported and skipped; the rest
+of its source is saved as usual. Items go to the append-only raw store (see
+raw_store) page by page, never buffered for the whole run.
+"""
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from dedup import DedupIndex
+from http_cache import HttpCache
+from raw_store import RawStore
+
+USER_AGENT = "Mozilla/5.0"
+
+# Statuses worth another try; anything else >= 400 fails at once.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_PER_HOST = 2
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_RETRIES = 3
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+MAX_CONNECTIONS = 20
+
+Item = Dict[str, Any]
+
+
+class Source(NamedTuple):
+    """
+    One scraper: its output name (data/raw/<name>_<date>.json), its URLs
+    and a parse(body, url) -> items function.
+
+    `parse` runs in a worker process, so it must be a module-level function.
+    """
+
+    name: str
+    urls: Sequence[str]
+    parse: Callable[[bytes, str], List[Item]]
+    headers: Optional[Dict[str, str]] = None
+
+
+class Page(NamedTuple):
+    """
+    A fetched URL; `body` is None when the server answered 304.
+    """
+
+    body: Optional[bytes]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class FetchError(Exception):
+    """
+    A URL could not be fetched (after retries, where they apply).
+    """
+
+
+class HostLimiter:
+    """
+    Per-host concurrency cap plus a minimum spacing between request starts.
+
+    Must only be used from one event loop.
+    """
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        async with semaphore:
+            # reserve the next start time before sleeping, so waiters queue up
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    # only the delta-seconds form; an HTTP date falls back to backoff
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class Fetcher:
+    """
+    GET with per-host limits, timeouts and retry with backoff.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        limiter: HostLimiter,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.session = session
+        self.limiter = limiter
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.requests = 0
+        self.retried = 0
+
+    def _delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        # full jitter: uniform in [0, backoff * 2^attempt]
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Page:
+        """
+        GET `url`; raises FetchError once retries are exhausted.
+        """
+        host = urlsplit(url).hostname or ""
+        for attempt in range(self.retries + 1):
+            retry_after: Optional[float] = None
+            try:
+                async with self.limiter.slot(host):
+                    self.requests += 1
+                    async with self.session.get(url, headers=headers) as response:
+                        if response.status < 400:
+                            body = None if response.status == 304 else await response.read()
+                            return Page(body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                        error = FetchError(f"{url}: HTTP {response.status}")
+                        if response.status not in RETRY_STATUSES:
+                            raise error
+                        retry_after = _retry_after(response.headers.get("Retry-After"))
+            except FetchError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = FetchError(f"{url}: {type(e).__name__} {e}".rstrip())
+
+            if attempt == self.retries:
+                raise error
+            self.retried += 1
+            await asyncio.sleep(self._delay(attempt, retry_after))
+        raise AssertionError("unreachable")
+
+
+def open_session(
+    timeout: float = DEFAULT_TIMEOUT,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    per_host: int = DEFAULT_PER_HOST,
+) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        limit_per_host=per_host,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=connect_timeout),
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+def default_workers() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+async def _scrape_source(
+    fetcher: Fetcher,
+    source: Source,
+    executor: Executor,
+    store: RawStore,
+    cache: Optional[HttpCache],
+    dedup: Optional[DedupIndex],
+) -> Optional[int]:
+    loop = asyncio.get_running_loop()
+    writer = store.writer(source.name)
+    unchanged = 0
+
+    def save(items: List[Item]) -> int:
+        if dedup is None:
+            writer.write(items)
+            return len(items)
+        return len(dedup.record_new(source.name, items, writer.write))
+
+    async def scrape_page(url: str) -> int:
+        nonlocal unchanged
+        print(f"Fetching: {url}")
+        headers = dict(source.headers or {})
+        if cache is not None:
+            headers.update(cache.conditional_headers(url))
+        try:
+            page = await fetcher.fetch(url, headers)
+        except FetchError as e:
+            print(f"Failed: {e}")
+            return 0
+        if page.body is None:
+            print(f"Unchanged: {url}")
+            unchanged += 1
+            return 0
+        try:
+            items = await loop.run_in_executor(executor, source.parse, page.body, url)
+        except Exception as e:
+            print(f"Failed to parse {url}: {type(e).__name__} {e}")
+            return 0
+        saved = await loop.run_in_executor(None, save, items)
+        # only now may the next run skip this page
+        if cache is not None:
+            cache.update(url, page.etag, page.last_modified)
+        return saved
+
+    try:
+        counts = await asyncio.gather(*(scrape_page(url) for url in source.urls))
+    finally:
+        writer.close()
+    if unchanged == len(source.urls):
+        print(f"{source.name}: unchanged since last run, nothing saved")
+        return None
+    if dedup is not None:
+        print(f"{source.name}: {dedup.summary(source.name)}")
+    return sum(counts)
+
+
+async def scrape_sources(
+    sources: Sequence[Source],
+    per_host: int = DEFAULT_PER_HOST,
+    min_interval: float = DEFAULT_MIN_INTERVAL,
+    retries: int = DEFAULT_RETRIES,
+    timeout: float = DEFAULT_TIMEOUT,
+    executor: Optional[Executor] = None,
+    cache: Optional[HttpCache] = None,
+    dedup: Optional[DedupIndex] = None,
+    store: Optional[RawStore] = None,
+) -> Dict[str, Optional[int]]:
+    """
+    Scrape every source concurrently, appending each page's items to the
+    raw store as soon as it is parsed; returns how many items each source
+    saved.
+
+    With `cache`, pages answering 304 contribute no items, and a source
+    whose pages all did maps to None. With `dedup`, only new or changed
+    items are saved. No part file is written for a source with nothing to
+    save.
+    """
+    if store is None:
+        store = RawStore()
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(
+            max_workers=default_workers(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    try:
+        async with open_session(timeout=timeout, per_host=per_host) as session:
+            fetcher = Fetcher(session, HostLimiter(per_host, min_interval), retries=retries)
+            results = await asyncio.gather(*(_scrape_source(fetcher, s, executor, store, cache, dedup) for s in sources))
+            print(f"{fetcher.requests} requests, {fetcher.retried} retried")
+    finally:
+        if own_executor:
+            executor.shutdown()
+        if cache is not None:
+            cache.save()
+    return {source.name: saved for source, saved in zip(sources, results)}
+
+
+def run_sources(
+    sources: Sequence[Source],
+    use_cache: bool = True,
+    use_dedup: bool = True,
+    **kwargs: Any,
+) -> Dict[str, Optional[int]]:
+    """
+    Blocking scrape_sources() for scripts, with the shared HttpCache and
+    DedupIndex unless `use_cache` / `use_dedup` is False.
+    """
+    if use_cache:
+        kwargs.setdefault("cache", HttpCache())
+    if not use_dedup:
+        return asyncio.run(scrape_sources(sources, **kwargs))
+    dedup = kwargs.setdefault("dedup", DedupIndex())
+    try:
+        return asyncio.run(scrape_sources(sources, **kwargs))
+    finally:
+        dedup.close()
@@ -0,0 +1,85 @@
+"""
+scraper/http_cache.py
+
+Conditional-fetch cache shared by the scrapers.
+
+For every URL that answered with an ETag or Last-Modified, the validators
+are kept in one JSON file (data/cache/http_cache.json) and sent back as
+If-None-Match / If-Modified-Since on the next run. A 304 means the page is
+unchanged since its items were last saved, so it is neither downloaded nor
+parsed; a source whose pages all answer 304 writes no raw file at all, which
+is what lets the downstream pipeline skip it.
+
+Validators are only recorded once the page's items have been saved, so a
+run that dies between download and save fetches the page again next time.
+Only validators are stored, never bodies.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Get the project root directory (parent of scraper/)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+CACHE_PATH = os.path.join(project_root, "data", "cache", "http_cache.json")
+
+
+class HttpCache:
+    """
+    url -> {"etag", "last_modified", "saved_at"}, persisted with save().
+    """
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Optional[str]]] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Record the validators of a page whose items were just saved.
+        """
+        if not etag and not last_modified:
+            # nothing to revalidate with; a stale entry would only cause misses
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+            return
+        self._entries[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
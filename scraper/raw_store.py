@@ -0,0 +1,329 @@
+"""
+scraper/raw_store.py
+
+Append-only NDJSON storage for scraped items.
+
+Layout under data/raw/:
+
+    <source>/<YYYY-MM-DD>/part-<HHMMSS>-<pid>.ndjson
+    manifest.json
+
+Each scraper run appends to its own part file, one JSON record per line,
+as each page is parsed (the file is flushed after every page), so memory
+does not grow with the number of pages and a crash loses at most the page
+being written. A part file is only created once there is something to
+write.
+
+manifest.json lists every part with its source, date, record count and
+size; it is rewritten (atomically) after each flush, so readers only see
+data that is on disk. `rebuild` recreates it from the files, e.g. after a
+crash between a flush and the manifest write.
+
+`compact` merges the parts of each past (source, date) partition into one
+file, skipping torn lines; today's partitions may still be appended to and
+are left alone unless --all is given.
+
+iter_records() reads everything lazily, line by line. The dated JSON files
+written before this layout (data/raw/<source>_<date>.json) are still read,
+as whole files.
+
+    python scraper/raw_store.py compact [--all]
+    python scraper/raw_store.py rebuild
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+# Get the project root directory (parent of scraper/)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+RAW_DIR = os.path.join(project_root, "data", "raw")
+MANIFEST_NAME = "manifest.json"
+
+_LEGACY_FILE = re.compile(r"^(?P<source>[a-z0-9_]+)_(?P<date>\d{4}-\d{2}-\d{2})\.json$")
+_DATE_DIR = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+Item = Dict[str, Any]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _write_atomic(path: str, data: Any) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def iter_file(path: str) -> Iterator[Item]:
+    """
+    Records of one NDJSON file, lazily; a .json file is read whole.
+
+    Blank lines and lines that are not valid JSON (a torn final line) are
+    skipped.
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+class PartWriter:
+    """
+    One run's part file for one source; opened on the first write.
+
+    Thread-safe.
+    """
+
+    def __init__(self, store: "RawStore", source: str, day: Optional[date] = None):
+        self.store = store
+        self.source = source
+        self.day = (day or date.today()).isoformat()
+        self.path: Optional[str] = None
+        self.records = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        directory = os.path.join(self.store.root, self.source, self.day)
+        os.makedirs(directory, exist_ok=True)
+        stamp = datetime.now().strftime("%H%M%S")
+        path = os.path.join(directory, f"part-{stamp}-{os.getpid()}.ndjson")
+        suffix = 1
+        while os.path.exists(path):
+            suffix += 1
+            path = os.path.join(directory, f"part-{stamp}-{os.getpid()}-{suffix}.ndjson")
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, items: List[Item]) -> None:
+        """
+        Append `items`, flush them to disk and record them in the manifest.
+        """
+        if not items:
+            return
+        with self._lock:
+            if self._file is None:
+                self._open()
+            for item in items:
+                self._file.write(json.dumps(item, ensure_ascii=False))
+                self._file.write("\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.records += len(items)
+            self.store._register(self.path, self.source, self.day, self.records)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                print(f"Saved {self.records} items → {self.path}")
+
+
+class RawStore:
+    """
+    The data/raw tree: part writers, the manifest, compaction and readers.
+    """
+
+    def __init__(self, root: str = RAW_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+
+    # ---------- manifest ----------
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST_NAME)
+
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Part path (relative to the root, "/"-separated) -> source, date,
+        records, bytes, updated_at.
+        """
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("parts", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, parts: Dict[str, Dict[str, Any]]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        _write_atomic(self.manifest_path, {"version": 1, "parts": parts})
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def _entry(self, path: str, source: str, day: str, records: int) -> Dict[str, Any]:
+        return {
+            "source": source,
+            "date": day,
+            "records": records,
+            "bytes": os.path.getsize(path),
+            "updated_at": _now(),
+        }
+
+    def _register(self, path: str, source: str, day: str, records: int) -> None:
+        with self._lock:
+            parts = self.manifest()
+            parts[self._relative(path)] = self._entry(path, source, day, records)
+            self._save_manifest(parts)
+
+    def _scan(self) -> Dict[str, Dict[str, Any]]:
+        parts: Dict[str, Dict[str, Any]] = {}
+        if not os.path.isdir(self.root):
+            return parts
+        for source in sorted(os.listdir(self.root)):
+            source_dir = os.path.join(self.root, source)
+            if not os.path.isdir(source_dir):
+                continue
+            for day in sorted(os.listdir(source_dir)):
+                day_dir = os.path.join(source_dir, day)
+                if not _DATE_DIR.match(day) or not os.path.isdir(day_dir):
+                    continue
+                for name in sorted(os.listdir(day_dir)):
+                    if not name.endswith(".ndjson"):
+                        continue
+                    path = os.path.join(day_dir, name)
+                    records = sum(1 for _ in iter_file(path))
+                    parts[self._relative(path)] = self._entry(path, source, day, records)
+        return parts
+
+    def rebuild(self) -> int:
+        """
+        Recreate the manifest from the part files; returns the part count.
+        """
+        with self._lock:
+            parts = self._scan()
+            self._save_manifest(parts)
+        return len(parts)
+
+    # ---------- writing ----------
+
+    def writer(self, source: str, day: Optional[date] = None) -> PartWriter:
+        return PartWriter(self, source, day)
+
+    def compact(self, before: Optional[date] = None) -> int:
+        """
+        Merge the parts of every partition dated before `before` (default:
+        today) into one file; returns how many parts were merged away.
+        """
+        cutoff = (before or date.today()).isoformat()
+        merged = 0
+        with self._lock:
+            parts = self._scan()
+            partitions: Dict[tuple, List[str]] = {}
+            for rel, entry in parts.items():
+                if entry["date"] < cutoff:
+                    partitions.setdefault((entry["source"], entry["date"]), []).append(rel)
+
+            for (source, day), rels in sorted(partitions.items()):
+                if len(rels) < 2:
+                    continue
+                directory = os.path.join(self.root, source, day)
+                target = os.path.join(directory, f"part-compacted-{datetime.now().strftime('%Y%m%d%H%M%S')}.ndjson")
+                tmp_path = f"{target}.{os.getpid()}.tmp"
+                records = 0
+                with open(tmp_path, "w", encoding="utf-8") as out:
+                    for rel in sorted(rels):
+                        for item in iter_file(os.path.join(self.root, rel)):
+                            out.write(json.dumps(item, ensure_ascii=False))
+                            out.write("\n")
+                            records += 1
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp_path, target)
+
+                # manifest first: a crash now leaves duplicates on disk, never gaps
+                for rel in rels:
+                    parts.pop(rel)
+                parts[self._relative(target)] = self._entry(target, source, day, records)
+                self._save_manifest(parts)
+                for rel in rels:
+                    os.remove(os.path.join(self.root, rel))
+                merged += len(rels)
+                print(f"Compacted {len(rels)} parts → {target} ({records} items)")
+
+            self._save_manifest(parts)
+        return merged
+
+    # ---------- reading ----------
+
+    def partitions(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Manifest entries (plus "path") for `source`, or all, oldest first;
+        legacy dated JSON files are included with records=None.
+        """
+        found = [
+            {**entry, "path": os.path.join(self.root, *rel.split("/"))}
+            for rel, entry in self.manifest().items()
+            if source is None or entry["source"] == source
+        ]
+        if os.path.isdir(self.root):
+            for name in os.listdir(self.root):
+                m = _LEGACY_FILE.match(name)
+                if m and (source is None or m.group("source") == source):
+                    found.append({
+                        "source": m.group("source"),
+                        "date": m.group("date"),
+                        "records": None,
+                        "path": os.path.join(self.root, name),
+                    })
+        found.sort(key=lambda e: (e["date"], e["source"], e["path"]))
+        return found
+
+    def iter_records(
+        self,
+        source: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> Iterator[Item]:
+        """
+        Every record of `source` (or all sources) from partitions dated in
+        [since, until) (ISO dates, both optional), oldest partition first.
+        """
+        for entry in self.partitions(source):
+            if since is not None and entry["date"] < since:
+                continue
+            if until is not None and entry["date"] >= until:
+                continue
+            yield from iter_file(entry["path"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the raw NDJSON store.")
+    parser.add_argument("--root", default=RAW_DIR, help="Raw data directory (default: %(default)s).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact = commands.add_parser("compact", help="Merge the part files of past partitions.")
+    compact.add_argument("--all", action="store_true", help="Include today's partitions.")
+    commands.add_parser("rebuild", help="Recreate manifest.json from the part files.")
+    args = parser.parse_args()
+
+    store = RawStore(args.root)
+    if args.command == "compact":
+        before = date.fromordinal(date.today().toordinal() + 1) if args.all else None
+        merged = store.compact(before)
+        print(f"Merged {merged} part files.")
+    else:
+        print(f"Manifest lists {store.rebuild()} part files.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,55 @@
-from scrape_eventbrite import scrape_eventbrite
+import argparse
 
-def run_all():
-    print("Running all scrapers...")
-    scrape_eventbrite()
+from fetcher import (
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_PER_HOST,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    run_sources,
+)
+from scrape_blogs import SOURCE as BLOGS
+from scrape_eventbrite import SOURCE as EVENTBRITE
+from scrape_google_rss import SOURCE as GOOGLE_RSS
+from scrape_meetup import SOURCE as MEETUP
+
+SOURCES = {source.name: source for source in (GOOGLE_RSS, EVENTBRITE, MEETUP, BLOGS)}
+
+def run_all(only=None, **kwargs):
+    """
+    Run every scraper (or just `only`) concurrently on one event loop.
+    """
+    sources = [SOURCES[name] for name in (only or SOURCES)]
+    print(f"Running scrapers: {', '.join(s.name for s in sources)}")
+    results = run_sources(sources, **kwargs)
     print("Done.")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Run all scrapers concurrently.")
+    parser.add_argument("--only", nargs="+", choices=sorted(SOURCES), help="Sources to run (default: all).")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help="Concurrent requests per host (default: %(default)s).")
+    parser.add_argument("--min-interval", type=float, default=DEFAULT_MIN_INTERVAL,
+                        help="Seconds between request starts to one host (default: %(default)s).")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="Retries for 429/5xx and connection errors (default: %(default)s).")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Total seconds per request (default: %(default)s).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Fetch every page in full, ignoring saved ETag / Last-Modified.")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="Save every scraped item, not only those unseen by earlier runs.")
+    args = parser.parse_args()
+
+    run_all(
+        only=args.only,
+        per_host=args.per_host,
+        min_interval=args.min_interval,
+        retries=args.retries,
+        timeout=args.timeout,
+        use_cache=not args.no_cache,
+        use_dedup=not args.no_dedup,
+    )
 
 if __name__ == "__main__":
-    run_all()
+    main()
@@ -1,8 +1,6 @@
-import requests
 from bs4 import BeautifulSoup
-import json
-import os
-from datetime import datetime
+
+from fetcher import Source, run_sources
 
 BLOG_SOURCES = [
     "https://chicagomindfulcollective.com/blog/",
@@ -14,40 +12,36 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0"
 }
 
-def scrape_blogs():
-    print("Scraping Chicago wellness blogs...")
+def parse_blog_page(body, url):
+    soup = BeautifulSoup(body, "html.parser")
     results = []
 
-    for url in BLOG_SOURCES:
-        print(f"Fetching: {url}")
-        response = requests.get(url, headers=HEADERS)
-        soup = BeautifulSoup(response.text, "html.parser")
+    # Catch all paragraphs (blogs are long)
+    paragraphs = soup.find_all("p")
+
+    for p in paragraphs:
+        text = p.get_text(strip=True)
+        if len(text) < 40:  # skip small junk
+            continue
 
-        # Catch all paragraphs (blogs are long)
-        paragraphs = soup.find_all("p")
+        results.append({
+            "title": None,
+            "text": text,
+            "date": None,
+            "link": url,
+            "source": "Blog",
+            "neighborhood": "Chicago"
+        })
 
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if len(text) < 40:  # skip small junk
-                continue
+    return results
 
-            results.append({
-                "title": None,
-                "text": text,
-                "date": None,
-                "link": url,
-                "source": "Blog",
-                "neighborhood": "Chicago"
-            })
 
-    os.makedirs("data/raw", exist_ok=True)
-    filename = f"data/raw/blogs_{datetime.now().strftime('%Y-%m-%d')}.json"
+SOURCE = Source("blogs", BLOG_SOURCES, parse_blog_page, HEADERS)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=4, ensure_ascii=False)
 
-    print(f"Saved {len(results)} items → {filename}")
-    return results
+def scrape_blogs():
+    print("Scraping Chicago wellness blogs...")
+    return run_sources([SOURCE])[SOURCE.name]
 
 
 if __name__ == "__main__":
@@ -1,16 +1,11 @@
-import requests
 from bs4 import BeautifulSoup
-import json
-import os
-from datetime import datetime
 
-BASE_URL = "https://www.eventbrite.com/d/il--chicago/wellness/"
+from fetcher import Source, run_sources
 
-def scrape_eventbrite():
-    print("Scraping Eventbrite...")
+BASE_URL = "https://www.eventbrite.com/d/il--chicago/wellness/"
 
-    response = requests.get(BASE_URL, headers={"User-Agent": "Mozilla/5.0"})
-    soup = BeautifulSoup(response.text, "html.parser")
+def parse_eventbrite_page(body, url):
+    soup = BeautifulSoup(body, "html.parser")
 
     events = soup.select("div.search-event-card-wrapper")
 
@@ -46,15 +41,15 @@ def scrape_eventbrite():
             "neighborhood": "Chicago"  # we refine later
         })
 
-    # Save file
-    os.makedirs("data/raw", exist_ok=True)
-    filename = f"data/raw/eventbrite_{datetime.now().strftime('%Y-%m-%d')}.json"
+    return results
+
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=4, ensure_ascii=False)
+SOURCE = Source("eventbrite", [BASE_URL], parse_eventbrite_page, {"User-Agent": "Mozilla/5.0"})
 
-    print(f"Saved {len(results)} events → {filename}")
-    return results
+
+def scrape_eventbrite():
+    print("Scraping Eventbrite...")
+    return run_sources([SOURCE])[SOURCE.name]
 
 
 if __name__ == "__main__":
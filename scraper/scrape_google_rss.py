@@ -1,16 +1,11 @@
-import requests
 import xml.etree.ElementTree as ET
-import json
-import os
-from datetime import datetime
 
-RSS_URL = "https://news.google.com/rss/search?q=chicago+wellness+mindfulness+healing&hl=en-US&gl=US&ceid=US:en"
+from fetcher import Source, run_sources
 
-def scrape_google_rss():
-    print("Scraping Google News RSS...")
+RSS_URL = "https://news.google.com/rss/search?q=chicago+wellness+mindfulness+healing&hl=en-US&gl=US&ceid=US:en"
 
-    response = requests.get(RSS_URL)
-    root = ET.fromstring(response.text)
+def parse_google_rss(body, url):
+    root = ET.fromstring(body)
 
     items = root.findall(".//item")
     results = []
@@ -30,13 +25,15 @@ def scrape_google_rss():
             "neighborhood": "Chicago"
         })
 
-    os.makedirs("data/raw", exist_ok=True)
-    filename = f"data/raw/google_rss_{datetime.now().strftime('%Y-%m-%d')}.json"
+    return results
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=4, ensure_ascii=False)
 
-    print(f"Saved {len(results)} items → {filename}")
+SOURCE = Source("google_rss", [RSS_URL], parse_google_rss)
+
+
+def scrape_google_rss():
+    print("Scraping Google News RSS...")
+    return run_sources([SOURCE])[SOURCE.name]
 
 
 if __name__ == "__main__":
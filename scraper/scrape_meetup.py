@@ -1,8 +1,6 @@
-import requests
 from bs4 import BeautifulSoup
-import json
-import os
-from datetime import datetime
+
+from fetcher import Source, run_sources
 
 BASE_URLS = [
     "https://www.meetup.com/find/?location=us--il--Chicago&keywords=yoga",
@@ -14,41 +12,36 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0",
 }
 
-def scrape_meetup():
-    print("Scraping Meetup...")
+def parse_meetup_page(body, url):
+    soup = BeautifulSoup(body, "html.parser")
     results = []
 
-    for url in BASE_URLS:
-        print(f"Fetching: {url}")
-        response = requests.get(url, headers=HEADERS)
-        soup = BeautifulSoup(response.text, "html.parser")
+    cards = soup.select("li.searchResultCard-1")
+
+    for card in cards:
+        title = card.select_one("h3").get_text(strip=True) if card.select_one("h3") else None
+        desc = card.select_one("p").get_text(strip=True) if card.select_one("p") else None
+        link_tag = card.select_one("a")
+        link = link_tag["href"] if link_tag else None
 
-        cards = soup.select("li.searchResultCard-1")
+        results.append({
+            "title": title,
+            "text": desc,
+            "date": None,
+            "link": link,
+            "source": "Meetup",
+            "neighborhood": "Chicago",
+        })
 
-        for card in cards:
-            title = card.select_one("h3").get_text(strip=True) if card.select_one("h3") else None
-            desc = card.select_one("p").get_text(strip=True) if card.select_one("p") else None
-            link_tag = card.select_one("a")
-            link = link_tag["href"] if link_tag else None
+    return results
 
-            results.append({
-                "title": title,
-                "text": desc,
-                "date": None,
-                "link": link,
-                "source": "Meetup",
-                "neighborhood": "Chicago",
-            })
 
-    # Save results
-    os.makedirs("data/raw", exist_ok=True)
-    filename = f"data/raw/meetup_{datetime.now().strftime('%Y-%m-%d')}.json"
+SOURCE = Source("meetup", BASE_URLS, parse_meetup_page, HEADERS)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=4, ensure_ascii=False)
 
-    print(f"Saved {len(results)} items → {filename}")
-    return results
+def scrape_meetup():
+    print("Scraping Meetup...")
+    return run_sources([SOURCE])[SOURCE.name]
 
 
 if __name__ == "__main__":
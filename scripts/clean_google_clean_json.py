@@ -12,9 +12,12 @@ def clean_entities(text):
     text = text.replace("\u00a0", " ")
     return text.strip()
 
+PUNCTUATION = re.compile(r"[^\w\s]")
+
+# Also the backend's search tokenizer (backend/utils/search_index.py).
 def tokenize(text):
     text = text.lower()
-    text = re.sub(r"[^\w\s]", "", text)  # remove punctuation
+    text = PUNCTUATION.sub("", text)  # remove punctuation
     words = text.split()
     return words
 
@@ -31,32 +34,38 @@ def extract_keywords(text, top_n=5):
     keywords = [word for word, _ in freq.most_common(top_n)]
     return keywords
 
-# ----------------------------
-# Load Data
-# ----------------------------
-input_file = "data/clean/google_clean.json"
-output_file = "data/clean/google_step2.json"
-
-with open(input_file, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
-# ----------------------------
-# Process Each Article
-# ----------------------------
-for item in data:
-    text = item["text"]
-
+def add_keywords(item):
     # Clean HTML entities
-    cleaned_text = clean_entities(text)
+    cleaned_text = clean_entities(item.get("text") or "")
 
     # Add new fields
     item["clean_text"] = cleaned_text
     item["keywords"] = extract_keywords(cleaned_text)
+    return item
 
-# ----------------------------
-# Save Output
-# ----------------------------
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=4, ensure_ascii=False)
+def main():
+    # ----------------------------
+    # Load Data
+    # ----------------------------
+    input_file = "data/clean/google_clean.json"
+    output_file = "data/clean/google_step2.json"
+
+    with open(input_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # ----------------------------
+    # Process Each Article
+    # ----------------------------
+    for item in data:
+        add_keywords(item)
+
+    # ----------------------------
+    # Save Output
+    # ----------------------------
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+
+    print("Step 2 complete → Saved:", output_file)
 
-print("Step 2 complete → Saved:", output_file)
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import os
 
 def clean_html(raw_text):
     # Remove HTML tags
-    no_tags = re.sub(r"<.*?>", "", raw_text)
+    no_tags = re.sub(r"<.*?>", "", raw_text or "")
 
     # Convert HTML entities like &nbsp; to normal characters
     cleaned = html.unescape(no_tags)
@@ -13,21 +13,26 @@ def clean_html(raw_text):
     # Remove extra whitespace
     return cleaned.strip()
 
-# Load file
-input_file = "data/raw/google_rss_2025-12-04.json"
-output_file = "data/clean/google_clean.json"
+def clean_item(item):
+    item["text"] = clean_html(item.get("text"))
+    return item
 
-with open(input_file, "r", encoding="utf-8") as f:
-    data = json.load(f)
+def main():
+    # Load file
+    input_file = "data/raw/google_rss_2025-12-04.json"
+    output_file = "data/clean/google_clean.json"
 
-cleaned = []
-for item in data:
-    item["text"] = clean_html(item["text"])
-    cleaned.append(item)
+    with open(input_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
 
-os.makedirs("data/clean", exist_ok=True)
+    cleaned = [clean_item(item) for item in data]
 
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(cleaned, f, indent=4, ensure_ascii=False)
+    os.makedirs("data/clean", exist_ok=True)
 
-print(f"Saved cleaned dataset → {output_file}")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(cleaned, f, indent=4, ensure_ascii=False)
+
+    print(f"Saved cleaned dataset → {output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+from collections import Counter
+
+# Get the script directory and project root
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+# The community-area matcher lives in backend/utils.
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from backend.utils.community_areas import infer_neighborhood, needs_inference
+
+def infer_item(item):
+    """
+    Set item["neighborhood"] to the community area it mentions most, unless
+    it already names something more specific than the scrapers' "Chicago"
+    default; returns the inferred area or None.
+    """
+    if not needs_inference(item.get("neighborhood")):
+        return None
+    area = infer_neighborhood(item.get("title"), item.get("clean_text") or item.get("text"))
+    if area is not None:
+        item["neighborhood"] = area
+    return area
+
+def main():
+    # Runs between labeling and topic modeling, updating the labeled file in place.
+    data_path = os.path.join(project_root, "data", "labeled", "google_labeled.json")
+    with open(data_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    found = Counter()
+    for item in data:
+        area = infer_item(item)
+        if area is not None:
+            found[area] += 1
+
+    tmp_path = data_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, data_path)
+
+    print(f"Neighborhoods inferred for {sum(found.values())} of {len(data)} articles.")
+    for area, count in found.most_common(10):
+        print(f"  {area}: {count}")
+    print("STEP 3b DONE → google_labeled.json updated.")
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,6 @@ import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
 
-# Load step2 cleaned + keyword data
-input_path = os.path.join(project_root, "data", "clean", "google_step2.json")
-with open(input_path, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
 def assign_themes(item):
     text = item["clean_text"].lower()
 
@@ -45,13 +40,26 @@ def assign_themes(item):
 
     return themes
 
-# Apply theme assignment
-for item in data:
+def label_item(item):
     item["themes"] = assign_themes(item)
+    return item
+
+def main():
+    # Load step2 cleaned + keyword data
+    input_path = os.path.join(project_root, "data", "clean", "google_step2.json")
+    with open(input_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # Apply theme assignment
+    for item in data:
+        label_item(item)
+
+    # Save step3 output
+    output_path = os.path.join(project_root, "data", "labeled", "google_labeled.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
 
-# Save step3 output
-output_path = os.path.join(project_root, "data", "labeled", "google_labeled.json")
-with open(output_path, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=4, ensure_ascii=False)
+    print("STEP 3 DONE → google_labeled.json created.")
 
-print("STEP 3 DONE → google_labeled.json created.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The backend is imported as the `backend` package, as uvicorn does from the
+# project root; the scraper modules import each other as top-level modules,
+# as they do when run as scripts from scraper/.
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "scraper")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,170 @@
+"""
+scraper/fetcher.py against a local stand-in HTTP server.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from fetcher import Fetcher, FetchError, HostLimiter, Source, scrape_sources
+from http_cache import HttpCache
+from raw_store import RawStore
+
+
+def parse_lines(body, url):
+    return [{"title": line, "link": url} for line in body.decode("utf-8").splitlines() if line]
+
+
+async def _serve(routes):
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_get(path, handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def _fetch_all(urls, **fetcher_kwargs):
+    limiter = HostLimiter(fetcher_kwargs.pop("per_host", 2), fetcher_kwargs.pop("min_interval", 0.0))
+    async with aiohttp.ClientSession() as session:
+        fetcher = Fetcher(session, limiter, **fetcher_kwargs)
+        results = await asyncio.gather(*(fetcher.fetch(url) for url in urls), return_exceptions=True)
+    return fetcher, results
+
+
+def test_per_host_cap_and_spacing():
+    state = {"inflight": 0, "max": 0, "starts": []}
+
+    async def slow(request):
+        state["inflight"] += 1
+        state["max"] = max(state["max"], state["inflight"])
+        state["starts"].append(time.monotonic())
+        await asyncio.sleep(0.05)
+        state["inflight"] -= 1
+        return web.Response(text="ok")
+
+    async def run():
+        server = await _serve({"/page": slow})
+        try:
+            urls = [str(server.make_url(f"/page?{i}")) for i in range(6)]
+            return await _fetch_all(urls, per_host=2, min_interval=0.02)
+        finally:
+            await server.close()
+
+    fetcher, results = asyncio.run(run())
+    assert all(page.body == b"ok" for page in results)
+    assert state["max"] == 2
+    gaps = [b - a for a, b in zip(state["starts"], state["starts"][1:])]
+    assert min(gaps) >= 0.015
+    assert fetcher.requests == 6
+
+
+def test_retries_honor_retry_after_then_succeed():
+    calls = {"n": 0}
+
+    async def flaky(request):
+        calls["n"] += 1
+        if calls["n"] < 3:
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        return web.Response(text="recovered")
+
+    async def run():
+        server = await _serve({"/flaky": flaky})
+        try:
+            return await _fetch_all([str(server.make_url("/flaky"))], retries=3)
+        finally:
+            await server.close()
+
+    fetcher, (page,) = asyncio.run(run())
+    assert page.body == b"recovered"
+    assert calls["n"] == 3
+    assert fetcher.retried == 2
+
+
+def test_retries_exhausted_with_backoff():
+    calls = {"n": 0}
+
+    async def busy(request):
+        calls["n"] += 1
+        return web.Response(status=429)
+
+    async def run():
+        server = await _serve({"/busy": busy})
+        try:
+            return await _fetch_all([str(server.make_url("/busy"))], retries=2, backoff=0.01)
+        finally:
+            await server.close()
+
+    fetcher, (error,) = asyncio.run(run())
+    assert isinstance(error, FetchError)
+    assert "HTTP 429" in str(error)
+    assert calls["n"] == 3
+
+
+def test_delay_uses_retry_after_capped_else_jittered_backoff():
+    fetcher = Fetcher(session=None, limiter=HostLimiter(), backoff=0.5, max_backoff=4.0)
+    assert fetcher._delay(0, 2.0) == 2.0
+    assert fetcher._delay(0, 60.0) == 4.0
+    for attempt in range(6):
+        assert 0 <= fetcher._delay(attempt, None) <= min(4.0, 0.5 * 2 ** attempt)
+
+
+def test_client_errors_are_not_retried():
+    calls = {"n": 0}
+
+    async def missing(request):
+        calls["n"] += 1
+        return web.Response(status=404)
+
+    async def run():
+        server = await _serve({"/missing": missing})
+        try:
+            return await _fetch_all([str(server.make_url("/missing"))], retries=3)
+        finally:
+            await server.close()
+
+    fetcher, (error,) = asyncio.run(run())
+    assert isinstance(error, FetchError)
+    assert "HTTP 404" in str(error)
+    assert calls["n"] == 1
+    assert fetcher.retried == 0
+
+
+def test_not_modified_pages_skip_parsing(tmp_path):
+    seen = []
+    parsed = []
+
+    async def feed(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(text="a\nb\n", headers={"ETag": '"v1"'})
+
+    def parse(body, url):
+        parsed.append(url)
+        return parse_lines(body, url)
+
+    async def run():
+        server = await _serve({"/feed": feed})
+        store = RawStore(str(tmp_path / "raw"))
+        source = Source("feed", [str(server.make_url("/feed"))], parse)
+        try:
+            with ThreadPoolExecutor(1) as executor:
+                runs = []
+                for _ in range(2):
+                    cache = HttpCache(str(tmp_path / "http_cache.json"))
+                    runs.append(await scrape_sources([source], min_interval=0, executor=executor, cache=cache, store=store))
+            return runs, store
+        finally:
+            await server.close()
+
+    (first, second), store = asyncio.run(run())
+    assert first == {"feed": 2}
+    assert second == {"feed": None}
+    assert seen == [None, '"v1"']
+    assert len(parsed) == 1
+    assert [r["title"] for r in store.iter_records("feed")] == ["a", "b"]
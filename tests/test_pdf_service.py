@@ -0,0 +1,19 @@
+"""
+backend/utils/pdf_service.py report rendering.
+"""
+
+from backend.utils.pdf_service import generate_weekly_report_pdf
+
+
+def test_filter_values_are_escaped_in_markup():
+    report_data = {
+        "total_articles": 1,
+        "theme_distribution": [{"id": 1, "count": 1}],
+        "top_clusters": [{"topic_id": 0, "count": 1}],
+        "latest_items": [{"title": "Yoga", "date": "2025-06-01", "source": "Blog"}],
+        "filters": {"neighborhood": "<b>Pilsen & a<x", "theme": 1, "since": "2025-01-01", "until": None},
+    }
+
+    pdf = generate_weekly_report_pdf(report_data)
+
+    assert pdf.startswith(b"%PDF-")